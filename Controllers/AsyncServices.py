@@ -0,0 +1,115 @@
+# Controllers/AsyncServices.py
+"""
+Async Services - asyncio front end for the synchronous controllers
+
+Controller calls are offloaded to a pool of worker threads. Each worker owns
+a ServiceRegistry, and so its own database connection and identity map, so
+up to `workers` queries run in parallel while any number of coroutines await
+them on one event loop:
+
+    async with AsyncServices() as services:
+        success, message, booking_id = await services.booking.create_booking(...)
+        driver = await services.driver.get_driver_by_id(3)
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from Controllers.ServiceRegistry import ServiceRegistry, _CONTROLLERS
+from config import ASYNC_WORKERS
+
+
+class AsyncController:
+    """Awaitable view of one controller; every method call runs on a worker thread"""
+
+    def __init__(self, services, name):
+        self._services = services
+        self._name = name
+
+    def __getattr__(self, method):
+        async def call(*args, **kwargs):
+            return await self._services.call(self._name, method, *args, **kwargs)
+        call.__name__ = method
+        return call
+
+    def __repr__(self):
+        return f"AsyncController({self._name})"
+
+
+class AsyncServices:
+    """
+    Thread-offloaded controllers for asyncio code
+
+    Each call is its own unit of work: the worker's identity map is cleared
+    before the controller method runs.
+    """
+
+    def __init__(self, workers=ASYNC_WORKERS):
+        """
+        Initialize AsyncServices
+
+        Args:
+            workers (int): Worker threads, i.e. database connections and
+                           the maximum number of queries in flight
+        """
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='db-worker')
+        self._local = threading.local()
+        self._registries = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        """services.booking, services.driver, ... (see ServiceRegistry)"""
+        if name not in _CONTROLLERS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        controller = AsyncController(self, name)
+        setattr(self, name, controller)
+        return controller
+
+    async def call(self, controller, method, *args, **kwargs):
+        """
+        Run controller.method(*args, **kwargs) on a worker thread
+
+        Args:
+            controller (str): Controller name (booking, driver, payment, ...)
+            method (str): Method name
+
+        Returns:
+            Whatever the controller method returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._run, controller, method, args, kwargs)
+        )
+
+    def _run(self, controller, method, args, kwargs):
+        """Worker-thread side of call()"""
+        registry = self._registry()
+        registry.begin_unit_of_work()
+        return getattr(registry.get(controller), method)(*args, **kwargs)
+
+    def _registry(self):
+        """Get the calling worker thread's registry, creating it on first use"""
+        registry = getattr(self._local, 'registry', None)
+        if registry is None:
+            registry = ServiceRegistry()
+            self._local.registry = registry
+            with self._lock:
+                self._registries.append(registry)
+        return registry
+
+    async def close(self):
+        """Wait for running calls, then close every worker's connection"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+        with self._lock:
+            registries, self._registries = self._registries, []
+        for registry in registries:
+            registry.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,52 @@
+# Controllers/BaseController.py
+"""
+Base Controller - Connection and model hydration shared by the controllers
+
+Each controller names its model class in MODEL and the model's primary key
+column in KEY; rows are hydrated through the identity map when the
+controller was given one (see ServiceRegistry).
+"""
+from Db.base_db import BaseDB
+
+
+class BaseController:
+    """
+    Base class for the table controllers
+    """
+
+    # Model class the controller's rows hydrate into, and its primary key column
+    MODEL = None
+    KEY = None
+
+    def __init__(self, db=None, identity_map=None):
+        """Initialize the controller with its own database connection, or a shared one"""
+        self.db = db if db is not None else BaseDB()
+        self.identity_map = identity_map
+
+    def _to_model(self, row):
+        """Hydrate a row, reusing the instance already in the identity map (if any)"""
+        if self.identity_map is None or not row:
+            return self.MODEL.from_db_row(row)
+        return self.identity_map.load(self.MODEL, row[self.KEY], lambda: self.MODEL.from_db_row(row))
+
+    def _fetch_models(self, query, params=None):
+        """Bulk-hydrate a list query through the tuple-row fast path"""
+        columns, rows = self.db.fetch_all_tuples(query, params)
+        return self._hydrate(columns, rows)
+
+    def _hydrate(self, columns, rows):
+        """Turn (column_names, tuple rows) into models"""
+        if not rows:
+            return []
+        model = self.MODEL
+        getter = model.column_getter(columns)
+        if self.identity_map is None:
+            return [model.from_tuple(row, getter) for row in rows]
+        key = columns.index(self.KEY)
+        load = self.identity_map.load
+        return [load(model, row[key], lambda row=row: model.from_tuple(row, getter)) for row in rows]
+
+    def _forget(self, model_class, *keys):
+        """Drop changed rows from the identity map"""
+        if self.identity_map is not None:
+            self.identity_map.discard(model_class, *keys)
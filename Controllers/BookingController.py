@@ -1,15 +1,40 @@
-from Db.base_db import BaseDB
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.BookingModel import BookingModel
+from Models.DriverModel import DriverModel
+from Controllers.EntityCache import driver_cache
+from Controllers.EventBus import event_bus, BookingCreated, BookingAssigned, BookingStatusChanged
+from Db.rollup import get_rolled_through, live_since
 from config import (SUCCESS_REGISTRATION,SUCCESS_UPDATE,SUCCESS_DELETE,BOOKING_STATUS_PENDING
                     ,BOOKING_STATUS_CONFIRMED,BOOKING_STATUS_IN_PROGRESS
                     ,BOOKING_STATUS_COMPLETED,BOOKING_STATUS_CANCELLED,calculate_fare,DRIVER_AVAILABLE,DRIVER_BUSY,)
-from datetime import datetime
+from datetime import datetime, timedelta
 
-class BookingController:
+# Trend report bucket -> MySQL DATE_FORMAT pattern (each sorts chronologically as text)
+TIMESERIES_FORMATS = {
+    'Hour': '%Y-%m-%d %H:00',
+    'Day': '%Y-%m-%d',
+    'Week': '%x-W%v',
+    'Month': '%Y-%m',
+}
+
+@profile_methods
+class BookingController(BaseController):
    
-    def __init__(self):
-        """Initialize BookingController with database connection"""
-        self.db = BaseDB()
+    MODEL = BookingModel
+    KEY = 'Booking_ID'
+    
+    def _list_query(self, where, params, include_history):
+        """
+        Build a booking list query over the hot Bookings table, optionally
+        followed by the same filter on Bookings_Archive
+        """
+        columns = ', '.join(BookingModel.COLUMNS)
+        query = f"SELECT {columns} FROM Bookings {where}"
+        if include_history:
+            query += f" UNION ALL SELECT {columns} FROM Bookings_Archive {where}"
+            params = params + params
+        return query + " ORDER BY Booking_Date DESC", params
     
     def create_booking(self, passenger_id, pickup_location, destination, 
                       distance_km=None, driver_id=None):
@@ -31,6 +56,7 @@ class BookingController:
             
             if rows > 0:
                 booking_id = self.db.get_last_insert_id()
+                event_bus.publish(BookingCreated(booking_id, passenger_id, driver_id))
                 return True, SUCCESS_REGISTRATION, booking_id
             else:
                 return False, "Failed to create booking", None
@@ -41,69 +67,292 @@ class BookingController:
     
     def get_booking_by_id(self, booking_id):
         try:
+            if self.identity_map is not None:
+                booking = self.identity_map.get(BookingModel, booking_id)
+                if booking is not None:
+                    return booking
             query = "SELECT * FROM Bookings WHERE Booking_ID = %s"
             row = self.db.fetch_one(query, (booking_id,))
-            return BookingModel.from_db_row(row)
+            if row is None:
+                # Finished bookings may have been moved out of the hot table
+                query = f"SELECT {', '.join(BookingModel.COLUMNS)} FROM Bookings_Archive WHERE Booking_ID = %s"
+                row = self.db.fetch_one(query, (booking_id,))
+            return self._to_model(row)
         except Exception as e:
             print(f"Get booking error: {e}")
             return None
     
-    def get_all_bookings(self):
+    def get_all_bookings(self, include_history=False):
         """
-        Get all bookings
+        Get all bookings (archived ones only if include_history)
         """
         try:
-            query = "SELECT * FROM Bookings ORDER BY Booking_Date DESC"
-            rows = self.db.fetch_all(query)
-            return [BookingModel.from_db_row(row) for row in rows]
+            query, params = self._list_query("", (), include_history)
+            return self._fetch_models(query, params)
         except Exception as e:
             print(f"Get all bookings error: {e}")
             return []
     
-    def get_bookings_by_passenger(self, passenger_id):
+    def get_bookings_changed_since(self, watermark):
         """
-        Get all bookings for a passenger
+        Get bookings created or updated since a watermark (delta sync)
+        
+        Call with None to get a starting watermark, then pass back the
+        watermark each call returns.
+        
+        Returns:
+            tuple: (list of BookingModel, new watermark)
         """
         try:
-            query = """
-                SELECT * FROM Bookings 
-                WHERE Passenger_ID = %s 
-                ORDER BY Booking_Date DESC
+            columns, rows, watermark = self.db.fetch_changed_since('Bookings', watermark)
+            if rows:
+                # Changed elsewhere, so mapped instances are stale
+                key = columns.index('Booking_ID')
+                self._forget(BookingModel, *(row[key] for row in rows))
+            return self._hydrate(columns, rows), watermark
+        except Exception as e:
+            print(f"Get changed bookings error: {e}")
+            return [], watermark
+    
+    def iter_bookings(self, batch_size=1000):
+        """
+        Stream all bookings (newest first) without loading the whole table
+        """
+        try:
+            query = "SELECT * FROM Bookings ORDER BY Booking_Date DESC"
+            getter = None
+            for columns, rows in self.db.iter_query(query, batch_size=batch_size):
+                if getter is None:
+                    getter = BookingModel.column_getter(columns)
+                for row in rows:
+                    yield BookingModel.from_tuple(row, getter)
+        except Exception as e:
+            print(f"Iterate bookings error: {e}")
+    
+    def iter_bookings_with_names(self, batch_size=1000):
+        """
+        Stream all bookings (newest first) with their passenger and driver names
+        
+        The names are joined in the streamed query rather than looked up
+        per row, so nothing accumulates in the identity map.
+        
+        Yields:
+            tuple: (BookingModel, passenger name or None, driver name or None)
+        """
+        try:
+            columns = ', '.join(f"b.{column}" for column in BookingModel.COLUMNS)
+            query = f"""
+                SELECT {columns}, p.Name as Passenger_Name, d.Name as Driver_Name
+                FROM Bookings b
+                LEFT JOIN Passengers p ON p.Passenger_ID = b.Passenger_ID
+                LEFT JOIN Drivers d ON d.Driver_ID = b.Driver_ID
+                ORDER BY b.Booking_Date DESC
             """
-            rows = self.db.fetch_all(query, (passenger_id,))
-            return [BookingModel.from_db_row(row) for row in rows]
+            getter = None
+            for column_names, rows in self.db.iter_query(query, batch_size=batch_size):
+                if getter is None:
+                    getter = BookingModel.column_getter(column_names)
+                    passenger_name = column_names.index('Passenger_Name')
+                    driver_name = column_names.index('Driver_Name')
+                for row in rows:
+                    yield BookingModel.from_tuple(row, getter), row[passenger_name], row[driver_name]
+        except Exception as e:
+            print(f"Iterate bookings with names error: {e}")
+    
+    def get_booking_frame(self, start=None, end=None, include_history=True):
+        """
+        Load bookings as a columnar BookingFrame for bulk analytics
+        
+        Only the columns the frame needs are read, streamed in batches.
+        Archived bookings are included unless include_history is False, so
+        the frame covers the same bookings as get_total_revenue and the
+        payment totals. Returns None if numpy is not installed or the
+        query fails.
+        """
+        try:
+            from Models.BookingFrame import BookingFrame, HAS_NUMPY
+            if not HAS_NUMPY:
+                return None
+            
+            conditions = []
+            params = []
+            if start is not None:
+                conditions.append("Booking_Date >= %s")
+                params.append(start)
+            if end is not None:
+                conditions.append("Booking_Date < %s")
+                params.append(end)
+            where = "WHERE " + " AND ".join(conditions) if conditions else ""
+            columns = ', '.join(BookingFrame.COLUMNS)
+            query = f"SELECT {columns} FROM Bookings {where}"
+            if include_history:
+                query += f" UNION ALL SELECT {columns} FROM Bookings_Archive {where}"
+                params = params + params
+            return BookingFrame.from_batches(self.db.iter_query(query, tuple(params)))
+        except Exception as e:
+            print(f"Get booking frame error: {e}")
+            return None
+    
+    def get_booking_timeseries(self, bucket, start=None, end=None):
+        """
+        Get trip volume and revenue per time bucket
+        
+        Aggregated by the database with GROUP BY, so the cost is one row per
+        bucket regardless of how many bookings the range covers. Day, week
+        and month buckets read the daily fact tables up to the rollup
+        watermark and only the days after it from Bookings. Their buckets
+        hold whole days, so start and end are widened to midnight for them,
+        keeping the first and last bucket the same whichever source they
+        come from.
+        
+        Args:
+            bucket (str): 'Hour', 'Day', 'Week' or 'Month'
+            start (datetime): Only bookings on or after this time (optional)
+            end (datetime): Only bookings before this time (optional)
+            
+        Returns:
+            list: Dicts with bucket, trips, completed, cancelled, revenue,
+                  avg_fare and cancellation_rate, oldest bucket first
+        """
+        try:
+            if bucket not in TIMESERIES_FORMATS:
+                raise ValueError(f"Invalid bucket. Must be one of: {', '.join(TIMESERIES_FORMATS)}")
+            
+            date_format = TIMESERIES_FORMATS[bucket]
+            rolled_through = None
+            if bucket != 'Hour':
+                if start is not None:
+                    start = datetime.combine(start.date(), datetime.min.time())
+                if end is not None and end != datetime.combine(end.date(), datetime.min.time()):
+                    end = datetime.combine(end.date() + timedelta(days=1), datetime.min.time())
+                rolled_through = get_rolled_through(self.db)
+            
+            if rolled_through:
+                tail_start = live_since(rolled_through)
+                if start is not None and start > tail_start:
+                    tail_start = start
+                rollup_query, rollup_params = self._timeseries_from_facts(date_format, start, end, rolled_through)
+                live_query, live_params = self._timeseries_from_bookings(date_format, tail_start, end)
+                query = f"""
+                    SELECT Bucket, SUM(trips) as trips, SUM(completed) as completed,
+                           SUM(cancelled) as cancelled, SUM(revenue) as revenue
+                    FROM ({rollup_query} UNION ALL {live_query}) as combined
+                    GROUP BY Bucket
+                    ORDER BY Bucket
+                """
+                params = rollup_params + live_params
+            else:
+                query, params = self._timeseries_from_bookings(date_format, start, end)
+                query += " ORDER BY Bucket"
+            rows = self.db.fetch_all(query, tuple(params))
+            
+            series = []
+            for row in rows:
+                trips = int(row['trips'])
+                completed = int(row['completed'] or 0)
+                cancelled = int(row['cancelled'] or 0)
+                revenue = float(row['revenue']) if row['revenue'] else 0.0
+                series.append({
+                    'bucket': row['Bucket'],
+                    'trips': trips,
+                    'completed': completed,
+                    'cancelled': cancelled,
+                    'revenue': revenue,
+                    'avg_fare': revenue / completed if completed else 0.0,
+                    'cancellation_rate': cancelled / trips if trips else 0.0
+                })
+            return series
+        except Exception as e:
+            print(f"Get booking timeseries error: {e}")
+            return []
+    
+    def _timeseries_from_bookings(self, date_format, start, end):
+        """Build the per-bucket aggregate over Bookings and Bookings_Archive"""
+        conditions = []
+        range_params = []
+        if start is not None:
+            conditions.append("Booking_Date >= %s")
+            range_params.append(start)
+        if end is not None:
+            conditions.append("Booking_Date < %s")
+            range_params.append(end)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        query = f"""
+            SELECT Bucket, COUNT(*) as trips,
+                   SUM(Status = %s) as completed,
+                   SUM(Status = %s) as cancelled,
+                   SUM(CASE WHEN Status = %s THEN Fare ELSE 0 END) as revenue
+            FROM (
+                SELECT DATE_FORMAT(Booking_Date, %s) as Bucket, Status, Fare
+                FROM Bookings
+                {where}
+                UNION ALL
+                SELECT DATE_FORMAT(Booking_Date, %s) as Bucket, Status, Fare
+                FROM Bookings_Archive
+                {where}
+            ) as bucketed
+            GROUP BY Bucket
+        """
+        params = [BOOKING_STATUS_COMPLETED, BOOKING_STATUS_CANCELLED, BOOKING_STATUS_COMPLETED,
+                  date_format, *range_params, date_format, *range_params]
+        return query, params
+    
+    def _timeseries_from_facts(self, date_format, start, end, rolled_through):
+        """Build the per-bucket aggregate over Daily_Booking_Facts up to the watermark"""
+        conditions = ["Day <= %s"]
+        params = [BOOKING_STATUS_COMPLETED, BOOKING_STATUS_CANCELLED, BOOKING_STATUS_COMPLETED,
+                  date_format, rolled_through]
+        if start is not None:
+            conditions.append("Day >= DATE(%s)")
+            params.append(start)
+        if end is not None:
+            conditions.append("Day < %s")
+            params.append(end)
+        
+        query = f"""
+            SELECT Bucket, SUM(Trips) as trips,
+                   SUM(CASE WHEN Status = %s THEN Trips ELSE 0 END) as completed,
+                   SUM(CASE WHEN Status = %s THEN Trips ELSE 0 END) as cancelled,
+                   SUM(CASE WHEN Status = %s THEN Fare_Total ELSE 0 END) as revenue
+            FROM (
+                SELECT DATE_FORMAT(Day, %s) as Bucket, Status, Trips, Fare_Total
+                FROM Daily_Booking_Facts
+                WHERE {' AND '.join(conditions)}
+            ) as bucketed
+            GROUP BY Bucket
+        """
+        return query, params
+    
+    def get_bookings_by_passenger(self, passenger_id, include_history=False):
+        """
+        Get all bookings for a passenger (archived ones only if include_history)
+        """
+        try:
+            query, params = self._list_query("WHERE Passenger_ID = %s", (passenger_id,), include_history)
+            return self._fetch_models(query, params)
         except Exception as e:
             print(f"Get bookings by passenger error: {e}")
             return []
     
-    def get_bookings_by_driver(self, driver_id):
+    def get_bookings_by_driver(self, driver_id, include_history=False):
         """
-        Get all bookings for a driver
+        Get all bookings for a driver (archived ones only if include_history)
         """
         try:
-            query = """
-                SELECT * FROM Bookings 
-                WHERE Driver_ID = %s 
-                ORDER BY Booking_Date DESC
-            """
-            rows = self.db.fetch_all(query, (driver_id,))
-            return [BookingModel.from_db_row(row) for row in rows]
+            query, params = self._list_query("WHERE Driver_ID = %s", (driver_id,), include_history)
+            return self._fetch_models(query, params)
         except Exception as e:
             print(f"Get bookings by driver error: {e}")
             return []
     
-    def get_bookings_by_status(self, status):
+    def get_bookings_by_status(self, status, include_history=False):
         """
-        Get bookings by status
+        Get bookings by status (archived ones only if include_history)
         """
         try:
-            query = """
-                SELECT * FROM Bookings 
-                WHERE Status = %s 
-                ORDER BY Booking_Date DESC
-            """
-            rows = self.db.fetch_all(query, (status,))
-            return [BookingModel.from_db_row(row) for row in rows]
+            query, params = self._list_query("WHERE Status = %s", (status,), include_history)
+            return self._fetch_models(query, params)
         except Exception as e:
             print(f"Get bookings by status error: {e}")
             return []
@@ -124,8 +373,7 @@ class BookingController:
                 WHERE Status IN (%s, %s) 
                 ORDER BY Booking_Date DESC
             """
-            rows = self.db.fetch_all(query, (BOOKING_STATUS_CONFIRMED, BOOKING_STATUS_IN_PROGRESS))
-            return [BookingModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (BOOKING_STATUS_CONFIRMED, BOOKING_STATUS_IN_PROGRESS))
         except Exception as e:
             print(f"Get active bookings error: {e}")
             return []
@@ -152,8 +400,10 @@ class BookingController:
             else:
                 query = "UPDATE Bookings SET Status = %s WHERE Booking_ID = %s"
                 rows = self.db.execute_query(query, (status, booking_id))
+            self._forget(BookingModel, booking_id)
             
             if rows > 0:
+                event_bus.publish(BookingStatusChanged(booking_id, status))
                 return True, SUCCESS_UPDATE
             else:
                 return False, "Booking not found"
@@ -206,6 +456,10 @@ class BookingController:
                 except Exception as e:
                     print(f"Warning: failed to set assigned driver busy: {e}")
 
+                driver_cache.invalidate(previous_driver_id, driver_id)
+                self._forget(BookingModel, booking_id)
+                self._forget(DriverModel, previous_driver_id, driver_id)
+                event_bus.publish(BookingAssigned(booking_id, driver_id, previous_driver_id))
                 return True, "Driver assigned successfully"
             else:
                 return False, "Booking not found"
@@ -248,8 +502,13 @@ class BookingController:
                 query,
                 (pickup_location, destination, distance_km, fare, status, driver_id, booking_id)
             )
+            self._forget(BookingModel, booking_id)
             
             if rows > 0:
+                if driver_id != booking.driver_id:
+                    event_bus.publish(BookingAssigned(booking_id, driver_id, booking.driver_id))
+                if status != booking.status:
+                    event_bus.publish(BookingStatusChanged(booking_id, status))
                 return True, SUCCESS_UPDATE
             else:
                 return False, "No changes made"
@@ -277,6 +536,7 @@ class BookingController:
         try:
             query = "DELETE FROM Bookings WHERE Booking_ID = %s"
             rows = self.db.execute_query(query, (booking_id,))
+            self._forget(BookingModel, booking_id)
             
             if rows > 0:
                 return True, SUCCESS_DELETE
@@ -296,15 +556,69 @@ class BookingController:
         except:
             return 0
     
+    def get_booking_status_summary(self):
+        """
+        Get booking counts and fare totals per status, archive included
+        
+        Reads Daily_Booking_Facts up to the rollup watermark and only the
+        newer bookings from Bookings, so the cost does not grow with
+        history. Without a rollup it groups Bookings and Bookings_Archive.
+        
+        Returns:
+            dict: status -> {'count': int, 'fare': float}
+        """
+        try:
+            rolled_through = get_rolled_through(self.db)
+            if rolled_through:
+                query = """
+                    SELECT Status, SUM(trips) as trips, SUM(fare) as fare FROM (
+                        SELECT Status, SUM(Trips) as trips, SUM(Fare_Total) as fare
+                        FROM Daily_Booking_Facts WHERE Day <= %s GROUP BY Status
+                        UNION ALL
+                        SELECT Status, COUNT(*) as trips, COALESCE(SUM(Fare), 0) as fare
+                        FROM Bookings WHERE Booking_Date >= %s GROUP BY Status
+                    ) as combined
+                    GROUP BY Status
+                """
+                params = (rolled_through, live_since(rolled_through))
+            else:
+                query = """
+                    SELECT Status, COUNT(*) as trips, COALESCE(SUM(Fare), 0) as fare FROM (
+                        SELECT Status, Fare FROM Bookings
+                        UNION ALL
+                        SELECT Status, Fare FROM Bookings_Archive
+                    ) as combined
+                    GROUP BY Status
+                """
+                params = ()
+            return {
+                row['Status']: {'count': int(row['trips'] or 0), 'fare': float(row['fare'] or 0)}
+                for row in self.db.fetch_all(query, params)
+            }
+        except Exception as e:
+            print(f"Get booking status summary error: {e}")
+            return {}
+    
     def get_total_revenue(self):
-        """Get total revenue from completed bookings"""
+        """Get total revenue from completed bookings (rolled-up days plus the live tail, archive included)"""
         try:
-            query = """
-                SELECT SUM(Fare) as total 
-                FROM Bookings 
-                WHERE Status = %s AND Fare IS NOT NULL
-            """
-            result = self.db.fetch_one(query, (BOOKING_STATUS_COMPLETED,))
+            rolled_through = get_rolled_through(self.db)
+            if rolled_through:
+                query = """
+                    SELECT (SELECT COALESCE(SUM(Fare_Total), 0) FROM Daily_Booking_Facts
+                            WHERE Status = %s AND Day <= %s)
+                         + (SELECT COALESCE(SUM(Fare), 0) FROM Bookings
+                            WHERE Status = %s AND Booking_Date >= %s) as total
+                """
+                params = (BOOKING_STATUS_COMPLETED, rolled_through,
+                          BOOKING_STATUS_COMPLETED, live_since(rolled_through))
+            else:
+                query = """
+                    SELECT (SELECT COALESCE(SUM(Fare), 0) FROM Bookings WHERE Status = %s)
+                         + (SELECT COALESCE(SUM(Fare), 0) FROM Bookings_Archive WHERE Status = %s) as total
+                """
+                params = (BOOKING_STATUS_COMPLETED, BOOKING_STATUS_COMPLETED)
+            result = self.db.fetch_one(query, params)
             return float(result['total']) if result and result['total'] else 0.0
         except:
             return 0.0
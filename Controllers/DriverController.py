@@ -1,16 +1,18 @@
 # Controllers/DriverController.py
 """Driver Controller - Handles driver management operations"""
-from Db.base_db import BaseDB
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.DriverModel import DriverModel
+from Controllers.EntityCache import driver_cache
 from config import (ERROR_LICENSE_EXISTS,ERROR_PHONE_EXISTS,SUCCESS_REGISTRATION,SUCCESS_UPDATE,SUCCESS_DELETE,DRIVER_AVAILABLE
                     ,DRIVER_BUSY,DRIVER_OFFLINE,validate_phone,validate_license
 )
-class DriverController:
+@profile_methods
+class DriverController(BaseController):
     """Handles all driver-related operations"""
     
-    def __init__(self):
-        """Initialize DriverController with database connection"""
-        self.db = BaseDB()
+    MODEL = DriverModel
+    KEY = 'Driver_ID'
     
     def create_driver(self, name, license_number, phone, email, user_id, 
                      availability=DRIVER_AVAILABLE):
@@ -45,21 +47,28 @@ class DriverController:
             return False, str(e), None
     
     def get_driver_by_id(self, driver_id):
-        """Get driver by ID """
+        """Get driver by ID (read through the shared driver cache)"""
         try:
-            query = "SELECT * FROM Drivers WHERE Driver_ID = %s"
-            row = self.db.fetch_one(query, (driver_id,))
-            return DriverModel.from_db_row(row)
+            if self.identity_map is not None:
+                driver = self.identity_map.get(DriverModel, driver_id)
+                if driver is not None:
+                    return driver
+            row = driver_cache.get(driver_id, self._fetch_driver_row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get driver error: {e}")
             return None
     
+    def _fetch_driver_row(self, driver_id):
+        query = "SELECT * FROM Drivers WHERE Driver_ID = %s"
+        return self.db.fetch_one(query, (driver_id,))
+    
     def get_driver_by_user_id(self, user_id):
         """ Get driver by user ID """
         try:
             query = "SELECT * FROM Drivers WHERE User_ID = %s"
             row = self.db.fetch_one(query, (user_id,))
-            return DriverModel.from_db_row(row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get driver by user ID error: {e}")
             return None
@@ -69,7 +78,7 @@ class DriverController:
         try:
             query = "SELECT * FROM Drivers WHERE License_Number = %s"
             row = self.db.fetch_one(query, (license_number.upper(),))
-            return DriverModel.from_db_row(row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get driver by license error: {e}")
             return None
@@ -78,18 +87,39 @@ class DriverController:
         """        Get all drivers                """
         try:
             query = "SELECT * FROM Drivers ORDER BY Created_At DESC"
-            rows = self.db.fetch_all(query)
-            return [DriverModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get all drivers error: {e}")
             return []
     
+    def get_drivers_changed_since(self, watermark):
+        """
+        Get drivers created or updated since a watermark (delta sync)
+        
+        Call with None to get a starting watermark, then pass back the
+        watermark each call returns.
+        
+        Returns:
+            tuple: (list of DriverModel, new watermark)
+        """
+        try:
+            columns, rows, watermark = self.db.fetch_changed_since('Drivers', watermark)
+            if rows:
+                # Changed elsewhere, so cached and mapped instances are stale
+                key = columns.index('Driver_ID')
+                driver_ids = [row[key] for row in rows]
+                driver_cache.invalidate(*driver_ids)
+                self._forget(DriverModel, *driver_ids)
+            return self._hydrate(columns, rows), watermark
+        except Exception as e:
+            print(f"Get changed drivers error: {e}")
+            return [], watermark
+    
     def get_available_drivers(self):
         """        Get all available drivers        """
         try:
             query = """SELECT * FROM Drivers WHERE Availability = %s ORDER BY Name"""
-            rows = self.db.fetch_all(query, (DRIVER_AVAILABLE,))
-            return [DriverModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (DRIVER_AVAILABLE,))
         except Exception as e:
             print(f"Get available drivers error: {e}")
             return []
@@ -98,8 +128,7 @@ class DriverController:
         """        Get drivers by availability status        """
         try:
             query = "SELECT * FROM Drivers WHERE Availability = %s ORDER BY Name"
-            rows = self.db.fetch_all(query, (availability,))
-            return [DriverModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (availability,))
         except Exception as e:
             print(f"Get drivers by status error: {e}")
             return []
@@ -109,8 +138,7 @@ class DriverController:
         try:
             query = """ SELECT * FROM Drivers  WHERE Name LIKE %s OR License_Number LIKE %s OR Phone LIKE %s ORDER BY Name"""
             search_pattern = f"%{search_term}%"
-            rows = self.db.fetch_all(query, (search_pattern, search_pattern, search_pattern))
-            return [DriverModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (search_pattern, search_pattern, search_pattern))
         except Exception as e:
             print(f"Search drivers error: {e}")
             return []
@@ -149,6 +177,8 @@ class DriverController:
             query = """ UPDATE Drivers  SET Name = %s, License_Number = %s, Phone = %s, Email = %s, Availability = %s WHERE Driver_ID = %s """
             rows = self.db.execute_query( query,  (name, license_number.upper(), phone, email, availability, driver_id)
             )
+            driver_cache.invalidate(driver_id)
+            self._forget(DriverModel, driver_id)
             if rows > 0:
                 return True, SUCCESS_UPDATE
             else:
@@ -163,6 +193,8 @@ class DriverController:
         try:
             query = "UPDATE Drivers SET Availability = %s WHERE Driver_ID = %s"
             rows = self.db.execute_query(query, (availability, driver_id))
+            driver_cache.invalidate(driver_id)
+            self._forget(DriverModel, driver_id)
             return rows > 0
         except Exception as e:
             print(f"Update availability error: {e}")
@@ -173,6 +205,8 @@ class DriverController:
         try:
             query = "DELETE FROM Drivers WHERE Driver_ID = %s"
             rows = self.db.execute_query(query, (driver_id,))
+            driver_cache.invalidate(driver_id)
+            self._forget(DriverModel, driver_id)
             
             if rows > 0:
                 return True, SUCCESS_DELETE
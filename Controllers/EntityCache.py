@@ -0,0 +1,99 @@
+# Controllers/EntityCache.py
+"""
+Entity Cache - Bounded, time-limited read-through cache for rows looked up
+by primary key
+
+The caches are module-level so every controller instance in the process
+shares them, and a write made through one controller invalidates the row
+for all of them.
+"""
+import threading
+import time
+from collections import OrderedDict
+from config import ENTITY_CACHE_SIZE, ENTITY_CACHE_TTL
+
+
+class EntityCache:
+    """
+    LRU cache of database rows with a per-entry time to live
+    """
+
+    def __init__(self, name, max_size=ENTITY_CACHE_SIZE, ttl=ENTITY_CACHE_TTL):
+        """
+        Initialize EntityCache
+
+        Args:
+            name (str): Name shown in statistics
+            max_size (int): Maximum number of rows kept
+            ttl (float): Seconds a row stays valid
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, loader):
+        """
+        Get the row for key, calling loader(key) on a miss
+
+        Missing rows (loader returns None) are not cached, so newly created
+        records are visible immediately.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        row = loader(key)
+
+        with self._lock:
+            # Skip storing if a write invalidated the cache while we were loading
+            if row is not None and generation == self._generation:
+                self._entries[key] = (now + self.ttl, row)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return row
+
+    def invalidate(self, *keys):
+        """Drop the given keys after a write"""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every cached row"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: name, size, hits, misses and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+driver_cache = EntityCache('drivers')
+passenger_cache = EntityCache('passengers')
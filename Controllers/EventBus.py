@@ -0,0 +1,120 @@
+# Controllers/EventBus.py
+"""
+Event Bus - In-process notifications of booking and payment changes
+
+Controllers publish an event after a write succeeds; screens subscribe to
+the event types they display and patch just the affected rows instead of
+re-reading whole tables:
+
+    event_bus.subscribe(BookingStatusChanged, on_status_changed)
+    ...
+    event_bus.unsubscribe(BookingStatusChanged, on_status_changed)
+
+Handlers run synchronously on the publishing thread. A handler that fails
+is reported and skipped so it cannot undo the write that published it.
+"""
+import threading
+
+
+class BookingEvent:
+    """Base class for booking events (subscribe to it to receive all of them)"""
+
+    __slots__ = ('booking_id',)
+
+    def __init__(self, booking_id):
+        self.booking_id = booking_id
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields())
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def _fields(cls):
+        return [name for klass in reversed(cls.__mro__) for name in getattr(klass, '__slots__', ())]
+
+
+class BookingCreated(BookingEvent):
+    """A passenger booked a ride"""
+
+    __slots__ = ('passenger_id', 'driver_id')
+
+    def __init__(self, booking_id, passenger_id, driver_id=None):
+        super().__init__(booking_id)
+        self.passenger_id = passenger_id
+        self.driver_id = driver_id
+
+
+class BookingAssigned(BookingEvent):
+    """A driver was assigned (or reassigned) to a booking"""
+
+    __slots__ = ('driver_id', 'previous_driver_id')
+
+    def __init__(self, booking_id, driver_id, previous_driver_id=None):
+        super().__init__(booking_id)
+        self.driver_id = driver_id
+        self.previous_driver_id = previous_driver_id
+
+
+class BookingStatusChanged(BookingEvent):
+    """A booking moved to a new status"""
+
+    __slots__ = ('status',)
+
+    def __init__(self, booking_id, status):
+        super().__init__(booking_id)
+        self.status = status
+
+
+class PaymentCompleted(BookingEvent):
+    """A booking was paid"""
+
+    __slots__ = ('payment_id', 'amount')
+
+    def __init__(self, booking_id, payment_id, amount=None):
+        super().__init__(booking_id)
+        self.payment_id = payment_id
+        self.amount = amount
+
+
+class EventBus:
+    """Synchronous publish/subscribe keyed by event class"""
+
+    def __init__(self):
+        self._handlers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, handler):
+        """
+        Call handler(event) for every published event_type (or subclass)
+
+        Returns:
+            The handler, for passing to unsubscribe
+        """
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        """Stop calling handler for event_type (no error if not subscribed)"""
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event):
+        """Deliver event to the handlers of its class and its base classes"""
+        with self._lock:
+            handlers = [
+                handler
+                for event_type in type(event).__mro__
+                for handler in self._handlers.get(event_type, ())
+            ]
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Event handler error for {event!r}: {e}")
+
+
+# Shared by every controller and screen in the process
+event_bus = EventBus()
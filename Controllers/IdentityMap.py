@@ -0,0 +1,61 @@
+# Controllers/IdentityMap.py
+"""
+Identity Map - Keeps one model instance per primary key for a unit of work
+
+Controllers sharing a map hydrate each row once and hand back the same
+object for later lookups of that key, until the unit of work ends (clear)
+or a write through a controller discards the entry.
+"""
+
+
+class IdentityMap:
+    """
+    Maps (model class, primary key) to the hydrated model instance
+    """
+
+    def __init__(self):
+        """Initialize an empty identity map"""
+        self._models = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model_class, key):
+        """Get the instance for a key, or None if it has not been loaded"""
+        model = self._models.get((model_class, key))
+        if model is not None:
+            self.hits += 1
+        return model
+
+    def load(self, model_class, key, hydrate):
+        """
+        Get the instance for a key, calling hydrate() only if it is not mapped yet
+
+        Args:
+            model_class: Model class the key belongs to
+            key: Primary key value
+            hydrate: Zero-argument callable returning the model instance
+
+        Returns:
+            The mapped model instance (or None if hydrate returned None)
+        """
+        model = self._models.get((model_class, key))
+        if model is not None:
+            self.hits += 1
+            return model
+        self.misses += 1
+        model = hydrate()
+        if model is not None:
+            self._models[(model_class, key)] = model
+        return model
+
+    def discard(self, model_class, *keys):
+        """Forget instances whose rows were changed by a write"""
+        for key in keys:
+            self._models.pop((model_class, key), None)
+
+    def clear(self):
+        """End the unit of work"""
+        self._models.clear()
+
+    def __len__(self):
+        return len(self._models)
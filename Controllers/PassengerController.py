@@ -1,5 +1,7 @@
-from Db.base_db import BaseDB
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.PassengerModel import PassengerModel
+from Controllers.EntityCache import passenger_cache
 from config import (
     ERROR_EMAIL_EXISTS,
     ERROR_PHONE_EXISTS,
@@ -9,11 +11,11 @@ from config import (
     validate_email,
     validate_phone
 )
-class PassengerController:
+@profile_methods
+class PassengerController(BaseController):
 
-    def __init__(self):
-        """Initialize PassengerController with database connection"""
-        self.db = BaseDB()
+    MODEL = PassengerModel
+    KEY = 'Passenger_ID'
     
     def create_passenger(self, name, email, phone, address, user_id):
         """
@@ -51,16 +53,23 @@ class PassengerController:
     
     def get_passenger_by_id(self, passenger_id):
         """
-        Get passenger by ID
+        Get passenger by ID (read through the shared passenger cache)
         """
         try:
-            query = "SELECT * FROM Passengers WHERE Passenger_ID = %s"
-            row = self.db.fetch_one(query, (passenger_id,))
-            return PassengerModel.from_db_row(row)
+            if self.identity_map is not None:
+                passenger = self.identity_map.get(PassengerModel, passenger_id)
+                if passenger is not None:
+                    return passenger
+            row = passenger_cache.get(passenger_id, self._fetch_passenger_row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get passenger error: {e}")
             return None
     
+    def _fetch_passenger_row(self, passenger_id):
+        query = "SELECT * FROM Passengers WHERE Passenger_ID = %s"
+        return self.db.fetch_one(query, (passenger_id,))
+    
     def get_passenger_by_user_id(self, user_id):
         """
         Get passenger by user ID
@@ -68,7 +77,7 @@ class PassengerController:
         try:
             query = "SELECT * FROM Passengers WHERE User_ID = %s"
             row = self.db.fetch_one(query, (user_id,))
-            return PassengerModel.from_db_row(row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get passenger by user ID error: {e}")
             return None
@@ -80,7 +89,7 @@ class PassengerController:
         try:
             query = "SELECT * FROM Passengers WHERE Email = %s"
             row = self.db.fetch_one(query, (email,))
-            return PassengerModel.from_db_row(row)
+            return self._to_model(row)
         except Exception as e:
             print(f"Get passenger by email error: {e}")
             return None
@@ -91,8 +100,7 @@ class PassengerController:
         """
         try:
             query = "SELECT * FROM Passengers ORDER BY Created_At DESC"
-            rows = self.db.fetch_all(query)
-            return [PassengerModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get all passengers error: {e}")
             return []
@@ -102,8 +110,7 @@ class PassengerController:
         try:
             query = """SELECT * FROM Passengers WHERE Name LIKE %s OR Email LIKE %s OR Phone LIKE %s ORDER BY Name"""
             search_pattern = f"%{search_term}%"
-            rows = self.db.fetch_all(query, (search_pattern, search_pattern, search_pattern))
-            return [PassengerModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (search_pattern, search_pattern, search_pattern))
         except Exception as e:
             print(f"Search passengers error: {e}")
             return []    
@@ -138,6 +145,8 @@ class PassengerController:
                 WHERE Passenger_ID = %s
             """
             rows = self.db.execute_query(query, (name, email, phone, address, passenger_id))
+            passenger_cache.invalidate(passenger_id)
+            self._forget(PassengerModel, passenger_id)
             
             if rows > 0:
                 return True, SUCCESS_UPDATE
@@ -155,6 +164,8 @@ class PassengerController:
         try:
             query = "DELETE FROM Passengers WHERE Passenger_ID = %s"
             rows = self.db.execute_query(query, (passenger_id,))
+            passenger_cache.invalidate(passenger_id)
+            self._forget(PassengerModel, passenger_id)
             
             if rows > 0:
                 return True, SUCCESS_DELETE
@@ -3,8 +3,11 @@
 Payment Controller - Handles payment management operations
 """
 
-from Db.base_db import BaseDB
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.PaymentModel import PaymentModel
+from Db.rollup import get_rolled_through, live_since
+from Controllers.EventBus import event_bus, PaymentCompleted
 from config import (
     SUCCESS_REGISTRATION,
     SUCCESS_UPDATE,
@@ -17,14 +20,14 @@ from config import (
 from datetime import datetime
 
 
-class PaymentController:
+@profile_methods
+class PaymentController(BaseController):
     """
     Handles all payment-related operations
     """
     
-    def __init__(self):
-        """Initialize PaymentController with database connection"""
-        self.db = BaseDB()
+    MODEL = PaymentModel
+    KEY = 'Payment_ID'
     
     def create_payment(self, booking_id, amount, payment_method, 
                       payment_status=PAYMENT_PENDING):
@@ -61,6 +64,8 @@ class PaymentController:
             
             if rows > 0:
                 payment_id = self.db.get_last_insert_id()
+                if payment_status == PAYMENT_COMPLETED:
+                    event_bus.publish(PaymentCompleted(booking_id, payment_id, amount))
                 return True, SUCCESS_REGISTRATION, payment_id
             else:
                 return False, "Failed to create payment", None
@@ -82,6 +87,9 @@ class PaymentController:
         try:
             query = "SELECT * FROM Payments WHERE Payment_ID = %s"
             row = self.db.fetch_one(query, (payment_id,))
+            if row is None:
+                query = f"SELECT {', '.join(PaymentModel.COLUMNS)} FROM Payments_Archive WHERE Payment_ID = %s"
+                row = self.db.fetch_one(query, (payment_id,))
             return PaymentModel.from_db_row(row)
         except Exception as e:
             print(f"Get payment error: {e}")
@@ -100,26 +108,108 @@ class PaymentController:
         try:
             query = "SELECT * FROM Payments WHERE Booking_ID = %s"
             row = self.db.fetch_one(query, (booking_id,))
+            if row is None:
+                # Payments of archived bookings are moved along with them
+                query = f"SELECT {', '.join(PaymentModel.COLUMNS)} FROM Payments_Archive WHERE Booking_ID = %s"
+                row = self.db.fetch_one(query, (booking_id,))
             return PaymentModel.from_db_row(row)
         except Exception as e:
             print(f"Get payment by booking error: {e}")
             return None
     
-    def get_all_payments(self):
+    def get_all_payments(self, include_history=False):
         """
         Get all payments
         
+        Args:
+            include_history (bool): Also read Payments_Archive
+            
         Returns:
             list: List of PaymentModel objects
         """
         try:
-            query = "SELECT * FROM Payments ORDER BY Payment_Date DESC"
-            rows = self.db.fetch_all(query)
-            return [PaymentModel.from_db_row(row) for row in rows]
+            if include_history:
+                columns = ', '.join(PaymentModel.COLUMNS)
+                query = f"""
+                    SELECT {columns} FROM Payments
+                    UNION ALL
+                    SELECT {columns} FROM Payments_Archive
+                    ORDER BY Payment_Date DESC
+                """
+            else:
+                query = "SELECT * FROM Payments ORDER BY Payment_Date DESC"
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get all payments error: {e}")
             return []
     
+    def get_payments_changed_since(self, watermark):
+        """
+        Get payments created or updated since a watermark (delta sync)
+        
+        Call with None to get a starting watermark, then pass back the
+        watermark each call returns.
+        
+        Returns:
+            tuple: (list of PaymentModel, new watermark)
+        """
+        try:
+            columns, rows, watermark = self.db.fetch_changed_since('Payments', watermark)
+            return self._hydrate(columns, rows), watermark
+        except Exception as e:
+            print(f"Get changed payments error: {e}")
+            return [], watermark
+    
+    def iter_payments(self, batch_size=1000):
+        """
+        Stream all payments (newest first) without loading the whole table
+        
+        Args:
+            batch_size (int): Rows fetched from the server per round trip
+            
+        Yields:
+            PaymentModel: One payment at a time
+        """
+        try:
+            query = "SELECT * FROM Payments ORDER BY Payment_Date DESC"
+            getter = None
+            for columns, rows in self.db.iter_query(query, batch_size=batch_size):
+                if getter is None:
+                    getter = PaymentModel.column_getter(columns)
+                for row in rows:
+                    yield PaymentModel.from_tuple(row, getter)
+        except Exception as e:
+            print(f"Iterate payments error: {e}")
+    
+    def iter_payments_with_passengers(self, batch_size=1000):
+        """
+        Stream all payments (newest first) with the booking's passenger name
+        
+        The name is joined in the streamed query rather than looked up per
+        row, so nothing accumulates in the identity map.
+        
+        Yields:
+            tuple: (PaymentModel, passenger name or None)
+        """
+        try:
+            columns = ', '.join(f"pay.{column}" for column in PaymentModel.COLUMNS)
+            query = f"""
+                SELECT {columns}, p.Name as Passenger_Name
+                FROM Payments pay
+                LEFT JOIN Bookings b ON b.Booking_ID = pay.Booking_ID
+                LEFT JOIN Passengers p ON p.Passenger_ID = b.Passenger_ID
+                ORDER BY pay.Payment_Date DESC
+            """
+            getter = None
+            for column_names, rows in self.db.iter_query(query, batch_size=batch_size):
+                if getter is None:
+                    getter = PaymentModel.column_getter(column_names)
+                    passenger_name = column_names.index('Passenger_Name')
+                for row in rows:
+                    yield PaymentModel.from_tuple(row, getter), row[passenger_name]
+        except Exception as e:
+            print(f"Iterate payments with passengers error: {e}")
+    
     def get_payments_by_status(self, payment_status):
         """
         Get payments by status
@@ -136,8 +226,7 @@ class PaymentController:
                 WHERE Payment_Status = %s 
                 ORDER BY Payment_Date DESC
             """
-            rows = self.db.fetch_all(query, (payment_status,))
-            return [PaymentModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (payment_status,))
         except Exception as e:
             print(f"Get payments by status error: {e}")
             return []
@@ -158,8 +247,7 @@ class PaymentController:
                 WHERE Payment_Method = %s 
                 ORDER BY Payment_Date DESC
             """
-            rows = self.db.fetch_all(query, (payment_method,))
-            return [PaymentModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (payment_method,))
         except Exception as e:
             print(f"Get payments by method error: {e}")
             return []
@@ -216,6 +304,8 @@ class PaymentController:
                 rows = self.db.execute_query(query, (payment_status, payment_id))
             
             if rows > 0:
+                if payment_status == PAYMENT_COMPLETED:
+                    self._publish_completed(payment_id)
                 return True, SUCCESS_UPDATE
             else:
                 return False, "Payment not found"
@@ -289,6 +379,8 @@ class PaymentController:
             )
             
             if rows > 0:
+                if payment_status == PAYMENT_COMPLETED and not payment.is_completed():
+                    self._publish_completed(payment_id)
                 return True, SUCCESS_UPDATE
             else:
                 return False, "No changes made"
@@ -297,6 +389,12 @@ class PaymentController:
             print(f"Update payment error: {e}")
             return False, str(e)
     
+    def _publish_completed(self, payment_id):
+        """Announce a payment that just became completed"""
+        payment = self.get_payment_by_id(payment_id)
+        if payment:
+            event_bus.publish(PaymentCompleted(payment.booking_id, payment_id, payment.amount))
+    
     def delete_payment(self, payment_id):
         """
         Delete payment
@@ -348,32 +446,50 @@ class PaymentController:
     
     def get_total_revenue(self):
         """Get total revenue from completed payments"""
-        try:
-            query = """
-                SELECT SUM(Amount) as total 
-                FROM Payments 
-                WHERE Payment_Status = %s
-            """
-            result = self.db.fetch_one(query, (PAYMENT_COMPLETED,))
-            return float(result['total']) if result and result['total'] else 0.0
-        except:
-            return 0.0
+        return sum(self.get_revenue_by_method().values())
     
     def get_revenue_by_method(self):
         """
         Get revenue breakdown by payment method
         
+        Days up to the rollup watermark come from Daily_Payment_Facts; only
+        payments made after it are read from the Payments table. Before the
+        first rollup, Payments and Payments_Archive are both read.
+        
         Returns:
             dict: Payment method as key, revenue as value
         """
         try:
-            query = """
-                SELECT Payment_Method, SUM(Amount) as total
-                FROM Payments
-                WHERE Payment_Status = %s
-                GROUP BY Payment_Method
-            """
-            rows = self.db.fetch_all(query, (PAYMENT_COMPLETED,))
+            rolled_through = get_rolled_through(self.db)
+            if rolled_through:
+                query = """
+                    SELECT Payment_Method, SUM(total) as total
+                    FROM (
+                        SELECT Payment_Method, SUM(Amount_Total) as total
+                        FROM Daily_Payment_Facts
+                        WHERE Payment_Status = %s AND Day <= %s
+                        GROUP BY Payment_Method
+                        UNION ALL
+                        SELECT Payment_Method, SUM(Amount) as total
+                        FROM Payments
+                        WHERE Payment_Status = %s AND Payment_Date >= %s
+                        GROUP BY Payment_Method
+                    ) as combined
+                    GROUP BY Payment_Method
+                """
+                params = (PAYMENT_COMPLETED, rolled_through, PAYMENT_COMPLETED, live_since(rolled_through))
+            else:
+                query = """
+                    SELECT Payment_Method, SUM(Amount) as total
+                    FROM (
+                        SELECT Payment_Method, Amount FROM Payments WHERE Payment_Status = %s
+                        UNION ALL
+                        SELECT Payment_Method, Amount FROM Payments_Archive WHERE Payment_Status = %s
+                    ) as combined
+                    GROUP BY Payment_Method
+                """
+                params = (PAYMENT_COMPLETED, PAYMENT_COMPLETED)
+            rows = self.db.fetch_all(query, params)
             
             revenue_dict = {}
             for row in rows:
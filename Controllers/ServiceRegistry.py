@@ -0,0 +1,75 @@
+# Controllers/ServiceRegistry.py
+"""
+Service Registry - Creates controllers on first use and shares one
+database connection and identity map between them
+"""
+import importlib
+from Db.base_db import BaseDB
+from Controllers.IdentityMap import IdentityMap
+
+_CONTROLLERS = {
+    'user': ('Controllers.UserController', 'UserController'),
+    'passenger': ('Controllers.PassengerController', 'PassengerController'),
+    'driver': ('Controllers.DriverController', 'DriverController'),
+    'vehicle': ('Controllers.VehicleController', 'VehicleController'),
+    'booking': ('Controllers.BookingController', 'BookingController'),
+    'payment': ('Controllers.PaymentController', 'PaymentController')
+}
+
+# Controllers that hydrate through the shared identity map
+_IDENTITY_MAPPED = {'passenger', 'driver', 'booking'}
+
+
+class ServiceRegistry:
+    """
+    Lazily constructed controllers for one window
+
+    Controllers obtained from the registry share its connection, so close the
+    registry (not the individual controllers) when the window goes away.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry; nothing connects until first use"""
+        self._db = None
+        self._controllers = {}
+        self.identity_map = IdentityMap()
+
+    @property
+    def db(self):
+        """Shared database connection, opened on first access"""
+        if self._db is None:
+            self._db = BaseDB()
+        return self._db
+
+    def get(self, name):
+        """
+        Get a controller by name, creating it on first access
+
+        Args:
+            name (str): One of user, passenger, driver, vehicle, booking, payment
+
+        Returns:
+            Controller instance bound to the shared connection
+        """
+        controller = self._controllers.get(name)
+        if controller is None:
+            module_name, class_name = _CONTROLLERS[name]
+            controller_class = getattr(importlib.import_module(module_name), class_name)
+            if name in _IDENTITY_MAPPED:
+                controller = controller_class(db=self.db, identity_map=self.identity_map)
+            else:
+                controller = controller_class(db=self.db)
+            self._controllers[name] = controller
+        return controller
+
+    def begin_unit_of_work(self):
+        """Start a fresh unit of work (e.g. a screen build or refresh)"""
+        self.identity_map.clear()
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self._db is not None:
+            self._db.disconnect()
+            self._db = None
+        self._controllers.clear()
+        self.identity_map.clear()
@@ -1,6 +1,8 @@
-import hashlib
-from Db.base_db import BaseDB
+import passwords
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.UserModel import UserModel
+from Controllers.EntityCache import driver_cache, passenger_cache
 from config import (
     ERROR_INVALID_CREDENTIALS,
     ERROR_USER_EXISTS,
@@ -10,24 +12,42 @@ from config import (
     USER_TYPE_DRIVER
 )
 
-class UserController:
-    def __init__(self):
-        self.db = BaseDB()
+@profile_methods
+class UserController(BaseController):
+    MODEL = UserModel
+    KEY = 'User_ID'
     
     def hash_password(self, password):
-        return (password)
+        return passwords.hash_password(password)
     
     def authenticate_user(self, username, password):
+        """
+        Check a username and password
+        
+        Verification deliberately takes PASSWORD_HASH_ITERATIONS worth of
+        CPU, so call this off the Tk thread. A legacy plain-text password,
+        or a hash made with another iteration count, is rehashed on success.
+        """
         try:
-            query = """
-                SELECT * FROM Login 
-                WHERE Username = %s AND Password = %s
-            """
-            row = self.db.fetch_one(query, (username, password))
+            query = "SELECT * FROM Login WHERE Username = %s"
+            row = self.db.fetch_one(query, (username,))
             
-            if row:
-                return UserModel.from_db_row(row)
-            return None
+            if not row:
+                passwords.burn_verification(password)
+                return None
+            
+            matches, needs_rehash = passwords.verify_password(password, row['Password'])
+            if not matches:
+                return None
+            
+            if needs_rehash:
+                # Only replace the value we verified, in case it changed meanwhile
+                rehash_query = "UPDATE Login SET Password = %s WHERE User_ID = %s AND Password = %s"
+                new_hash = self.hash_password(password)
+                if self.db.execute_query(rehash_query, (new_hash, row['User_ID'], row['Password'])) > 0:
+                    row['Password'] = new_hash
+            
+            return UserModel.from_db_row(row)
             
         except Exception:
             return None
@@ -44,7 +64,7 @@ class UserController:
                 INSERT INTO Login (Username, Password, User_Type)
                 VALUES (%s, %s, %s)
             """
-            rows = self.db.execute_query(query, (username, password, user_type))
+            rows = self.db.execute_query(query, (username, self.hash_password(password), user_type))
             
             if rows > 0:
                 user_id = self.db.get_last_insert_id()
@@ -82,23 +102,21 @@ class UserController:
     def get_all_users(self):
         try:
             query = "SELECT * FROM Login ORDER BY Created_At DESC"
-            rows = self.db.fetch_all(query)
-            return [UserModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception:
             return []
     
     def get_users_by_type(self, user_type):
         try:
             query = "SELECT * FROM Login WHERE User_Type = %s ORDER BY Created_At DESC"
-            rows = self.db.fetch_all(query, (user_type,))
-            return [UserModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (user_type,))
         except Exception:
             return []
     
     def update_password(self, user_id, new_password):
         try:
             query = "UPDATE Login SET Password = %s WHERE User_ID = %s"
-            rows = self.db.execute_query(query, (new_password, user_id))
+            rows = self.db.execute_query(query, (self.hash_password(new_password), user_id))
             return rows > 0
         except Exception:
             return False
@@ -107,6 +125,9 @@ class UserController:
         try:
             query = "DELETE FROM Login WHERE User_ID = %s"
             rows = self.db.execute_query(query, (user_id,))
+            # The delete cascades to the user's Passengers/Drivers row, whose ID we don't know here
+            driver_cache.clear()
+            passenger_cache.clear()
             return rows > 0
         except Exception:
             return False
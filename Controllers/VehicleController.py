@@ -3,7 +3,8 @@
 Vehicle Controller - Handles vehicle management operations
 """
 
-from Db.base_db import BaseDB
+from Controllers.BaseController import BaseController
+from profiling import profile_methods
 from Models.VehicleModel import VehicleModel
 from config import (
     SUCCESS_REGISTRATION,
@@ -14,10 +15,10 @@ from config import (
 )
 
 
-class VehicleController:
-    def __init__(self):
-        """Initialize VehicleController with database connection"""
-        self.db = BaseDB()
+@profile_methods
+class VehicleController(BaseController):
+    MODEL = VehicleModel
+    KEY = 'Vehicle_ID'
     
     def create_vehicle(self, model, license_plate, vehicle_type, 
                       color=None, year=None, driver_id=None):
@@ -135,8 +136,7 @@ class VehicleController:
         """
         try:
             query = "SELECT * FROM Vehicles ORDER BY Created_At DESC"
-            rows = self.db.fetch_all(query)
-            return [VehicleModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get all vehicles error: {e}")
             return []
@@ -153,8 +153,7 @@ class VehicleController:
         """
         try:
             query = "SELECT * FROM Vehicles WHERE Vehicle_Type = %s ORDER BY Model"
-            rows = self.db.fetch_all(query, (vehicle_type,))
-            return [VehicleModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (vehicle_type,))
         except Exception as e:
             print(f"Get vehicles by type error: {e}")
             return []
@@ -168,8 +167,7 @@ class VehicleController:
         """
         try:
             query = "SELECT * FROM Vehicles WHERE Driver_ID IS NULL ORDER BY Model"
-            rows = self.db.fetch_all(query)
-            return [VehicleModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get unassigned vehicles error: {e}")
             return []
@@ -183,8 +181,7 @@ class VehicleController:
         """
         try:
             query = "SELECT * FROM Vehicles WHERE Driver_ID IS NOT NULL ORDER BY Model"
-            rows = self.db.fetch_all(query)
-            return [VehicleModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query)
         except Exception as e:
             print(f"Get assigned vehicles error: {e}")
             return []
@@ -206,8 +203,7 @@ class VehicleController:
                 ORDER BY Model
             """
             search_pattern = f"%{search_term}%"
-            rows = self.db.fetch_all(query, (search_pattern, search_pattern))
-            return [VehicleModel.from_db_row(row) for row in rows]
+            return self._fetch_models(query, (search_pattern, search_pattern))
         except Exception as e:
             print(f"Search vehicles error: {e}")
             return []
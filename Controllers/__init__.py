@@ -2,20 +2,29 @@
 """
 Controllers Package
 Contains all controller classes for business logic and CRUD operations
+
+Controllers are imported on first access (PEP 562) so that importing one
+controller does not load every controller and its model.
 """
 
-from Controllers.UserController import UserController
-from Controllers.PassengerController import PassengerController
-from Controllers.DriverController import DriverController
-from Controllers.VehicleController import VehicleController
-from Controllers.BookingController import BookingController
-from Controllers.PaymentController import PaymentController
+import importlib
+
+_CONTROLLER_MODULES = {
+    'UserController': 'Controllers.UserController',
+    'PassengerController': 'Controllers.PassengerController',
+    'DriverController': 'Controllers.DriverController',
+    'VehicleController': 'Controllers.VehicleController',
+    'BookingController': 'Controllers.BookingController',
+    'PaymentController': 'Controllers.PaymentController'
+}
+
+__all__ = list(_CONTROLLER_MODULES)
+
 
-__all__ = [
-    'UserController',
-    'PassengerController',
-    'DriverController',
-    'VehicleController',
-    'BookingController',
-    'PaymentController'
-]
\ No newline at end of file
+def __getattr__(name):
+    """Import a controller class the first time it is accessed"""
+    if name not in _CONTROLLER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_CONTROLLER_MODULES[name]), name)
+    globals()[name] = value
+    return value
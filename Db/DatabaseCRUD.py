@@ -1,4 +1,6 @@
 from Db.base_db import BaseDB
+from Db.migrator import MigrationRunner
+from passwords import hash_password
 from config import (
     DEFAULT_ADMIN,
     USER_TYPES,
@@ -11,8 +13,8 @@ from config import (
 )
 class DatabaseCRUD(BaseDB):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, backend=None):
+        super().__init__(backend)
     
     def create_all_tables(self):
         """Create all tables required for the taxi booking system"""
@@ -163,7 +165,7 @@ class DatabaseCRUD(BaseDB):
             """
             rows = self.execute_query(
                 insert_query,
-                (DEFAULT_ADMIN['username'], DEFAULT_ADMIN['password'], DEFAULT_ADMIN['user_type'])
+                (DEFAULT_ADMIN['username'], hash_password(DEFAULT_ADMIN['password']), DEFAULT_ADMIN['user_type'])
             )            
             if rows > 0:
                 print(f"Default admin created: {DEFAULT_ADMIN['username']}")
@@ -174,8 +176,31 @@ class DatabaseCRUD(BaseDB):
             print(f"Error creating default admin: {e}")
             return False
     
+    def run_migrations(self, dry_run=False):
+        """Apply pending schema migrations from Db/migrations"""
+        try:
+            return MigrationRunner(self, dry_run=dry_run).migrate()
+        except Exception as e:
+            print(f"Error running migrations: {e}")
+            return False
+    
+    def is_schema_current(self):
+        """Check if the recorded schema version matches the newest migration (one query)"""
+        try:
+            runner = MigrationRunner(self)
+            latest = runner.get_latest_version()
+            return latest > 0 and runner.get_current_version() >= latest
+        except Exception:
+            return False
+    
     def setup_database(self):
-        """Complete database setup - creates tables and default admin"""
+        """Complete database setup - creates tables, default admin and applies migrations"""
+        # Tables and migrations are all in place once the newest migration
+        # is recorded, so skip the DDL round trips; the default admin is
+        # still checked, so a deleted admin account is recreated on start
+        if self.is_schema_current():
+            return self.insert_default_admin()
+        
         success = True
         
         if not self.create_all_tables():
@@ -184,6 +209,9 @@ class DatabaseCRUD(BaseDB):
         if not self.insert_default_admin():
             success = False
         
+        if not self.run_migrations():
+            success = False
+        
         if success:
             print("Database setup completed successfully!")
         else:
@@ -192,7 +220,9 @@ class DatabaseCRUD(BaseDB):
     
     def reset_database(self):
         """Drop all tables (use with caution!)"""
-        tables = ['Payments', 'Bookings', 'Vehicles', 'Drivers', 'Passengers', 'Login']
+        tables = ['Payments', 'Bookings', 'Vehicles', 'Drivers', 'Passengers', 'Login', 'Schema_Version',
+                  'Daily_Booking_Facts', 'Daily_Payment_Facts', 'Rollup_Watermark',
+                  'Bookings_Archive', 'Payments_Archive']
         
         for table in tables:
             try:
@@ -205,10 +235,14 @@ class DatabaseCRUD(BaseDB):
         print("Database reset complete")
 
 if __name__ == "__main__":
+    import sys
     try:
         db_setup = DatabaseCRUD()
         
-        db_setup.setup_database()
+        if '--dry-run' in sys.argv:
+            db_setup.run_migrations(dry_run=True)
+        else:
+            db_setup.setup_database()
         db_setup.disconnect()
         
     except Exception as e:
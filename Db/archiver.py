@@ -0,0 +1,120 @@
+"""
+Booking Archiver - Moves finished bookings out of the hot tables
+
+Completed and cancelled bookings older than ARCHIVE_AFTER_DAYS are copied
+to Bookings_Archive (and their payments to Payments_Archive), then deleted
+from Bookings. Run it periodically, e.g. nightly after the rollup:
+
+    python -m Db.archiver
+
+Each batch is moved in its own transaction, so the job can be stopped and
+rerun at any time without losing or duplicating rows.
+"""
+from datetime import datetime, timedelta
+from Models.BookingModel import BookingModel
+from Models.PaymentModel import PaymentModel
+from config import (
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    BOOKING_STATUS_COMPLETED,
+    BOOKING_STATUS_CANCELLED
+)
+
+BOOKING_COLUMNS = ', '.join(BookingModel.COLUMNS)
+PAYMENT_COLUMNS = ', '.join(PaymentModel.COLUMNS)
+
+
+class BookingArchiver:
+    """Moves old finished bookings and their payments to the archive tables"""
+
+    def __init__(self, db):
+        """
+        Initialize BookingArchiver
+
+        Args:
+            db: Connected BaseDB instance
+        """
+        self.db = db
+
+    def run(self, older_than_days=ARCHIVE_AFTER_DAYS, batch_size=ARCHIVE_BATCH_SIZE):
+        """
+        Archive finished bookings older than the cutoff, batch by batch
+
+        Args:
+            older_than_days (int): Age in days after which a booking is archived
+            batch_size (int): Bookings moved per transaction
+
+        Returns:
+            int: Number of bookings archived
+        """
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        archived = 0
+
+        while True:
+            query = """
+                SELECT Booking_ID FROM Bookings
+                WHERE Status IN (%s, %s) AND Booking_Date < %s
+                ORDER BY Booking_ID
+                LIMIT %s
+            """
+            rows = self.db.fetch_all(
+                query, (BOOKING_STATUS_COMPLETED, BOOKING_STATUS_CANCELLED, cutoff, batch_size)
+            )
+            booking_ids = [row['Booking_ID'] for row in rows]
+            if not booking_ids:
+                break
+
+            if not self._move(booking_ids):
+                break
+            archived += len(booking_ids)
+            print(f"Archived {archived} bookings")
+
+            if len(booking_ids) < batch_size:
+                break
+
+        print(f"Archive complete: {archived} bookings older than {cutoff:%Y-%m-%d} moved")
+        return archived
+
+    def _move(self, booking_ids):
+        """Copy one batch to the archive tables and delete it from the hot ones"""
+        placeholders = ', '.join(['%s'] * len(booking_ids))
+        params = tuple(booking_ids)
+        cursor = self.db.cursor
+        try:
+            # Payments first: deleting the booking cascades to its payment
+            cursor.execute(
+                f"INSERT INTO Payments_Archive ({PAYMENT_COLUMNS}) "
+                f"SELECT {PAYMENT_COLUMNS} FROM Payments WHERE Booking_ID IN ({placeholders})",
+                params
+            )
+            cursor.execute(
+                f"INSERT INTO Bookings_Archive ({BOOKING_COLUMNS}) "
+                f"SELECT {BOOKING_COLUMNS} FROM Bookings WHERE Booking_ID IN ({placeholders})",
+                params
+            )
+            cursor.execute(f"DELETE FROM Bookings WHERE Booking_ID IN ({placeholders})", params)
+            self.db.connection.commit()
+            return True
+        except self.db.Error as e:
+            self.db.connection.rollback()
+            print(f"Archive batch failed: {e}")
+            return False
+
+
+if __name__ == "__main__":
+    import argparse
+    from Db.base_db import BaseDB
+
+    parser = argparse.ArgumentParser(description="Move old finished bookings to the archive tables")
+    parser.add_argument('--days', type=int, default=ARCHIVE_AFTER_DAYS,
+                        help=f"archive bookings older than this many days (default {ARCHIVE_AFTER_DAYS})")
+    parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE,
+                        help=f"bookings moved per transaction (default {ARCHIVE_BATCH_SIZE})")
+    args = parser.parse_args()
+
+    try:
+        db = BaseDB()
+        BookingArchiver(db).run(older_than_days=args.days, batch_size=args.batch_size)
+        db.disconnect()
+    except Exception as e:
+        print(f"Archive failed: {e}")
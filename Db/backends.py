@@ -0,0 +1,406 @@
+"""
+Database Backends - Connections and SQL dialect behind BaseDB
+
+BaseDB and the controllers are written against the mysql.connector API and
+MySQL SQL. A backend opens connections with that API and answers the few
+schema questions that differ per engine:
+
+    MySQLBackend   - mysql.connector to the server in DB_CONFIG (default)
+    SQLiteBackend  - embedded database file at SQLITE_PATH, no server needed
+
+Pick one with DB_BACKEND in config.py, or pass a backend to BaseDB.
+
+SQLite connections wrap sqlite3 so callers keep using %s placeholders,
+dictionary cursors, cursor.column_names and MySQL DDL. Statements are
+rewritten in one place (translate_sqlite): ENUM becomes a CHECK constraint,
+AUTO_INCREMENT becomes AUTOINCREMENT, inline and ALTER TABLE indexes become
+CREATE INDEX, and ON UPDATE CURRENT_TIMESTAMP becomes a trigger. MySQL's
+NOW() and DATE_FORMAT() are registered as SQL functions.
+"""
+import re
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from config import DB_BACKEND, DB_CONFIG, SQLITE_PATH
+
+
+class MySQLBackend:
+    """MySQL server through mysql.connector"""
+
+    name = 'mysql'
+    supports_prepared = True
+    explain_prefix = 'EXPLAIN'
+
+    def __init__(self, config=None):
+        # Imported here so the SQLite backend runs without the connector installed
+        import mysql.connector
+        self.Error = mysql.connector.Error
+        self.config = config if config is not None else DB_CONFIG
+
+    def connect(self):
+        """Open a connection, creating the database on first use"""
+        from mysql.connector import errorcode
+        try:
+            return self._open()
+        except self.Error as e:
+            # Only pay for the extra server connection when the database is missing
+            if e.errno != errorcode.ER_BAD_DB_ERROR:
+                raise
+            self._create_database()
+            return self._open()
+
+    def _open(self):
+        import mysql.connector
+        return mysql.connector.connect(
+            host=self.config['host'],
+            port=self.config['port'],
+            user=self.config['user'],
+            password=self.config['password'],
+            database=self.config['database']
+        )
+
+    def _create_database(self):
+        import mysql.connector
+        temp_connection = mysql.connector.connect(
+            host=self.config['host'],
+            port=self.config['port'],
+            user=self.config['user'],
+            password=self.config['password']
+        )
+        temp_cursor = temp_connection.cursor()
+        temp_cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.config['database']}")
+        temp_cursor.close()
+        temp_connection.close()
+
+    def table_exists(self, db, table_name):
+        query = """
+            SELECT COUNT(*) as count
+            FROM information_schema.tables
+            WHERE table_schema = %s AND table_name = %s
+        """
+        result = db.fetch_one(query, (self.config['database'], table_name))
+        return bool(result and result['count'] > 0)
+
+    def index_exists(self, db, table_name, index_name):
+        query = """
+            SELECT COUNT(*) as count
+            FROM information_schema.statistics
+            WHERE table_schema = %s AND table_name = %s AND index_name = %s
+        """
+        result = db.fetch_one(query, (self.config['database'], table_name, index_name))
+        return bool(result and result['count'] > 0)
+
+    def column_exists(self, db, table_name, column_name):
+        query = """
+            SELECT COUNT(*) as count
+            FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s AND column_name = %s
+        """
+        result = db.fetch_one(query, (self.config['database'], table_name, column_name))
+        return bool(result and result['count'] > 0)
+
+
+# =============================================================================
+# SQLITE
+# =============================================================================
+
+# Stored form of CURRENT_TIMESTAMP: local time, like a MySQL TIMESTAMP read back
+SQLITE_NOW = "(datetime('now', 'localtime'))"
+
+# Every in-process connection to ":memory:" shares this one database
+SQLITE_MEMORY_URI = "file:taxi_booking_memory?mode=memory&cache=shared"
+
+# MySQL DATE_FORMAT specifier -> strftime directive
+DATE_FORMAT_SPECIFIERS = {
+    'Y': '%Y', 'y': '%y', 'm': '%m', 'c': '%m', 'd': '%d', 'e': '%d',
+    'H': '%H', 'h': '%I', 'i': '%M', 's': '%S', 'S': '%S', 'p': '%p',
+    'M': '%B', 'b': '%b', 'W': '%A', 'a': '%a', 'j': '%j',
+    'x': '%G', 'v': '%V', 'u': '%W', '%': '%%',
+}
+
+_types_registered = False
+
+
+def _register_sqlite_types():
+    """Store dates as ISO text and read DATE / TIMESTAMP / DECIMAL columns back as MySQL does"""
+    global _types_registered
+    if _types_registered:
+        return
+    sqlite3.register_adapter(datetime, lambda value: value.isoformat(' ', 'seconds'))
+    sqlite3.register_adapter(date, lambda value: value.isoformat())
+    sqlite3.register_adapter(Decimal, float)
+    sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+    sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()[:10]))
+    sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+    _types_registered = True
+
+
+def _sqlite_now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _sqlite_date_format(value, mysql_format):
+    """MySQL DATE_FORMAT(value, format) for SQLite"""
+    if value is None or mysql_format is None:
+        return None
+    moment = datetime.fromisoformat(str(value))
+    directives = re.sub(r'%(.)', lambda m: DATE_FORMAT_SPECIFIERS.get(m.group(1), m.group(1)), mysql_format)
+    return moment.strftime(directives)
+
+
+def sqlite_index_name(table_name, index_name):
+    """SQLite index names are per database, not per table, so they carry the table name"""
+    return f"{table_name}_{index_name}"
+
+
+def _convert_placeholders(query):
+    """Turn %s into ? (and %% into %) outside quoted literals"""
+    out = []
+    quote = None
+    i = 0
+    while i < len(query):
+        char = query[i]
+        if quote:
+            out.append(char)
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+            out.append(char)
+        elif char == '%' and query[i + 1:i + 2] == 's':
+            out.append('?')
+            i += 1
+        elif char == '%' and query[i + 1:i + 2] == '%':
+            out.append('%')
+            i += 1
+        else:
+            out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+def _update_trigger(table_name, column):
+    """Emulate ON UPDATE CURRENT_TIMESTAMP"""
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_{column}_on_update "
+        f"AFTER UPDATE ON {table_name} FOR EACH ROW WHEN NEW.{column} IS OLD.{column} "
+        f"BEGIN UPDATE {table_name} SET {column} = {SQLITE_NOW} WHERE rowid = NEW.rowid; END"
+    )
+
+
+def _insert_trigger(table_name, column):
+    """Emulate DEFAULT CURRENT_TIMESTAMP on a column added by ALTER TABLE"""
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_{column}_on_insert "
+        f"AFTER INSERT ON {table_name} FOR EACH ROW WHEN NEW.{column} IS NULL "
+        f"BEGIN UPDATE {table_name} SET {column} = {SQLITE_NOW} WHERE rowid = NEW.rowid; END"
+    )
+
+
+def _translate_columns(sql):
+    """Column-level MySQL types and defaults"""
+    sql = re.sub(r'\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b', 'INTEGER PRIMARY KEY AUTOINCREMENT', sql, flags=re.I)
+    sql = re.sub(r'(\w+)\s+ENUM\(([^)]*)\)', r'\1 TEXT CHECK (\1 IN (\2))', sql, flags=re.I)
+    return re.sub(r'\bCURRENT_TIMESTAMP\b', SQLITE_NOW, sql, flags=re.I)
+
+
+@lru_cache(maxsize=512)
+def translate_sqlite(query):
+    """
+    Rewrite one MySQL statement for SQLite
+
+    Returns:
+        tuple: (statement to run with the caller's parameters,
+                tuple of follow-up statements without parameters)
+    """
+    sql = _convert_placeholders(query)
+    extra = []
+
+    create = re.match(r'\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', sql, flags=re.I)
+    if create:
+        table_name = create.group(1)
+        sql = re.sub(r'\)\s*ENGINE\s*=.*$', ')', sql, flags=re.I | re.S)
+
+        def inline_index(match):
+            unique = 'UNIQUE ' if match.group(1) else ''
+            name = sqlite_index_name(table_name, match.group(2))
+            extra.append(f"CREATE {unique}INDEX IF NOT EXISTS {name} ON {table_name} ({match.group(3)})")
+            return ''
+        sql = re.sub(r',\s*(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)', inline_index, sql, flags=re.I)
+
+        for column in re.findall(r'(\w+)\s+TIMESTAMP\b[^,]*?\bON\s+UPDATE\s+CURRENT_TIMESTAMP', sql, flags=re.I):
+            extra.append(_update_trigger(table_name, column))
+        sql = re.sub(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b', '', sql, flags=re.I)
+        return _translate_columns(sql), tuple(extra)
+
+    sql = re.sub(r',\s*ALGORITHM\s*=\s*\w+(\s*,\s*LOCK\s*=\s*\w+)?\s*$', '', sql, flags=re.I)
+
+    add_index = re.match(r'\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)\s*$',
+                         sql, flags=re.I)
+    if add_index:
+        table_name, unique, index_name, columns = add_index.groups()
+        unique = 'UNIQUE ' if unique else ''
+        name = sqlite_index_name(table_name, index_name)
+        return f"CREATE {unique}INDEX IF NOT EXISTS {name} ON {table_name} ({columns})", ()
+
+    add_column = re.match(r'\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)\s+(.*?)\s*$', sql, flags=re.I | re.S)
+    if add_column and re.search(r'\bCURRENT_TIMESTAMP\b', add_column.group(3), flags=re.I):
+        # SQLite cannot add a column with a non-constant default: add it
+        # empty, backfill existing rows and fill new ones from triggers
+        table_name, column, definition = add_column.groups()
+        column_type = definition.split()[0]
+        extra.append(f"UPDATE {table_name} SET {column} = {SQLITE_NOW}")
+        extra.append(_insert_trigger(table_name, column))
+        if re.search(r'\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b', definition, flags=re.I):
+            extra.append(_update_trigger(table_name, column))
+        return f"ALTER TABLE {table_name} ADD COLUMN {column} {column_type}", tuple(extra)
+
+    return _translate_columns(sql), ()
+
+
+class SQLiteCursor:
+    """sqlite3 cursor with the mysql.connector cursor API BaseDB uses"""
+
+    def __init__(self, connection, dictionary=False):
+        self._connection = connection
+        self._cursor = connection.raw.cursor()
+        self._dictionary = dictionary
+        self.column_names = ()
+
+    def execute(self, query, params=()):
+        statement, follow_ups = translate_sqlite(query)
+        self._cursor.execute(statement, tuple(params or ()))
+        for follow_up in follow_ups:
+            self._connection.raw.execute(follow_up)
+        self._set_columns()
+        return self
+
+    def executemany(self, query, seq_params):
+        statement, _ = translate_sqlite(query)
+        self._cursor.executemany(statement, [tuple(params) for params in seq_params])
+        self._set_columns()
+        return self
+
+    def _set_columns(self):
+        description = self._cursor.description
+        self.column_names = tuple(column[0] for column in description) if description else ()
+
+    def _rows(self, rows):
+        if not self._dictionary:
+            return rows
+        columns = self.column_names
+        return [dict(zip(columns, row)) for row in rows]
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self.column_names, row))
+
+    def fetchall(self):
+        return self._rows(self._cursor.fetchall())
+
+    def fetchmany(self, size=1):
+        return self._rows(self._cursor.fetchmany(size))
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """sqlite3 connection with the mysql.connector connection API BaseDB uses"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._open = True
+
+    def cursor(self, dictionary=False, buffered=None, prepared=False):
+        # sqlite3 steps rows lazily, so buffered=False streams as-is;
+        # prepared is accepted but statements are cached by sqlite3 itself
+        return SQLiteCursor(self, dictionary=dictionary)
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def close(self):
+        self._open = False
+        self.raw.close()
+
+    def is_connected(self):
+        return self._open
+
+
+class SQLiteBackend:
+    """Embedded SQLite database file"""
+
+    name = 'sqlite'
+    supports_prepared = False
+    explain_prefix = 'EXPLAIN QUERY PLAN'
+    Error = sqlite3.Error
+
+    def __init__(self, path=None):
+        """
+        Initialize SQLiteBackend
+
+        Args:
+            path (str): Database file (default SQLITE_PATH); ":memory:" is
+                        one in-memory database shared by every connection
+                        in the process
+        """
+        _register_sqlite_types()
+        self.path = path if path is not None else SQLITE_PATH
+
+    def connect(self):
+        if self.path == ':memory:':
+            raw = sqlite3.connect(SQLITE_MEMORY_URI, uri=True, detect_types=sqlite3.PARSE_DECLTYPES,
+                                  check_same_thread=False, timeout=30)
+        else:
+            raw = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
+                                  check_same_thread=False, timeout=30)
+            # Readers keep working while another connection writes
+            raw.execute("PRAGMA journal_mode = WAL")
+        raw.execute("PRAGMA foreign_keys = ON")
+        raw.create_function('NOW', 0, _sqlite_now)
+        raw.create_function('DATE_FORMAT', 2, _sqlite_date_format, deterministic=True)
+        return SQLiteConnection(raw)
+
+    def table_exists(self, db, table_name):
+        query = "SELECT COUNT(*) as count FROM sqlite_master WHERE type = 'table' AND name = %s"
+        result = db.fetch_one(query, (table_name,))
+        return bool(result and result['count'] > 0)
+
+    def index_exists(self, db, table_name, index_name):
+        query = "SELECT COUNT(*) as count FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s"
+        result = db.fetch_one(query, (table_name, sqlite_index_name(table_name, index_name)))
+        return bool(result and result['count'] > 0)
+
+    def column_exists(self, db, table_name, column_name):
+        query = "SELECT COUNT(*) as count FROM pragma_table_info(%s) WHERE name = %s"
+        result = db.fetch_one(query, (table_name, column_name))
+        return bool(result and result['count'] > 0)
+
+
+BACKENDS = {
+    'mysql': MySQLBackend,
+    'sqlite': SQLiteBackend,
+}
+
+
+def get_backend(name=None):
+    """Create the backend named by DB_BACKEND (or name)"""
+    name = name or DB_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown database backend {name!r} (expected one of: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -1,106 +1,370 @@
-import mysql.connector
-from mysql.connector import Error
-from config import DB_CONFIG
+import os
+import sys
+import time
+from collections import OrderedDict
+from Db.backends import get_backend
+from Db.query_stats import query_stats
+from config import PREPARED_STATEMENT_CACHE_SIZE, SLOW_QUERY_EXPLAIN
+
+# Statement types sent through the prepared statement cache; DDL and
+# anything else goes over the plain dictionary cursor
+PREPARABLE_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+
+def _caller():
+    """
+    "Module.function" that issued a statement, for query statistics
+    
+    The first frame outside this module, stepping past private helpers
+    (e.g. a controller's _fetch_models) to the method that called them.
+    """
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    while (frame.f_code.co_name.startswith('_') and frame.f_back is not None
+           and frame.f_back.f_code.co_filename == frame.f_code.co_filename):
+        frame = frame.f_back
+    module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return f"{module}.{frame.f_code.co_name}"
 
 
 class BaseDB:
-    def __init__(self):
+    def __init__(self, backend=None):
+        # MySQL server or embedded SQLite (see Db/backends.py and DB_BACKEND)
+        self.backend = backend if backend is not None else get_backend()
+        self.Error = self.backend.Error
         self.connection = None
         self.cursor = None
+        self.tuple_cursor = None
+        self.last_cursor = None
+        # SQL text -> (prepared cursor, SQL object it was prepared with), least recently used first
+        self._prepared = OrderedDict()
         self.connect()
     
     def connect(self):
         try:
-            temp_connection = mysql.connector.connect(
-                host=DB_CONFIG['host'],
-                port=DB_CONFIG['port'],
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password']
-            )
-            temp_cursor = temp_connection.cursor()
-            temp_cursor.execute(f"CREATE DATABASE IF NOT EXISTS {DB_CONFIG['database']}")
-            temp_cursor.close()
-            temp_connection.close()
-            
-            self.connection = mysql.connector.connect(
-                host=DB_CONFIG['host'],
-                port=DB_CONFIG['port'],
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                database=DB_CONFIG['database']
-            )
+            self.connection = self.backend.connect()
             self.cursor = self.connection.cursor(dictionary=True)
+            self.tuple_cursor = self.connection.cursor()
             
-        except Error as e:
+        except self.Error as e:
             raise Exception(f"Database connection error: {e}")
     
+    def _open_connection(self):
+        return self.backend.connect()
+    
     def disconnect(self):
         try:
+            self._clear_prepared()
             if self.cursor:
                 self.cursor.close()
+            if self.tuple_cursor:
+                self.tuple_cursor.close()
             if self.connection and self.connection.is_connected():
                 self.connection.close()
-        except Error:
+        except self.Error:
             pass
     
+    def _execute(self, query, params=None, tuples=False):
+        """
+        Execute a statement and return the cursor holding its result
+        
+        SELECT/INSERT/UPDATE/DELETE run on a server-side prepared statement
+        cached per connection, so repeated SQL is parsed by the server once
+        (MySQL only; sqlite3 keeps its own statement cache).
+        Prepared cursors return tuple rows; otherwise the dictionary cursor
+        is used, or the plain tuple cursor when tuples=True.
+        """
+        if (PREPARED_STATEMENT_CACHE_SIZE <= 0 or not self.backend.supports_prepared
+                or not self._is_preparable(query)):
+            cursor = self.tuple_cursor if tuples else self.cursor
+            cursor.execute(query, params or ())
+            self.last_cursor = cursor
+            return cursor
+        
+        cached = self._prepared.get(query)
+        if cached is None:
+            cached = (self.connection.cursor(prepared=True), query)
+            self._prepared[query] = cached
+            if len(self._prepared) > PREPARED_STATEMENT_CACHE_SIZE:
+                _, (evicted, _) = self._prepared.popitem(last=False)
+                evicted.close()
+        else:
+            self._prepared.move_to_end(query)
+        
+        cursor, prepared_query = cached
+        try:
+            # Pass the exact string object the statement was prepared with;
+            # the connector only skips re-preparing for the same operation
+            cursor.execute(prepared_query, params or ())
+        except self.Error:
+            self._discard_prepared(query)
+            raise
+        self.last_cursor = cursor
+        return cursor
+    
+    @staticmethod
+    def _is_preparable(query):
+        keyword = query.lstrip()[:7].split(None, 1)
+        return bool(keyword) and keyword[0].upper() in PREPARABLE_STATEMENTS
+    
+    def _rows_as_dicts(self, cursor, rows):
+        """Convert tuple rows from a prepared cursor to dictionaries"""
+        if cursor is self.cursor:
+            return rows
+        columns = cursor.column_names
+        return [dict(zip(columns, row)) for row in rows]
+    
+    def _discard_prepared(self, query):
+        cached = self._prepared.pop(query, None)
+        if cached:
+            try:
+                cached[0].close()
+            except self.Error:
+                pass
+    
+    def _clear_prepared(self):
+        for query in list(self._prepared):
+            self._discard_prepared(query)
+    
+    def _record(self, query, params, started, rows, error=None, elapsed_ms=None, caller=None):
+        """
+        Add a finished statement to query_stats (see Db/query_stats.py)
+        
+        elapsed_ms, when given, replaces the time since started, and caller
+        the statement's issuer found from the stack.
+        """
+        if elapsed_ms is None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        plan = None
+        if SLOW_QUERY_EXPLAIN and error is None and elapsed_ms >= query_stats.slow_ms:
+            plan = self.explain(query, params)
+        query_stats.record(query, params, elapsed_ms, rows, caller or _caller(), error, plan)
+    
+    def explain(self, query, params=None):
+        """
+        Get the query plan of a SELECT, one line per plan row
+        
+        Runs on its own cursor and is not itself recorded in query_stats.
+        
+        Returns:
+            list: Plan lines, or None for other statements and on error
+        """
+        keyword = query.lstrip()[:6].upper()
+        if keyword != 'SELECT':
+            return None
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"{self.backend.explain_prefix} {query}", params or ())
+            columns = cursor.column_names
+            return [
+                ', '.join(f"{column}={value}" for column, value in zip(columns, row) if value is not None)
+                for row in cursor.fetchall()
+            ]
+        except self.Error:
+            return None
+        finally:
+            if cursor is not None:
+                cursor.close()
+    
     def execute_query(self, query, params=None, fetch=False):
+        started = time.perf_counter() if query_stats.enabled else None
         try:
-            self.cursor.execute(query, params or ())
+            cursor = self._execute(query, params)
             
             if fetch:
-                return self.cursor.fetchall()
+                results = self._rows_as_dicts(cursor, cursor.fetchall())
+                if started is not None:
+                    self._record(query, params, started, len(results))
+                return results
             else:
                 self.connection.commit()
-                return self.cursor.rowcount
+                if started is not None:
+                    self._record(query, params, started, cursor.rowcount)
+                return cursor.rowcount
                 
-        except Error:
+        except self.Error as e:
             if self.connection:
                 self.connection.rollback()
+            if started is not None:
+                self._record(query, params, started, 0, e)
             return None if fetch else 0
     
     def execute_many(self, query, data_list):
+        started = time.perf_counter() if query_stats.enabled else None
         try:
             self.cursor.executemany(query, data_list)
+            self.last_cursor = self.cursor
             self.connection.commit()
+            if started is not None:
+                self._record(query, None, started, self.cursor.rowcount)
             return self.cursor.rowcount
-        except Error:
+        except self.Error as e:
             if self.connection:
                 self.connection.rollback()
+            if started is not None:
+                self._record(query, None, started, 0, e)
             return 0
     
     def fetch_one(self, query, params=None):
+        started = time.perf_counter() if query_stats.enabled else None
         try:
-            self.cursor.execute(query, params or ())
-            return self.cursor.fetchone()
-        except Error:
+            cursor = self._execute(query, params)
+            # Read the whole (single-row) result so no unread rows block the next statement
+            rows = self._rows_as_dicts(cursor, cursor.fetchall())
+            if started is not None:
+                self._record(query, params, started, len(rows))
+            return rows[0] if rows else None
+        except self.Error as e:
+            if started is not None:
+                self._record(query, params, started, 0, e)
             return None
     
     def fetch_all(self, query, params=None):
+        started = time.perf_counter() if query_stats.enabled else None
         try:
-            self.cursor.execute(query, params or ())
-            results = self.cursor.fetchall()
+            cursor = self._execute(query, params)
+            results = self._rows_as_dicts(cursor, cursor.fetchall())
+            if started is not None:
+                self._record(query, params, started, len(results))
             return results if results else []
-        except Error:
+        except self.Error as e:
+            if started is not None:
+                self._record(query, params, started, 0, e)
             return []
     
+    def fetch_all_tuples(self, query, params=None):
+        """
+        Fetch all rows as tuples, skipping the per-row dictionary
+        
+        Meant for bulk reads: resolve column positions once from the
+        returned column names (e.g. Model.column_getter) and hydrate with
+        Model.from_tuple.
+        
+        Returns:
+            tuple: (column_names, rows) - ((), []) on error
+        """
+        started = time.perf_counter() if query_stats.enabled else None
+        try:
+            cursor = self._execute(query, params, tuples=True)
+            rows = cursor.fetchall()
+            if started is not None:
+                self._record(query, params, started, len(rows))
+            return tuple(cursor.column_names), rows if rows else []
+        except self.Error as e:
+            if started is not None:
+                self._record(query, params, started, 0, e)
+            return (), []
+    
+    def iter_query(self, query, params=None, batch_size=1000):
+        """
+        Stream a large result in batches over an unbuffered cursor
+        
+        Rows are read from the server as the caller consumes them, so only
+        one batch is held in memory. The stream runs on its own connection:
+        an unbuffered result blocks its connection until fully read, and
+        this keeps self.connection free for lookups made while iterating.
+        
+        The statement is recorded in query_stats once, when the stream is
+        exhausted or closed, with the total rows read and the time spent in
+        execute and fetch (not the caller's work between batches).
+        
+        Yields:
+            tuple: (column_names, rows) for each batch of up to batch_size tuple rows
+        """
+        try:
+            connection = self._open_connection()
+        except self.Error as e:
+            raise Exception(f"Database connection error: {e}")
+        
+        recording = query_stats.enabled
+        caller = _caller() if recording else None
+        db_seconds = 0.0
+        total_rows = 0
+        error = None
+        cursor = None
+        try:
+            started = time.perf_counter()
+            cursor = connection.cursor(buffered=False)
+            cursor.execute(query, params or ())
+            columns = tuple(cursor.column_names)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                db_seconds += time.perf_counter() - started
+                if not rows:
+                    break
+                total_rows += len(rows)
+                yield columns, rows
+                started = time.perf_counter()
+        except self.Error as e:
+            db_seconds += time.perf_counter() - started
+            error = e
+            raise Exception(f"Streaming query error: {e}")
+        finally:
+            if recording:
+                self._record(query, params, None, total_rows, error,
+                             elapsed_ms=db_seconds * 1000, caller=caller)
+            # Closing the connection discards any rows left unread by an early exit
+            try:
+                connection.close()
+            except self.Error:
+                pass
+    
+    def fetch_changed_since(self, table_name, watermark):
+        """
+        Fetch the rows of a table whose Updated_At is at or after a watermark
+        
+        Only whole seconds that have already passed on the server are read,
+        and the returned watermark is the start of the current one, so a
+        row changed later in the same second is picked up by the next call
+        rather than skipped, and no row is returned twice for one change.
+        
+        Args:
+            table_name (str): Table with an Updated_At column
+            watermark: Value returned by the previous call, or None to start
+                       tracking (returns no rows, only a watermark)
+        
+        Returns:
+            tuple: (column_names, rows, new watermark) - rows and the old
+                   watermark unchanged on error
+        """
+        result = self.fetch_one("SELECT NOW() as now")
+        if not result:
+            return (), [], watermark
+        cutoff = result['now']
+        if watermark is None:
+            return (), [], cutoff
+        columns, rows = self.fetch_all_tuples(
+            f"SELECT * FROM {table_name} WHERE Updated_At >= %s AND Updated_At < %s ORDER BY Updated_At",
+            (watermark, cutoff)
+        )
+        if not columns:
+            return (), [], watermark
+        return columns, rows, cutoff
+    
     def get_last_insert_id(self):
         try:
-            return self.cursor.lastrowid
+            return self.last_cursor.lastrowid
         except:
             return None
     
     def table_exists(self, table_name):
         try:
-            query = """
-                SELECT COUNT(*) as count
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.fetch_one(query, (DB_CONFIG['database'], table_name))
-            return result and result['count'] > 0
+            return self.backend.table_exists(self, table_name)
         except:
             return False
     
+    def index_exists(self, table_name, index_name):
+        """Check if an index exists on a table"""
+        return self.backend.index_exists(self, table_name, index_name)
+    
+    def column_exists(self, table_name, column_name):
+        """Check if a column exists on a table"""
+        return self.backend.column_exists(self, table_name, column_name)
+    
     def get_table_row_count(self, table_name):
         try:
             query = f"SELECT COUNT(*) as count FROM {table_name}"
@@ -0,0 +1,13 @@
+"""
+Composite indexes for the booking history queries
+
+get_bookings_by_passenger / get_bookings_by_driver / get_bookings_by_status
+filter on one column and sort by Booking_Date, so a (column, Booking_Date)
+index serves both the lookup and the ORDER BY without a filesort.
+"""
+
+
+def upgrade(migrator):
+    migrator.add_index('Bookings', 'idx_passenger_date', ('Passenger_ID', 'Booking_Date'))
+    migrator.add_index('Bookings', 'idx_driver_date', ('Driver_ID', 'Booking_Date'))
+    migrator.add_index('Bookings', 'idx_status_date', ('Status', 'Booking_Date'))
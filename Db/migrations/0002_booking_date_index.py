@@ -0,0 +1,10 @@
+"""
+Covering index for the time-bucketed trend report
+
+get_booking_timeseries scans a Booking_Date range and only reads Status
+and Fare, so (Booking_Date, Status, Fare) answers it from the index alone.
+"""
+
+
+def upgrade(migrator):
+    migrator.add_index('Bookings', 'idx_date_status_fare', ('Booking_Date', 'Status', 'Fare'))
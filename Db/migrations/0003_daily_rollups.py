@@ -0,0 +1,41 @@
+"""
+Daily fact tables for reporting, filled by the rollup job (Db/rollup.py)
+
+Daily_Booking_Facts has one row per day, driver, vehicle type and status
+(Driver_ID 0 / Vehicle_Type '' for unassigned bookings), and
+Daily_Payment_Facts one row per day, payment method and status.
+Rollup_Watermark records the last day each rollup has processed.
+"""
+
+
+def upgrade(migrator):
+    migrator.execute("""
+    CREATE TABLE IF NOT EXISTS Daily_Booking_Facts (
+        Day DATE NOT NULL,
+        Driver_ID INT NOT NULL DEFAULT 0,
+        Vehicle_Type VARCHAR(20) NOT NULL DEFAULT '',
+        Status VARCHAR(20) NOT NULL,
+        Trips INT NOT NULL,
+        Fare_Total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+        Distance_Total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+        PRIMARY KEY (Day, Driver_ID, Vehicle_Type, Status),
+        INDEX idx_driver_day (Driver_ID, Day)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    migrator.execute("""
+    CREATE TABLE IF NOT EXISTS Daily_Payment_Facts (
+        Day DATE NOT NULL,
+        Payment_Method VARCHAR(20) NOT NULL,
+        Payment_Status VARCHAR(20) NOT NULL,
+        Payments INT NOT NULL,
+        Amount_Total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+        PRIMARY KEY (Day, Payment_Method, Payment_Status)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    migrator.execute("""
+    CREATE TABLE IF NOT EXISTS Rollup_Watermark (
+        Name VARCHAR(50) PRIMARY KEY,
+        Rolled_Through DATE NOT NULL,
+        Updated_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
@@ -0,0 +1,47 @@
+"""
+Archive tables for finished bookings, filled by the mover job (Db/archiver.py)
+
+Completed and cancelled bookings older than ARCHIVE_AFTER_DAYS move here,
+with their payments, so Bookings / Payments and their indexes only hold the
+hot window. Columns match the live tables; there are no foreign keys, so
+archived history is kept even if the passenger or driver is deleted later.
+"""
+from config import BOOKING_STATUSES, PAYMENT_METHODS, PAYMENT_STATUSES
+
+
+def upgrade(migrator):
+    booking_statuses_enum = "', '".join(BOOKING_STATUSES)
+    payment_methods_enum = "', '".join(PAYMENT_METHODS)
+    payment_statuses_enum = "', '".join(PAYMENT_STATUSES)
+
+    migrator.execute(f"""
+    CREATE TABLE IF NOT EXISTS Bookings_Archive (
+        Booking_ID INT PRIMARY KEY,
+        Passenger_ID INT NOT NULL,
+        Driver_ID INT,
+        Pickup_Location VARCHAR(255) NOT NULL,
+        Destination VARCHAR(255) NOT NULL,
+        Status ENUM('{booking_statuses_enum}') NOT NULL,
+        Fare DECIMAL(10, 2),
+        Distance_KM DECIMAL(10, 2),
+        Booking_Date TIMESTAMP NOT NULL,
+        Completion_Date TIMESTAMP NULL,
+        Archived_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_passenger_date (Passenger_ID, Booking_Date),
+        INDEX idx_driver_date (Driver_ID, Booking_Date),
+        INDEX idx_status_date (Status, Booking_Date),
+        INDEX idx_booking_date (Booking_Date)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    migrator.execute(f"""
+    CREATE TABLE IF NOT EXISTS Payments_Archive (
+        Payment_ID INT PRIMARY KEY,
+        Booking_ID INT UNIQUE NOT NULL,
+        Amount DECIMAL(10, 2) NOT NULL,
+        Payment_Method ENUM('{payment_methods_enum}') NOT NULL,
+        Payment_Status ENUM('{payment_statuses_enum}') NOT NULL,
+        Payment_Date TIMESTAMP NOT NULL,
+        Archived_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_payment_date (Payment_Date)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
@@ -0,0 +1,18 @@
+"""
+Modification timestamps for delta sync
+
+Updated_At is set on insert and bumped by MySQL on every update that
+changes the row, so screens can poll "what changed since my last check"
+(BaseDB.fetch_changed_since) instead of re-reading whole tables.
+"""
+
+TRACKED_TABLES = ('Bookings', 'Drivers', 'Payments')
+
+
+def upgrade(migrator):
+    for table_name in TRACKED_TABLES:
+        migrator.add_column(
+            table_name, 'Updated_At',
+            "TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+        )
+        migrator.add_index(table_name, 'idx_updated_at', ('Updated_At',))
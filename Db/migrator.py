@@ -0,0 +1,182 @@
+"""
+Migration Runner - Applies numbered schema migrations to an existing database
+
+Migrations live in Db/migrations as NNNN_description.py files. Each file
+defines an upgrade(migrator) function that uses the helpers on MigrationRunner
+(execute, add_index, add_column) so the same migration can be applied for
+real or printed in dry-run mode.
+"""
+import importlib.util
+import os
+import re
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE_PATTERN = re.compile(r'^(\d{4})_(\w+)\.py$')
+
+
+class MigrationRunner:
+    """
+    Tracks the applied schema version in the Schema_Version table and
+    applies any pending migrations in order
+    """
+
+    def __init__(self, db, dry_run=False):
+        """
+        Initialize MigrationRunner
+
+        Args:
+            db: Connected BaseDB instance
+            dry_run (bool): Print statements instead of executing them
+        """
+        self.db = db
+        self.dry_run = dry_run
+
+    def create_version_table(self):
+        """Create the Schema_Version table if it does not exist"""
+        self.execute("""
+        CREATE TABLE IF NOT EXISTS Schema_Version (
+            Version INT PRIMARY KEY,
+            Name VARCHAR(100) NOT NULL,
+            Applied_At TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+
+    def get_current_version(self):
+        """Get the highest applied migration version (0 if none)"""
+        result = self.db.fetch_one("SELECT MAX(Version) as version FROM Schema_Version")
+        return result['version'] if result and result['version'] else 0
+
+    def discover(self):
+        """
+        Find all migration files
+
+        Returns:
+            list: (version, name, path) tuples sorted by version
+        """
+        migrations = []
+        for filename in os.listdir(MIGRATIONS_DIR):
+            match = MIGRATION_FILE_PATTERN.match(filename)
+            if match:
+                migrations.append((
+                    int(match.group(1)),
+                    match.group(2),
+                    os.path.join(MIGRATIONS_DIR, filename)
+                ))
+        migrations.sort()
+
+        versions = [version for version, _, _ in migrations]
+        if len(versions) != len(set(versions)):
+            raise Exception("Duplicate migration version numbers in Db/migrations")
+        return migrations
+
+    def get_latest_version(self):
+        """Get the version of the newest migration file"""
+        migrations = self.discover()
+        return migrations[-1][0] if migrations else 0
+
+    def get_pending(self):
+        """Get migrations newer than the applied schema version"""
+        current = self.get_current_version()
+        return [m for m in self.discover() if m[0] > current]
+
+    def migrate(self, target=None):
+        """
+        Apply pending migrations in order
+
+        Args:
+            target (int): Stop after this version (optional, default all)
+
+        Returns:
+            bool: True if every pending migration was applied
+        """
+        self.create_version_table()
+
+        for version, name, path in self.get_pending():
+            if target is not None and version > target:
+                break
+
+            prefix = "[dry-run] " if self.dry_run else ""
+            print(f"{prefix}Applying migration {version:04d}_{name}")
+            try:
+                self._load(path).upgrade(self)
+                self.execute(
+                    "INSERT INTO Schema_Version (Version, Name) VALUES (%s, %s)",
+                    (version, name)
+                )
+            except Exception as e:
+                print(f"Migration {version:04d}_{name} failed: {e}")
+                return False
+
+        return True
+
+    def execute(self, query, params=None):
+        """Execute a migration statement (or print it in dry-run mode)"""
+        if self.dry_run:
+            print(f"[dry-run] {' '.join(query.split())}" + (f"  -- params: {params}" if params else ""))
+            return
+
+        try:
+            self.db.cursor.execute(query, params or ())
+            self.db.connection.commit()
+        except self.db.Error as e:
+            self.db.connection.rollback()
+            raise Exception(f"Statement failed: {e}")
+
+    def index_exists(self, table_name, index_name):
+        """Check if an index exists on a table"""
+        return self.db.index_exists(table_name, index_name)
+
+    def column_exists(self, table_name, column_name):
+        """Check if a column exists on a table"""
+        return self.db.column_exists(table_name, column_name)
+
+    def add_index(self, table_name, index_name, columns, unique=False):
+        """
+        Add an index without blocking reads or writes on the table
+
+        ALGORITHM=INPLACE, LOCK=NONE makes MySQL refuse the statement rather
+        than silently falling back to a table copy under a write lock.
+        """
+        if self.index_exists(table_name, index_name):
+            return
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        self.execute(
+            f"ALTER TABLE {table_name} ADD {kind} {index_name} ({', '.join(columns)}), "
+            f"ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+    def add_column(self, table_name, column_name, definition):
+        """Add a column online if it does not already exist"""
+        if self.column_exists(table_name, column_name):
+            return
+        self.execute(
+            f"ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}, "
+            f"ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+    def _load(self, path):
+        """Import a migration module from its file path"""
+        module_name = f"Db.migrations.{os.path.splitext(os.path.basename(path))[0]}"
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+
+if __name__ == "__main__":
+    import argparse
+    from Db.base_db import BaseDB
+
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument('--dry-run', action='store_true', help="print statements without executing them")
+    parser.add_argument('--target', type=int, help="migrate up to this version only")
+    args = parser.parse_args()
+
+    try:
+        db = BaseDB()
+        runner = MigrationRunner(db, dry_run=args.dry_run)
+        print(f"Current schema version: {runner.get_current_version()}")
+        runner.migrate(target=args.target)
+        db.disconnect()
+    except Exception as e:
+        print(f"Migration failed: {e}")
@@ -0,0 +1,227 @@
+# Db/query_stats.py
+"""
+Query Statistics - Per-statement timings and a slow-query log for BaseDB
+
+Every statement BaseDB runs is recorded here under its normalized SQL
+(literals and placeholders replaced by ?, whitespace collapsed), so the
+same query with different parameters lands in one entry. Each entry keeps
+call and error counts, total/max time, a latency histogram, rows returned
+or affected, and which controller methods issued it.
+
+Statements slower than SLOW_QUERY_MS also go to a bounded slow-query log,
+with the database's query plan when SLOW_QUERY_EXPLAIN is on. The log
+keeps only the type of each bind parameter, never its value, so passwords,
+phone numbers and e-mail addresses do not end up in it.
+
+The statistics are module-level so every connection in the process (the
+dashboards' and each AsyncServices worker's) reports into one place.
+"""
+import re
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from config import QUERY_STATS_ENABLED, SLOW_QUERY_MS, SLOW_QUERY_LOG_SIZE
+
+# Upper bounds (ms) of the latency histogram buckets; slower calls go in a final overflow bucket
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_GROUPS = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(query):
+    """
+    Collapse a statement to its shape, e.g.
+    "SELECT * FROM Bookings WHERE Passenger_ID = 42" -> "SELECT * FROM Bookings WHERE Passenger_ID = ?"
+
+    IN lists and multi-row VALUES collapse too, so batch size does not split entries.
+    """
+    sql = _STRING_LITERAL.sub('?', query)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _PLACEHOLDER_LIST.sub('(?, ...)', sql)
+    return _REPEATED_GROUPS.sub(r'\1, ...', sql)
+
+
+class StatementStats:
+    """Counters for one normalized statement"""
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.callers = Counter()
+        self.last_error = None
+
+    def add(self, elapsed_ms, rows, caller, error):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows or 0
+        self.callers[caller] += 1
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS_MS) and elapsed_ms > HISTOGRAM_BOUNDS_MS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        if error is not None:
+            self.errors += 1
+            self.last_error = str(error)
+
+    def percentile(self, fraction):
+        """
+        Upper bound (ms) of the histogram bucket holding the given percentile
+
+        The overflow bucket reports the slowest call seen.
+        """
+        target = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return HISTOGRAM_BOUNDS_MS[bucket] if bucket < len(HISTOGRAM_BOUNDS_MS) else self.max_ms
+        return 0.0
+
+    def to_dict(self):
+        return {
+            'sql': self.sql,
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max_ms, 3),
+            'rows': self.rows,
+            'histogram': dict(zip([f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS] + ['more'], self.histogram)),
+            'callers': dict(self.callers.most_common()),
+            'last_error': self.last_error,
+        }
+
+
+class QueryStats:
+    """
+    Statement statistics and slow-query log shared by every BaseDB
+    """
+
+    # Orderings accepted by top()
+    SORT_KEYS = ('total_ms', 'avg_ms', 'max_ms', 'calls', 'errors', 'rows')
+
+    def __init__(self, enabled=QUERY_STATS_ENABLED, slow_ms=SLOW_QUERY_MS, log_size=SLOW_QUERY_LOG_SIZE):
+        """
+        Initialize QueryStats
+
+        Args:
+            enabled (bool): Record statements; can be switched at runtime
+            slow_ms (float): Statements at least this slow go to the slow-query log
+            log_size (int): Slow-query log entries kept (oldest dropped first)
+        """
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.started = time.time()
+        self.slow_log = deque(maxlen=log_size)
+        self._statements = {}
+        self._lock = threading.Lock()
+        # Running totals for the recording thread (see thread_totals)
+        self._local = threading.local()
+
+    def record(self, query, params, elapsed_ms, rows, caller, error=None, plan=None):
+        """
+        Record one executed statement
+
+        Args:
+            query (str): SQL as sent
+            params: Parameters it ran with (only their types are kept)
+            elapsed_ms (float): Execution plus fetch time
+            rows (int): Rows returned, or affected for writes
+            caller (str): "Module.function" that issued it
+            error: Exception raised, if the statement failed
+            plan (list): Query plan lines, for slow statements
+        """
+        sql = normalize_sql(query)
+        self._local.db_ms = getattr(self._local, 'db_ms', 0.0) + elapsed_ms
+        self._local.calls = getattr(self._local, 'calls', 0) + 1
+        with self._lock:
+            stats = self._statements.get(sql)
+            if stats is None:
+                stats = self._statements[sql] = StatementStats(sql)
+            stats.add(elapsed_ms, rows, caller, error)
+            if elapsed_ms >= self.slow_ms:
+                self.slow_log.append({
+                    'at': time.time(),
+                    'sql': sql,
+                    'param_types': [type(value).__name__ for value in params] if params else [],
+                    'elapsed_ms': round(elapsed_ms, 3),
+                    'rows': rows,
+                    'caller': caller,
+                    'error': str(error) if error is not None else None,
+                    'plan': plan,
+                })
+
+    def thread_totals(self):
+        """
+        Database time (ms) and statement count recorded on the calling thread so far
+
+        Take the difference of two readings to get the database share of
+        some piece of work, e.g. building a dashboard screen.
+        """
+        return getattr(self._local, 'db_ms', 0.0), getattr(self._local, 'calls', 0)
+
+    def top(self, limit=20, sort_by='total_ms'):
+        """
+        Get the heaviest statements
+
+        Args:
+            limit (int): Number of statements
+            sort_by (str): One of SORT_KEYS
+
+        Returns:
+            list: Statement dicts (see StatementStats.to_dict), heaviest first
+        """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(self.SORT_KEYS)}")
+        with self._lock:
+            statements = [stats.to_dict() for stats in self._statements.values()]
+        statements.sort(key=lambda stats: stats[sort_by], reverse=True)
+        return statements[:limit]
+
+    def slow_queries(self):
+        """Slow-query log entries, newest first"""
+        with self._lock:
+            return list(reversed(self.slow_log))
+
+    def snapshot(self, limit=20, sort_by='total_ms'):
+        """Everything in one JSON-serialisable dict"""
+        with self._lock:
+            calls = sum(stats.calls for stats in self._statements.values())
+            total_ms = sum(stats.total_ms for stats in self._statements.values())
+            statement_count = len(self._statements)
+        return {
+            'enabled': self.enabled,
+            'since': self.started,
+            'statements': statement_count,
+            'calls': calls,
+            'total_ms': round(total_ms, 3),
+            'slow_ms': self.slow_ms,
+            'top': self.top(limit, sort_by),
+            'slow_queries': self.slow_queries(),
+        }
+
+    def reset(self):
+        """Forget every statement and the slow-query log"""
+        with self._lock:
+            self._statements.clear()
+            self.slow_log.clear()
+            self.started = time.time()
+
+
+query_stats = QueryStats()
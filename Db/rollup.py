@@ -0,0 +1,208 @@
+"""
+Rollup Job - Aggregates Bookings and Payments into daily fact tables
+
+Reports read Daily_Booking_Facts / Daily_Payment_Facts (a handful of rows
+per day) instead of scanning the OLTP tables. Schedule it nightly, e.g.
+from cron or Task Scheduler:
+
+    python -m Db.rollup
+
+Archived bookings and payments are included, so a full rebuild still
+covers all history. Only closed days are rolled up. Each run computes the
+days after the watermark, and recomputes any earlier day that has a
+booking or payment whose Updated_At is past the start of the last run, so
+bookings completed or cancelled long after they were made are still
+counted correctly. Rows deleted outright leave no Updated_At behind; run
+with --full after deleting bookings. Readers take anything newer than the
+watermark from the live tables.
+"""
+from datetime import date, datetime, time, timedelta
+
+WATERMARK_NAME = 'daily_facts'
+
+# Days before the watermark with rows changed since the last run started
+# (Rollup_Watermark.Updated_At)
+CHANGED_DAYS_QUERY = """
+    SELECT DATE(Booking_Date) as Day FROM Bookings
+    WHERE Updated_At >= %s AND Booking_Date < %s
+    UNION
+    SELECT DATE(Payment_Date) as Day FROM Payments
+    WHERE Updated_At >= %s AND Payment_Date < %s
+"""
+
+# TIMESTAMP columns cannot hold anything earlier, so this covers all history
+EPOCH_DAY = date(1970, 1, 1)
+
+BOOKING_FACTS_INSERT = """
+    INSERT INTO Daily_Booking_Facts
+        (Day, Driver_ID, Vehicle_Type, Status, Trips, Fare_Total, Distance_Total)
+    SELECT DATE(b.Booking_Date), COALESCE(b.Driver_ID, 0), COALESCE(v.Vehicle_Type, ''), b.Status,
+           COUNT(*), COALESCE(SUM(b.Fare), 0), COALESCE(SUM(b.Distance_KM), 0)
+    FROM (
+        SELECT Driver_ID, Status, Fare, Distance_KM, Booking_Date FROM Bookings
+        WHERE Booking_Date >= %s AND Booking_Date < %s
+        UNION ALL
+        SELECT Driver_ID, Status, Fare, Distance_KM, Booking_Date FROM Bookings_Archive
+        WHERE Booking_Date >= %s AND Booking_Date < %s
+    ) as b
+    LEFT JOIN Vehicles v ON v.Driver_ID = b.Driver_ID
+    GROUP BY DATE(b.Booking_Date), COALESCE(b.Driver_ID, 0), COALESCE(v.Vehicle_Type, ''), b.Status
+"""
+
+PAYMENT_FACTS_INSERT = """
+    INSERT INTO Daily_Payment_Facts
+        (Day, Payment_Method, Payment_Status, Payments, Amount_Total)
+    SELECT DATE(Payment_Date), Payment_Method, Payment_Status, COUNT(*), COALESCE(SUM(Amount), 0)
+    FROM (
+        SELECT Payment_Method, Payment_Status, Amount, Payment_Date FROM Payments
+        WHERE Payment_Date >= %s AND Payment_Date < %s
+        UNION ALL
+        SELECT Payment_Method, Payment_Status, Amount, Payment_Date FROM Payments_Archive
+        WHERE Payment_Date >= %s AND Payment_Date < %s
+    ) as p
+    GROUP BY DATE(Payment_Date), Payment_Method, Payment_Status
+"""
+
+
+def get_rolled_through(db):
+    """
+    Get the last day included in the fact tables
+
+    Returns:
+        date: Last rolled-up day, or None if the rollup has never run
+              (or the rollup tables do not exist yet)
+    """
+    query = "SELECT Rolled_Through FROM Rollup_Watermark WHERE Name = %s"
+    result = db.fetch_one(query, (WATERMARK_NAME,))
+    return result['Rolled_Through'] if result else None
+
+
+def live_since(rolled_through):
+    """Get the first moment not covered by the fact tables (start of the next day)"""
+    return datetime.combine(rolled_through + timedelta(days=1), time.min)
+
+
+class RollupJob:
+    """Incrementally rebuilds the daily fact tables"""
+
+    def __init__(self, db):
+        """
+        Initialize RollupJob
+
+        Args:
+            db: Connected BaseDB instance
+        """
+        self.db = db
+
+    def _changed_days(self, since, before):
+        """
+        Get the days before the watermark whose bookings or payments changed
+
+        Args:
+            since: Start of the last run (Rollup_Watermark.Updated_At)
+            before (date): First day after the watermark
+
+        Returns:
+            list: Sorted dates, or None on error
+        """
+        rows = self.db.fetch_all(CHANGED_DAYS_QUERY, (since, before, since, before))
+        if rows is None:
+            return None
+        # MySQL returns dates, SQLite ISO strings
+        return sorted(date.fromisoformat(str(row['Day'])) for row in rows if row['Day'])
+
+    def run(self, full=False):
+        """
+        Roll up every closed day since the watermark, and re-roll earlier
+        days with bookings or payments changed since the last run
+
+        Args:
+            full (bool): Rebuild the fact tables from all history
+
+        Returns:
+            bool: True if the fact tables are up to date
+        """
+        # Taken from the server before reading, like Updated_At, so rows
+        # changed while this run reads are picked up by the next one
+        result = self.db.fetch_one("SELECT NOW() as now")
+        if not result:
+            print("Rollup failed: could not read the server time")
+            return False
+        started_at = result['now']
+
+        watermark = None if full else self.db.fetch_one(
+            "SELECT Rolled_Through, Updated_At FROM Rollup_Watermark WHERE Name = %s", (WATERMARK_NAME,)
+        )
+        until = date.today()
+        changed_days = []
+        if watermark:
+            start = watermark['Rolled_Through'] + timedelta(days=1)
+            if watermark['Updated_At']:
+                changed_days = self._changed_days(watermark['Updated_At'], start)
+                if changed_days is None:
+                    print("Rollup failed: could not read changed bookings")
+                    return False
+        else:
+            start = EPOCH_DAY
+
+        # Consecutive changed days are rebuilt as one range
+        ranges = []
+        for day in changed_days:
+            if ranges and ranges[-1][1] == day:
+                ranges[-1][1] = day + timedelta(days=1)
+            else:
+                ranges.append([day, day + timedelta(days=1)])
+        if start < until:
+            ranges.append([start, until])
+
+        if not ranges:
+            print("Rollup already up to date")
+            return True
+
+        # Days are replaced as a whole in one transaction, so readers never
+        # see a half-rebuilt day and groups that disappeared are removed
+        cursor = self.db.cursor
+        booking_rows = payment_rows = 0
+        try:
+            for first, last in ranges:
+                cursor.execute("DELETE FROM Daily_Booking_Facts WHERE Day >= %s AND Day < %s", (first, last))
+                cursor.execute(BOOKING_FACTS_INSERT, (first, last, first, last))
+                booking_rows += cursor.rowcount
+                cursor.execute("DELETE FROM Daily_Payment_Facts WHERE Day >= %s AND Day < %s", (first, last))
+                cursor.execute(PAYMENT_FACTS_INSERT, (first, last, first, last))
+                payment_rows += cursor.rowcount
+            cursor.execute(
+                "REPLACE INTO Rollup_Watermark (Name, Rolled_Through, Updated_At) VALUES (%s, %s, %s)",
+                (WATERMARK_NAME, max(start, until) - timedelta(days=1), started_at)
+            )
+            self.db.connection.commit()
+        except self.db.Error as e:
+            self.db.connection.rollback()
+            print(f"Rollup failed: {e}")
+            return False
+
+        if start < until:
+            first_day = "all history" if start == EPOCH_DAY else start.isoformat()
+            summary = f"Rolled up {first_day} to {(until - timedelta(days=1)).isoformat()}"
+        else:
+            summary = "No new days to roll up"
+        if changed_days:
+            summary += f", re-rolled {len(changed_days)} changed earlier day(s)"
+        print(f"{summary}: {booking_rows} booking facts, {payment_rows} payment facts")
+        return True
+
+
+if __name__ == "__main__":
+    import argparse
+    from Db.base_db import BaseDB
+
+    parser = argparse.ArgumentParser(description="Aggregate bookings and payments into daily fact tables")
+    parser.add_argument('--full', action='store_true', help="rebuild the fact tables from all history")
+    args = parser.parse_args()
+
+    try:
+        db = BaseDB()
+        RollupJob(db).run(full=args.full)
+        db.disconnect()
+    except Exception as e:
+        print(f"Rollup failed: {e}")
@@ -0,0 +1,368 @@
+"""
+Seed Data Generator - Fills the schema with realistic synthetic data
+
+Generates passengers and drivers (each with a login, drivers with a
+vehicle), bookings spread over the last --days following a daily demand
+curve and the booking status lifecycle, and payments for completed trips,
+so reports, indexes, the rollup and the archiver can be measured on
+production-sized tables:
+
+    python -m Db.seed --bookings 1000000 [--passengers 50000] [--drivers 2000]
+                      [--days 365] [--workers 4] [--seed 42] [--rollup]
+
+The schema is created first (DatabaseCRUD.setup_database). Rows are written
+with multi-row INSERTs of SEED_BATCH_SIZE rows. Bookings and their payments
+are generated by --workers processes, each with its own connection, on
+disjoint ID and time ranges, so a run is reproducible for a given --seed and
+can be added to a database that already has data. Every generated account
+uses the password SEED_PASSWORD, hashed once per run and shared by all of
+them so seeding is not bound by the hash cost. SQLite allows one writer at
+a time, so on SQLite extra workers only parallelise generation.
+"""
+import random
+import time
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+from passwords import hash_password
+from config import (
+    SEED_BATCH_SIZE,
+    SEED_WORKERS,
+    USER_TYPE_PASSENGER,
+    USER_TYPE_DRIVER,
+    DRIVER_AVAILABLE,
+    DRIVER_BUSY,
+    DRIVER_OFFLINE,
+    VEHICLE_TYPES,
+    BOOKING_STATUS_PENDING,
+    BOOKING_STATUS_CONFIRMED,
+    BOOKING_STATUS_IN_PROGRESS,
+    BOOKING_STATUS_COMPLETED,
+    BOOKING_STATUS_CANCELLED,
+    PAYMENT_CASH,
+    PAYMENT_CARD,
+    PAYMENT_QR,
+    PAYMENT_WALLET,
+    PAYMENT_PENDING,
+    PAYMENT_COMPLETED,
+    PAYMENT_FAILED,
+    calculate_fare
+)
+
+SEED_PASSWORD = "seed1234"
+
+# Bookings generated and inserted per worker task
+CHUNK_SIZE = 50000
+
+# Bound on placeholders per statement (SQLite allows 32766)
+MAX_PARAMS_PER_STATEMENT = 30000
+
+FIRST_NAMES = ['Aarav', 'Anisha', 'Bibek', 'Binita', 'Dipesh', 'Gita', 'Hari', 'Kabita', 'Kiran', 'Laxmi',
+               'Manish', 'Nisha', 'Prakash', 'Puja', 'Rajesh', 'Rita', 'Sabin', 'Sita', 'Suman', 'Sunita']
+LAST_NAMES = ['Adhikari', 'Bhandari', 'Gurung', 'Karki', 'Khadka', 'Magar', 'Maharjan', 'Poudel',
+              'Rai', 'Sharma', 'Shrestha', 'Tamang', 'Thapa']
+LOCATIONS = ['Thamel', 'Baneshwor', 'Koteshwor', 'Kalanki', 'Chabahil', 'Boudha', 'Maharajgunj',
+             'Lazimpat', 'New Road', 'Patan Durbar Square', 'Jawalakhel', 'Lagankhel', 'Bhaktapur',
+             'Balaju', 'Swayambhu', 'Tribhuvan Airport', 'Kirtipur', 'Budhanilkantha', 'Sinamangal',
+             'Gongabu Bus Park', 'Satdobato', 'Kupondole', 'Sanepa', 'Durbar Marg']
+VEHICLE_MODELS = ['Toyota Corolla', 'Hyundai i20', 'Suzuki Swift', 'Suzuki Dzire', 'Kia Seltos',
+                  'Hyundai Creta', 'Tata Nexon', 'Mahindra Scorpio', 'Toyota Camry', 'BYD Atto 3']
+VEHICLE_COLORS = ['White', 'Silver', 'Black', 'Red', 'Blue', 'Grey']
+
+# Relative demand by hour of day (morning and evening peaks)
+HOUR_WEIGHTS = [2, 1, 1, 1, 1, 2, 4, 8, 10, 9, 7, 6, 7, 7, 6, 7, 8, 10, 10, 9, 7, 5, 4, 3]
+PEAK_WEIGHT = max(HOUR_WEIGHTS)
+
+# Bookings made in the last RECENT_WINDOW may still be in flight
+RECENT_WINDOW = timedelta(hours=2)
+RECENT_STATUSES = ([BOOKING_STATUS_PENDING, BOOKING_STATUS_CONFIRMED, BOOKING_STATUS_IN_PROGRESS,
+                    BOOKING_STATUS_COMPLETED, BOOKING_STATUS_CANCELLED], [15, 15, 20, 40, 10])
+SETTLED_STATUSES = ([BOOKING_STATUS_COMPLETED, BOOKING_STATUS_CANCELLED], [85, 15])
+PAYMENT_METHOD_WEIGHTS = ([PAYMENT_CASH, PAYMENT_CARD, PAYMENT_QR, PAYMENT_WALLET], [45, 25, 20, 10])
+PAYMENT_STATUS_WEIGHTS = ([PAYMENT_COMPLETED, PAYMENT_PENDING, PAYMENT_FAILED], [95, 3, 2])
+DRIVER_STATUS_WEIGHTS = ([DRIVER_AVAILABLE, DRIVER_BUSY, DRIVER_OFFLINE], [50, 30, 20])
+
+BOOKING_COLUMNS = ('Booking_ID', 'Passenger_ID', 'Driver_ID', 'Pickup_Location', 'Destination', 'Status',
+                   'Fare', 'Distance_KM', 'Booking_Date', 'Completion_Date', 'Updated_At')
+PAYMENT_COLUMNS = ('Payment_ID', 'Booking_ID', 'Amount', 'Payment_Method', 'Payment_Status',
+                   'Payment_Date', 'Updated_At')
+
+
+def insert_rows(db, table_name, columns, rows):
+    """Write rows with multi-row INSERTs, committing each statement"""
+    per_statement = max(1, min(SEED_BATCH_SIZE, MAX_PARAMS_PER_STATEMENT // len(columns)))
+    row_placeholders = f"({', '.join(['%s'] * len(columns))})"
+    prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+    for start in range(0, len(rows), per_statement):
+        batch = rows[start:start + per_statement]
+        query = prefix + ', '.join([row_placeholders] * len(batch))
+        db.cursor.execute(query, [value for row in batch for value in row])
+        db.connection.commit()
+
+
+def next_id(db, table_name, id_column):
+    """First free primary key value (generated rows use explicit IDs)"""
+    result = db.fetch_one(f"SELECT MAX({id_column}) as max_id FROM {table_name}")
+    return (result['max_id'] or 0) + 1 if result else 1
+
+
+def license_plate(n):
+    """Unique plate for n, matching LICENSE_PLATE_PATTERN (e.g. BA12CD3456)"""
+    digits, n = n % 10000, n // 10000
+    series, n = n % 100, n // 100
+    letters = ''
+    for _ in range(4):
+        n, index = divmod(n, 26)
+        letters += chr(ord('A') + index)
+    return f"{letters[:2]}{series:02d}{letters[2:]}{digits:04d}"
+
+
+def random_name(rng):
+    return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+
+def seed_people(db, rng, passengers, drivers, days, now):
+    """
+    Insert passengers and drivers, each with a Login row, and a vehicle per driver
+
+    Returns:
+        tuple: (first passenger ID, first driver ID)
+    """
+    user_id = next_id(db, 'Login', 'User_ID')
+    first_passenger = passenger_id = next_id(db, 'Passengers', 'Passenger_ID')
+    first_driver = driver_id = next_id(db, 'Drivers', 'Driver_ID')
+    vehicle_id = next_id(db, 'Vehicles', 'Vehicle_ID')
+    password_hash = hash_password(SEED_PASSWORD)
+
+    def joined():
+        # Accounts exist before the bookings window starts
+        return now - timedelta(days=days + rng.uniform(0, 365))
+
+    logins, passenger_rows = [], []
+    for _ in range(passengers):
+        first, last = random_name(rng)
+        created = joined()
+        logins.append((user_id, f"{first}.{last}{passenger_id}".lower(), password_hash,
+                       USER_TYPE_PASSENGER, created))
+        passenger_rows.append((passenger_id, f"{first} {last}", f"{first}.{last}{passenger_id}@example.com".lower(),
+                               f"98{rng.randrange(10 ** 8):08d}", f"{rng.choice(LOCATIONS)}, Kathmandu",
+                               user_id, created))
+        user_id += 1
+        passenger_id += 1
+
+    driver_rows, vehicle_rows = [], []
+    for _ in range(drivers):
+        first, last = random_name(rng)
+        created = joined()
+        logins.append((user_id, f"{first}.{last}.driver{driver_id}".lower(), password_hash,
+                       USER_TYPE_DRIVER, created))
+        driver_rows.append((driver_id, f"{first} {last}", f"DL{driver_id:010d}", f"97{driver_id % 10 ** 8:08d}",
+                            f"driver{driver_id}@example.com", rng.choices(*DRIVER_STATUS_WEIGHTS)[0],
+                            user_id, created))
+        vehicle_rows.append((vehicle_id, rng.choice(VEHICLE_MODELS), license_plate(vehicle_id),
+                             rng.choice(VEHICLE_TYPES), rng.choice(VEHICLE_COLORS), rng.randint(2012, now.year),
+                             driver_id, created))
+        user_id += 1
+        driver_id += 1
+        vehicle_id += 1
+
+    insert_rows(db, 'Login', ('User_ID', 'Username', 'Password', 'User_Type', 'Created_At'), logins)
+    insert_rows(db, 'Passengers', ('Passenger_ID', 'Name', 'Email', 'Phone', 'Address', 'User_ID', 'Created_At'),
+                passenger_rows)
+    insert_rows(db, 'Drivers', ('Driver_ID', 'Name', 'License_Number', 'Phone', 'Email', 'Availability',
+                                'User_ID', 'Created_At'), driver_rows)
+    insert_rows(db, 'Vehicles', ('Vehicle_ID', 'Model', 'License_Plate', 'Vehicle_Type', 'Color', 'Year',
+                                 'Driver_ID', 'Created_At'), vehicle_rows)
+    return first_passenger, first_driver
+
+
+def booking_times(rng, count, start, end):
+    """count booking times in [start, end), following HOUR_WEIGHTS, oldest first"""
+    span = (end - start).total_seconds()
+    times = []
+    while len(times) < count:
+        moment = start + timedelta(seconds=rng.random() * span)
+        if rng.random() * PEAK_WEIGHT < HOUR_WEIGHTS[moment.hour]:
+            times.append(moment.replace(microsecond=0))
+    times.sort()
+    return times
+
+
+def generate_chunk(task):
+    """
+    Build one chunk of bookings and their payments
+
+    Booking IDs run from first_booking_id in booking-time order; a payment
+    takes the ID at the same offset from first_payment_id.
+
+    Returns:
+        tuple: (booking rows, payment rows)
+    """
+    (seed, first_booking_id, first_payment_id, count, start, end, now,
+     first_passenger, passengers, first_driver, drivers) = task
+    rng = random.Random(f"{seed}:{first_booking_id}")
+
+    bookings, payments = [], []
+    for offset, booked_at in enumerate(booking_times(rng, count, start, end)):
+        booking_id = first_booking_id + offset
+        if now - booked_at < RECENT_WINDOW:
+            status = rng.choices(*RECENT_STATUSES)[0]
+        else:
+            status = rng.choices(*SETTLED_STATUSES)[0]
+
+        pickup, destination = rng.sample(LOCATIONS, 2)
+        distance = round(min(80.0, max(0.5, rng.lognormvariate(1.8, 0.6))), 2)
+        fare = round(calculate_fare(distance), 2)
+
+        # Pending bookings, and most cancellations, never got a driver
+        driver_id = None
+        if status != BOOKING_STATUS_PENDING and not (status == BOOKING_STATUS_CANCELLED and rng.random() < 0.6):
+            driver_id = first_driver + rng.randrange(drivers)
+
+        completed_at = None
+        updated_at = booked_at
+        if status == BOOKING_STATUS_COMPLETED:
+            minutes = rng.uniform(3, 20) + distance / rng.uniform(20, 35) * 60
+            completed_at = booked_at + timedelta(minutes=minutes)
+            if completed_at > now:
+                status, completed_at = BOOKING_STATUS_IN_PROGRESS, None
+            else:
+                completed_at = completed_at.replace(microsecond=0)
+                updated_at = completed_at
+        elif status == BOOKING_STATUS_CANCELLED:
+            updated_at = min(now, booked_at + timedelta(minutes=rng.uniform(1, 15))).replace(microsecond=0)
+
+        bookings.append((booking_id, first_passenger + rng.randrange(passengers), driver_id, pickup, destination,
+                         status, fare, distance, booked_at, completed_at, updated_at))
+
+        if status == BOOKING_STATUS_COMPLETED:
+            paid_at = min(now, completed_at + timedelta(minutes=rng.uniform(0, 10))).replace(microsecond=0)
+            payments.append((first_payment_id + offset, booking_id, fare, rng.choices(*PAYMENT_METHOD_WEIGHTS)[0],
+                             rng.choices(*PAYMENT_STATUS_WEIGHTS)[0], paid_at, paid_at))
+
+    return bookings, payments
+
+
+_worker_db = None
+
+
+def _open_worker_db(backend):
+    """Pool initializer: one connection per worker process, to the seeded database"""
+    global _worker_db
+    from Db.base_db import BaseDB
+    _worker_db = BaseDB(backend)
+    if _worker_db.backend.name == 'mysql':
+        # Generated rows are consistent by construction; skip per-row checks
+        _worker_db.cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+
+
+def _seed_chunk(task):
+    """Worker side: generate and insert one chunk"""
+    bookings, payments = generate_chunk(task)
+    insert_rows(_worker_db, 'Bookings', BOOKING_COLUMNS, bookings)
+    insert_rows(_worker_db, 'Payments', PAYMENT_COLUMNS, payments)
+    return len(bookings), len(payments)
+
+
+class Seeder:
+    """Populates the database at a configurable scale"""
+
+    def __init__(self, db, seed=42, workers=SEED_WORKERS):
+        """
+        Initialize Seeder
+
+        Args:
+            db: Connected DatabaseCRUD instance
+            seed (int): Random seed, so runs are reproducible
+            workers (int): Processes generating and inserting bookings
+        """
+        self.db = db
+        self.seed = seed
+        self.workers = workers
+
+    def run(self, passengers, drivers, bookings, days):
+        """
+        Create the schema if needed and insert the generated data
+
+        Returns:
+            bool: True if every row was written
+        """
+        if not self.db.setup_database():
+            return False
+
+        now = datetime.now().replace(microsecond=0)
+        rng = random.Random(self.seed)
+        started = time.perf_counter()
+
+        try:
+            first_passenger, first_driver = seed_people(self.db, rng, passengers, drivers, days, now)
+        except self.db.Error as e:
+            self.db.connection.rollback()
+            print(f"Seeding people failed: {e}")
+            return False
+        print(f"Inserted {passengers} passengers and {drivers} drivers with vehicles "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        if not bookings:
+            return True
+        if not passengers or not drivers:
+            print("Bookings need at least one passenger and one driver")
+            return False
+
+        # Each chunk covers its share of the window in order, so IDs follow booking time
+        first_booking_id = next_id(self.db, 'Bookings', 'Booking_ID')
+        first_payment_id = next_id(self.db, 'Payments', 'Payment_ID')
+        window_start = now - timedelta(days=days)
+        window = now - window_start
+        tasks = []
+        for offset in range(0, bookings, CHUNK_SIZE):
+            count = min(CHUNK_SIZE, bookings - offset)
+            tasks.append((
+                self.seed, first_booking_id + offset, first_payment_id + offset, count,
+                window_start + window * offset / bookings, window_start + window * (offset + count) / bookings,
+                now, first_passenger, passengers, first_driver, drivers
+            ))
+
+        started = time.perf_counter()
+        booking_total = payment_total = 0
+        try:
+            with Pool(processes=self.workers, initializer=_open_worker_db, initargs=(self.db.backend,)) as pool:
+                for booking_count, payment_count in pool.imap_unordered(_seed_chunk, tasks):
+                    booking_total += booking_count
+                    payment_total += payment_count
+                    elapsed = time.perf_counter() - started
+                    print(f"  {booking_total}/{bookings} bookings, {payment_total} payments "
+                          f"({booking_total / elapsed:,.0f} bookings/s)")
+        except Exception as e:
+            print(f"Seeding bookings failed: {e}")
+            return False
+
+        print(f"Inserted {booking_total} bookings and {payment_total} payments "
+              f"in {time.perf_counter() - started:.1f}s")
+        return True
+
+
+if __name__ == "__main__":
+    import argparse
+    from Db.DatabaseCRUD import DatabaseCRUD
+
+    parser = argparse.ArgumentParser(description="Populate the database with synthetic data")
+    parser.add_argument('--passengers', type=int, default=10000)
+    parser.add_argument('--drivers', type=int, default=500)
+    parser.add_argument('--bookings', type=int, default=100000)
+    parser.add_argument('--days', type=int, default=365, help="spread bookings over the last N days")
+    parser.add_argument('--workers', type=int, default=SEED_WORKERS, help="processes inserting bookings")
+    parser.add_argument('--seed', type=int, default=42, help="random seed")
+    parser.add_argument('--rollup', action='store_true', help="rebuild the daily fact tables afterwards")
+    args = parser.parse_args()
+
+    try:
+        db = DatabaseCRUD()
+        seeded = Seeder(db, seed=args.seed, workers=args.workers).run(
+            args.passengers, args.drivers, args.bookings, args.days
+        )
+        if seeded and args.rollup:
+            from Db.rollup import RollupJob
+            RollupJob(db).run(full=True)
+        db.disconnect()
+    except Exception as e:
+        print(f"Seeding failed: {e}")
@@ -0,0 +1,30 @@
+# Models/BaseModel.py
+"""
+Base Model - Tuple-row hydration shared by the model classes
+
+Each model lists its table's columns in COLUMNS, in the order its
+from_tuple unpacks them; column_getter is the same for all of them.
+"""
+from operator import itemgetter
+
+
+class BaseModel:
+    """
+    Base class for models hydrated from tuple rows
+    """
+
+    __slots__ = ()
+
+    # Table columns, in from_tuple order
+    COLUMNS = ()
+
+    @classmethod
+    def column_getter(cls, column_names):
+        """
+        Build a getter that pulls COLUMNS out of a tuple row, in order
+
+        Resolve it once per query from the cursor's column_names and pass
+        it to from_tuple for every row.
+        """
+        positions = {name: i for i, name in enumerate(column_names)}
+        return itemgetter(*(positions[column] for column in cls.COLUMNS))
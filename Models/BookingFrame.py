@@ -0,0 +1,226 @@
+# Models/BookingFrame.py
+"""
+BookingFrame - Columnar view of the Bookings table for bulk analytics
+
+Reports that only count and sum bookings do not need one BookingModel per
+row. A BookingFrame keeps each column as a NumPy array (status and driver
+are dictionary-coded) so filters and group-bys run as vectorized array
+operations instead of Python loops.
+
+NumPy is optional: the rest of the application runs without it, and
+BookingFrame raises ImportError when it is missing.
+"""
+
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class BookingFrame:
+    """Booking columns as parallel NumPy arrays"""
+
+    # Columns read from the Bookings table, in SELECT order
+    COLUMNS = ('Booking_ID', 'Passenger_ID', 'Driver_ID', 'Status', 'Fare', 'Distance_KM', 'Booking_Date')
+
+    # Dictionary-coded columns that group_by() accepts
+    KEYS = ('status', 'driver')
+
+    def __init__(self, booking_id, passenger_id, status_codes, status_labels,
+                 driver_codes, driver_labels, fare, distance_km, booked_at):
+        """
+        Initialize BookingFrame from prepared arrays (use the from_* loaders)
+
+        Args:
+            booking_id, passenger_id: int64 arrays
+            status_codes, driver_codes: int32 arrays indexing the label tuples
+            status_labels, driver_labels (tuple): Distinct values (driver None = unassigned)
+            fare, distance_km: float64 arrays (NaN where NULL)
+            booked_at: int64 array of epoch seconds
+        """
+        if not HAS_NUMPY:
+            raise ImportError("BookingFrame requires numpy (pip install numpy)")
+        self.booking_id = booking_id
+        self.passenger_id = passenger_id
+        self.status_codes = status_codes
+        self.status_labels = status_labels
+        self.driver_codes = driver_codes
+        self.driver_labels = driver_labels
+        self.fare = fare
+        self.distance_km = distance_km
+        self.booked_at = booked_at
+
+    # -------------------- LOADERS -------------------- #
+
+    @staticmethod
+    def from_batches(batches):
+        """
+        Build a frame from (column_names, rows) batches, as yielded by BaseDB.iter_query
+
+        Rows are transposed batch by batch, so no BookingModel is created.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("BookingFrame requires numpy (pip install numpy)")
+
+        values = {column: [] for column in BookingFrame.COLUMNS}
+        for column_names, rows in batches:
+            if not rows:
+                continue
+            transposed = dict(zip(column_names, zip(*rows)))
+            for column in BookingFrame.COLUMNS:
+                values[column].extend(transposed[column])
+
+        status_codes, status_labels = BookingFrame._encode(values['Status'])
+        driver_codes, driver_labels = BookingFrame._encode(values['Driver_ID'])
+        return BookingFrame(
+            booking_id=np.array(values['Booking_ID'], dtype=np.int64),
+            passenger_id=np.array(values['Passenger_ID'], dtype=np.int64),
+            status_codes=status_codes,
+            status_labels=status_labels,
+            driver_codes=driver_codes,
+            driver_labels=driver_labels,
+            fare=BookingFrame._floats(values['Fare']),
+            distance_km=BookingFrame._floats(values['Distance_KM']),
+            booked_at=np.array(values['Booking_Date'], dtype='datetime64[s]').astype(np.int64)
+        )
+
+    @staticmethod
+    def from_rows(column_names, rows):
+        """Build a frame from tuple rows and their column names"""
+        return BookingFrame.from_batches([(column_names, rows)])
+
+    @staticmethod
+    def from_cursor(cursor, batch_size=1000):
+        """Build a frame from an executed (tuple) cursor, reading it in batches"""
+        column_names = tuple(cursor.column_names)
+
+        def batches():
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield column_names, rows
+
+        return BookingFrame.from_batches(batches())
+
+    @staticmethod
+    def _encode(values):
+        """Dictionary-code a column: (int32 codes, tuple of distinct values)"""
+        labels = {}
+        codes = np.fromiter(
+            (labels.setdefault(value, len(labels)) for value in values),
+            dtype=np.int32, count=len(values)
+        )
+        return codes, tuple(labels)
+
+    @staticmethod
+    def _floats(values):
+        """Convert DECIMAL/None values to a float64 array with NaN for NULL"""
+        return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+    # -------------------- FILTERS -------------------- #
+
+    def __len__(self):
+        return len(self.booking_id)
+
+    def status_mask(self, *statuses):
+        """Boolean mask of rows whose status is one of statuses"""
+        wanted = [code for code, label in enumerate(self.status_labels) if label in statuses]
+        return np.isin(self.status_codes, wanted)
+
+    def driver_mask(self, assigned=True):
+        """Boolean mask of rows with (or without) an assigned driver"""
+        if None not in self.driver_labels:
+            return np.full(len(self), assigned)
+        unassigned = self.driver_codes == self.driver_labels.index(None)
+        return ~unassigned if assigned else unassigned
+
+    def date_mask(self, start=None, end=None):
+        """Boolean mask of rows booked in [start, end)"""
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.booked_at >= self._epoch(start)
+        if end is not None:
+            mask &= self.booked_at < self._epoch(end)
+        return mask
+
+    def filter(self, mask):
+        """Get a new frame with only the rows selected by mask"""
+        return BookingFrame(
+            self.booking_id[mask], self.passenger_id[mask],
+            self.status_codes[mask], self.status_labels,
+            self.driver_codes[mask], self.driver_labels,
+            self.fare[mask], self.distance_km[mask], self.booked_at[mask]
+        )
+
+    @staticmethod
+    def _epoch(value):
+        """Convert a datetime to the epoch seconds used by booked_at"""
+        if isinstance(value, datetime):
+            value = np.datetime64(value, 's')
+        return np.datetime64(value, 's').astype(np.int64)
+
+    # -------------------- AGGREGATES -------------------- #
+
+    def total(self, column):
+        """Sum a float column ('fare' or 'distance_km'), ignoring NULLs"""
+        return float(np.nansum(getattr(self, column)))
+
+    def count_by(self, key):
+        """
+        Count rows per distinct status or driver
+
+        Returns:
+            dict: label -> count (labels with no rows are left out)
+        """
+        codes, labels = self._key_arrays(key)
+        counts = np.bincount(codes, minlength=len(labels))
+        return {labels[i]: int(count) for i, count in enumerate(counts) if count}
+
+    def sum_by(self, key, column):
+        """
+        Sum a float column per distinct status or driver, ignoring NULLs
+
+        Returns:
+            dict: label -> total (labels with no rows are left out)
+        """
+        codes, labels = self._key_arrays(key)
+        values = getattr(self, column)
+        counts = np.bincount(codes, minlength=len(labels))
+        totals = np.bincount(codes, weights=np.nan_to_num(values), minlength=len(labels))
+        return {labels[i]: float(totals[i]) for i, count in enumerate(counts) if count}
+
+    def group_by(self, key):
+        """
+        Trips, fare and distance per distinct status or driver
+
+        Returns:
+            dict: label -> {'count', 'fare', 'distance_km'}
+        """
+        counts = self.count_by(key)
+        fares = self.sum_by(key, 'fare')
+        distances = self.sum_by(key, 'distance_km')
+        return {
+            label: {'count': count, 'fare': fares[label], 'distance_km': distances[label]}
+            for label, count in counts.items()
+        }
+
+    def _key_arrays(self, key):
+        """Get the (codes, labels) pair for a group-by key"""
+        if key == 'status':
+            return self.status_codes, self.status_labels
+        if key == 'driver':
+            return self.driver_codes, self.driver_labels
+        raise ValueError(f"Unknown group key {key!r}. Must be one of: {', '.join(self.KEYS)}")
+
+    def __str__(self):
+        """String representation"""
+        return f"BookingFrame(rows={len(self)})"
+
+    def __repr__(self):
+        """Developer representation"""
+        return self.__str__()
@@ -1,8 +1,16 @@
 from datetime import datetime
+from Models.BaseModel import BaseModel
 from config import (BOOKING_STATUS_PENDING,BOOKING_STATUS_CONFIRMED,BOOKING_STATUS_IN_PROGRESS,BOOKING_STATUS_COMPLETED,BOOKING_STATUS_CANCELLED,calculate_fare,CURRENCY_SYMBOL
 )
 
-class BookingModel:
+class BookingModel(BaseModel):
+
+    __slots__ = ('booking_id', 'passenger_id', 'driver_id', 'pickup_location', 'destination',
+                 'status', 'fare', 'distance_km', 'booking_date', 'completion_date')
+
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('Booking_ID', 'Passenger_ID', 'Driver_ID', 'Pickup_Location', 'Destination',
+               'Status', 'Fare', 'Distance_KM', 'Booking_Date', 'Completion_Date')
 
     def __init__(self, booking_id=None, passenger_id=None, driver_id=None,
                  pickup_location=None, destination=None, status=None,
@@ -27,6 +35,8 @@ class BookingModel:
         """
         if not row:
             return None
+        fare = row.get('Fare')
+        distance_km = row.get('Distance_KM')
         return BookingModel(
             booking_id=row.get('Booking_ID'),
             passenger_id=row.get('Passenger_ID'),
@@ -34,11 +44,25 @@ class BookingModel:
             pickup_location=row.get('Pickup_Location'),
             destination=row.get('Destination'),
             status=row.get('Status'),
-            fare=float(row.get('Fare')) if row.get('Fare') else None,
-            distance_km=float(row.get('Distance_KM')) if row.get('Distance_KM') else None,
+            fare=float(fare) if fare else None,
+            distance_km=float(distance_km) if distance_km else None,
             booking_date=row.get('Booking_Date'),
             completion_date=row.get('Completion_Date')
         )
+    
+    @staticmethod
+    def from_tuple(row, getter):
+        """
+        Create BookingModel instance from a tuple row and a column_getter()
+        """
+        (booking_id, passenger_id, driver_id, pickup_location, destination,
+         status, fare, distance_km, booking_date, completion_date) = getter(row)
+        return BookingModel(
+            booking_id, passenger_id, driver_id, pickup_location, destination, status,
+            float(fare) if fare else None,
+            float(distance_km) if distance_km else None,
+            booking_date, completion_date
+        )
     def to_dict(self):
         """
         Convert model to dictionary
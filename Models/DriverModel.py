@@ -1,8 +1,16 @@
 from datetime import datetime
+from Models.BaseModel import BaseModel
 from config import DRIVER_AVAILABLE, DRIVER_BUSY, DRIVER_OFFLINE
 
 
-class DriverModel:
+class DriverModel(BaseModel):
+    
+    __slots__ = ('driver_id', 'name', 'license_number', 'phone', 'email',
+                 'availability', 'user_id', 'created_at')
+    
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('Driver_ID', 'Name', 'License_Number', 'Phone', 'Email',
+               'Availability', 'User_ID', 'Created_At')
     
     def __init__(self, driver_id=None, name=None, license_number=None,
                  phone=None, email=None, availability=None, 
@@ -34,6 +42,11 @@ class DriverModel:
             created_at=row.get('Created_At')
         )
     
+    @staticmethod
+    def from_tuple(row, getter):
+        """Create DriverModel instance from a tuple row and a column_getter()"""
+        return DriverModel(*getter(row))
+    
     def to_dict(self):
 
         return {
@@ -1,9 +1,15 @@
 from datetime import datetime
+from Models.BaseModel import BaseModel
 
 
-class PassengerModel:
+class PassengerModel(BaseModel):
     """Passenger model."""
     
+    __slots__ = ('passenger_id', 'name', 'email', 'phone', 'address', 'user_id', 'created_at')
+    
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('Passenger_ID', 'Name', 'Email', 'Phone', 'Address', 'User_ID', 'Created_At')
+    
     def __init__(self, passenger_id=None, name=None, email=None, 
                  phone=None, address=None, user_id=None, created_at=None):
         """Initialize passenger model."""
@@ -31,6 +37,11 @@ class PassengerModel:
             created_at=row.get('Created_At')
         )
     
+    @staticmethod
+    def from_tuple(row, getter):
+        """Create model instance from a tuple row and a column_getter()."""
+        return PassengerModel(*getter(row))
+    
     def to_dict(self):
         """Convert model to dictionary."""
         return {
@@ -4,6 +4,7 @@ Payment Model - Represents Payments table
 """
 
 from datetime import datetime
+from Models.BaseModel import BaseModel
 from config import (
     PAYMENT_CASH,
     PAYMENT_PENDING,
@@ -13,11 +14,18 @@ from config import (
 )
 
 
-class PaymentModel:
+class PaymentModel(BaseModel):
     """
     Represents a payment transaction in the system
     """
     
+    __slots__ = ('payment_id', 'booking_id', 'amount', 'payment_method',
+                 'payment_status', 'payment_date')
+    
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('Payment_ID', 'Booking_ID', 'Amount', 'Payment_Method',
+               'Payment_Status', 'Payment_Date')
+    
     def __init__(self, payment_id=None, booking_id=None, amount=None,
                  payment_method=None, payment_status=None, payment_date=None):
         """
@@ -38,15 +46,27 @@ class PaymentModel:
         if not row:
             return None
         
+        amount = row.get('Amount')
         return PaymentModel(
             payment_id=row.get('Payment_ID'),
             booking_id=row.get('Booking_ID'),
-            amount=float(row.get('Amount')) if row.get('Amount') else None,
+            amount=float(amount) if amount else None,
             payment_method=row.get('Payment_Method'),
             payment_status=row.get('Payment_Status'),
             payment_date=row.get('Payment_Date')
         )
     
+    @staticmethod
+    def from_tuple(row, getter):
+        """
+        Create PaymentModel instance from a tuple row and a column_getter()
+        """
+        payment_id, booking_id, amount, payment_method, payment_status, payment_date = getter(row)
+        return PaymentModel(
+            payment_id, booking_id, float(amount) if amount else None,
+            payment_method, payment_status, payment_date
+        )
+    
     def to_dict(self):
         """
         Convert model to dictionary
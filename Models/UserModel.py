@@ -1,11 +1,15 @@
 # Models/UserModel.py
 """User Model - Represents Login table Handles user authentication data"""
 from datetime import datetime
+from Models.BaseModel import BaseModel
 from config import USER_TYPES
-class UserModel:
+class UserModel(BaseModel):
     """
     Represents a user in the Login table
     """    
+    __slots__ = ('user_id', 'username', 'password', 'user_type', 'created_at')
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('User_ID', 'Username', 'Password', 'User_Type', 'Created_At')
     def __init__(self, user_id=None, username=None, password=None, 
                  user_type=None, created_at=None):
         """Initialize User Model"""
@@ -26,6 +30,10 @@ class UserModel:
             user_type=row.get('User_Type'),
             created_at=row.get('Created_At')
         )   
+    @staticmethod
+    def from_tuple(row, getter):
+        """Create UserModel instance from a tuple row and a column_getter()"""
+        return UserModel(*getter(row))
     def to_dict(self):
         """
         Convert model to dictionary
@@ -4,14 +4,22 @@ Vehicle Model - Represents Vehicles table
 """
 
 from datetime import datetime
+from Models.BaseModel import BaseModel
 from config import VEHICLE_SEDAN
 
 
-class VehicleModel:
+class VehicleModel(BaseModel):
     """
     Represents a vehicle in the system
     """
     
+    __slots__ = ('vehicle_id', 'model', 'license_plate', 'vehicle_type', 'color',
+                 'year', 'driver_id', 'created_at')
+    
+    # Table columns in __init__ argument order, used for positional hydration
+    COLUMNS = ('Vehicle_ID', 'Model', 'License_Plate', 'Vehicle_Type', 'Color',
+               'Year', 'Driver_ID', 'Created_At')
+    
     def __init__(self, vehicle_id=None, model=None, license_plate=None,
                  vehicle_type=None, color=None, year=None, 
                  driver_id=None, created_at=None):
@@ -62,6 +70,20 @@ class VehicleModel:
             created_at=row.get('Created_At')
         )
     
+    @staticmethod
+    def from_tuple(row, getter):
+        """
+        Create VehicleModel instance from a tuple row
+        
+        Args:
+            row (tuple): Database row as tuple
+            getter (callable): Result of column_getter for the query
+            
+        Returns:
+            VehicleModel: Vehicle model instance
+        """
+        return VehicleModel(*getter(row))
+    
     def to_dict(self):
         """
         Convert model to dictionary
@@ -2,20 +2,29 @@
 """
 Models Package
 Contains all data model classes for the Taxi Booking System
+
+Models are imported on first access (PEP 562).
 """
 
-from Models.UserModel import UserModel
-from Models.PassengerModel import PassengerModel
-from Models.DriverModel import DriverModel
-from Models.VehicleModel import VehicleModel
-from Models.BookingModel import BookingModel
-from Models.PaymentModel import PaymentModel
+import importlib
+
+_MODEL_MODULES = {
+    'UserModel': 'Models.UserModel',
+    'PassengerModel': 'Models.PassengerModel',
+    'DriverModel': 'Models.DriverModel',
+    'VehicleModel': 'Models.VehicleModel',
+    'BookingModel': 'Models.BookingModel',
+    'PaymentModel': 'Models.PaymentModel',
+    'BookingFrame': 'Models.BookingFrame'
+}
+
+__all__ = list(_MODEL_MODULES)
+
 
-__all__ = [
-    'UserModel',
-    'PassengerModel',
-    'DriverModel',
-    'VehicleModel',
-    'BookingModel',
-    'PaymentModel'
-]
\ No newline at end of file
+def __getattr__(name):
+    """Import a model class the first time it is accessed"""
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODEL_MODULES[name]), name)
+    globals()[name] = value
+    return value
@@ -3,14 +3,14 @@
 Admin Dashboard - Main interface for administrators
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from Controllers.UserController import UserController
-from Controllers.PassengerController import PassengerController
-from Controllers.DriverController import DriverController
-from Controllers.VehicleController import VehicleController
-from Controllers.BookingController import BookingController
-from Controllers.PaymentController import PaymentController
+from Controllers.ServiceRegistry import ServiceRegistry
+from Controllers.EventBus import BookingEvent, PaymentCompleted
+from UI.screen_timing import time_screens, bind_diagnostics
+from UI.live_updates import LiveUpdatesMixin
+from profiling import profile_methods, profiled
 from config import (
     DASHBOARD_WIDTH,
     DASHBOARD_HEIGHT,
@@ -21,10 +21,12 @@ from config import (
     TEXT_LIGHT,
     TEXT_PRIMARY,
     TEXT_SECONDARY,
+    BG_LIGHT,
     SIDEBAR_BG,
     FONT_LARGE_HEADING,
     FONT_LARGE,
     FONT_MEDIUM,
+    FONT_MEDIUM_BOLD,
     PADDING_LARGE,
     PADDING_MEDIUM,
     BTN_PRIMARY,
@@ -33,6 +35,7 @@ from config import (
     BTN_WARNING,
     INPUT_BG,
     CURRENCY_SYMBOL,
+    QUERY_STATS_REPORT_LIMIT,
     validate_email,
     validate_phone,
     validate_license,
@@ -45,11 +48,15 @@ from config import (
     BOOKING_STATUS_IN_PROGRESS,
     BOOKING_STATUS_COMPLETED,
     BOOKING_STATUS_CANCELLED,
-    BOOKING_STATUSES
+    BOOKING_STATUSES,
+    REPORT_BUCKETS,
+    REPORT_BUCKET_WINDOWS
 )
 
 
-class AdminDashboard:
+@profile_methods
+@time_screens
+class AdminDashboard(LiveUpdatesMixin):
     """
     Admin Dashboard - Complete management interface
     """
@@ -63,22 +70,42 @@ class AdminDashboard:
             user: Logged in user object
             login_root: Login window reference
         """
+        super().__init__()
         self.root = root
         self.user = user
         self.login_root = login_root
         
-        # Initialize controllers
-        self.user_ctrl = UserController()
-        self.passenger_ctrl = PassengerController()
-        self.driver_ctrl = DriverController()
-        self.vehicle_ctrl = VehicleController()
-        self.booking_ctrl = BookingController()
-        self.payment_ctrl = PaymentController()
+        # Controllers are created on first use and share one connection
+        self.services = ServiceRegistry()
         
         self.setup_window()
         self.create_layout()
         self.show_dashboard_home()
     
+    @property
+    def user_ctrl(self):
+        return self.services.get('user')
+    
+    @property
+    def passenger_ctrl(self):
+        return self.services.get('passenger')
+    
+    @property
+    def driver_ctrl(self):
+        return self.services.get('driver')
+    
+    @property
+    def vehicle_ctrl(self):
+        return self.services.get('vehicle')
+    
+    @property
+    def booking_ctrl(self):
+        return self.services.get('booking')
+    
+    @property
+    def payment_ctrl(self):
+        return self.services.get('payment')
+    
     def setup_window(self):
         """Configure the dashboard window"""
         self.root.title("Taxi Booking System - Admin Dashboard")
@@ -94,6 +121,9 @@ class AdminDashboard:
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Hidden screen-timing panel
+        bind_diagnostics(self.root)
     
     def create_layout(self):
         """Create main dashboard layout"""
@@ -182,8 +212,10 @@ class AdminDashboard:
     
     def clear_content(self):
         """Clear the content area"""
+        self.unsubscribe_all()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.services.begin_unit_of_work()
     
     def show_dashboard_home(self):
         """Show dashboard home with statistics"""
@@ -287,8 +319,10 @@ class AdminDashboard:
         )
         search_entry.pack(side='left', padx=(0, PADDING_MEDIUM))
         
+        @profiled
         def refresh_passengers():
             """Refresh passenger list"""
+            self.services.begin_unit_of_work()
             search_term = search_entry.get().strip()
             if search_term:
                 passengers = self.passenger_ctrl.search_passengers(search_term)
@@ -409,6 +443,7 @@ class AdminDashboard:
         action_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
         action_frame.pack(fill='x', padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
         
+        @profiled
         def view_passenger():
             """View passenger details"""
             selected = tree.selection()
@@ -441,6 +476,7 @@ class AdminDashboard:
                 )
                 messagebox.showinfo("Passenger Details", details)
         
+        @profiled
         def edit_passenger():
             """Edit passenger"""
             selected = tree.selection()
@@ -452,6 +488,7 @@ class AdminDashboard:
             passenger_id = item['values'][0]
             self.edit_passenger_dialog(passenger_id)
         
+        @profiled
         def delete_passenger():
             """Delete passenger"""
             selected = tree.selection()
@@ -568,6 +605,7 @@ class AdminDashboard:
         
         form_frame.columnconfigure(1, weight=1)
         
+        @profiled
         def save_passenger():
             name = name_entry.get().strip()
             email = email_entry.get().strip()
@@ -685,6 +723,7 @@ class AdminDashboard:
         
         form_frame.columnconfigure(1, weight=1)
         
+        @profiled
         def update_passenger():
             name = name_entry.get().strip()
             email = email_entry.get().strip()
@@ -825,8 +864,10 @@ class AdminDashboard:
         
         tree.pack(side='left', fill='both', expand=True)
         
+        @profiled
         def refresh_drivers():
             """Refresh driver list"""
+            self.services.begin_unit_of_work()
             search_term = search_entry.get().strip()
             if search_term:
                 drivers = self.driver_ctrl.search_drivers(search_term)
@@ -837,25 +878,41 @@ class AdminDashboard:
             for item in tree.get_children():
                 tree.delete(item)
             
-            # Populate tree
+            # Populate tree (row iid = driver ID so polled changes can patch single rows)
             for driver in drivers:
-                from datetime import datetime
-                created_date = ""
-                if driver.created_at:
-                    if isinstance(driver.created_at, datetime):
-                        created_date = driver.created_at.strftime("%d-%m-%Y")
-                    else:
-                        created_date = str(driver.created_at)[:10]
-                
-                tree.insert('', 'end', values=(
-                    driver.driver_id,
-                    driver.name or "",
-                    driver.license_number or "",
-                    driver.phone or "",
-                    driver.email or "N/A",
-                    driver.availability or "N/A",
-                    created_date
-                ))
+                tree.insert('', 'end', iid=str(driver.driver_id), values=driver_values(driver))
+        
+        def driver_values(driver):
+            """Build the table row for one driver"""
+            from datetime import datetime
+            created_date = ""
+            if driver.created_at:
+                if isinstance(driver.created_at, datetime):
+                    created_date = driver.created_at.strftime("%d-%m-%Y")
+                else:
+                    created_date = str(driver.created_at)[:10]
+            
+            return (
+                driver.driver_id,
+                driver.name or "",
+                driver.license_number or "",
+                driver.phone or "",
+                driver.email or "N/A",
+                driver.availability or "N/A",
+                created_date
+            )
+        
+        def patch_driver(driver):
+            """Update a changed driver's row (new drivers only while not searching)"""
+            if not tree.winfo_exists():
+                return
+            iid = str(driver.driver_id)
+            if tree.exists(iid):
+                tree.item(iid, values=driver_values(driver))
+            elif not search_entry.get().strip():
+                tree.insert('', 0, iid=iid, values=driver_values(driver))
+        
+        self.poll_changes('driver', 'get_drivers_changed_since', patch_driver)
         
         search_btn = tk.Button(
             search_frame,
@@ -906,6 +963,7 @@ class AdminDashboard:
         action_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
         action_frame.pack(fill='x', padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
         
+        @profiled
         def view_driver():
             """View driver details"""
             selected = tree.selection()
@@ -939,6 +997,7 @@ class AdminDashboard:
                 )
                 messagebox.showinfo("Driver Details", details)
         
+        @profiled
         def edit_driver():
             """Edit driver"""
             selected = tree.selection()
@@ -950,6 +1009,7 @@ class AdminDashboard:
             driver_id = item['values'][0]
             self.edit_driver_dialog(driver_id)
         
+        @profiled
         def delete_driver():
             """Delete driver"""
             selected = tree.selection()
@@ -1072,6 +1132,7 @@ class AdminDashboard:
         
         form_frame.columnconfigure(1, weight=1)
         
+        @profiled
         def save_driver():
             name = name_entry.get().strip()
             license_number = license_entry.get().strip()
@@ -1200,6 +1261,7 @@ class AdminDashboard:
         
         form_frame.columnconfigure(1, weight=1)
         
+        @profiled
         def update_driver():
             name = name_entry.get().strip()
             license_number = license_entry.get().strip()
@@ -1313,6 +1375,20 @@ class AdminDashboard:
         )
         status_combo.pack(side='left', padx=(0, PADDING_MEDIUM))
         
+        # Archived bookings are only read on request
+        history_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            filter_frame,
+            text="Include archived",
+            variable=history_var,
+            command=lambda: refresh_bookings(),
+            font=FONT_MEDIUM,
+            bg=BG_COLOR,
+            fg=TEXT_PRIMARY,
+            selectcolor=BG_COLOR,
+            activebackground=BG_COLOR
+        ).pack(side='left', padx=(0, PADDING_MEDIUM))
+        
         # Table frame with scrollbars
         table_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
         table_frame.pack(fill='both', expand=True, padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
@@ -1359,60 +1435,92 @@ class AdminDashboard:
         
         tree.pack(side='left', fill='both', expand=True)
         
+        @profiled
         def refresh_bookings():
             """Refresh booking list"""
+            self.services.begin_unit_of_work()
             status_filter = status_var.get()
             
+            include_history = history_var.get()
+            
             if status_filter == "All":
-                bookings = self.booking_ctrl.get_all_bookings()
+                bookings = self.booking_ctrl.get_all_bookings(include_history=include_history)
             else:
-                bookings = self.booking_ctrl.get_bookings_by_status(status_filter)
+                bookings = self.booking_ctrl.get_bookings_by_status(status_filter, include_history=include_history)
             
             # Clear existing items
             for item in tree.get_children():
                 tree.delete(item)
             
-            # Populate tree
+            # Populate tree (row iid = booking ID so events can patch single rows)
             for booking in bookings:
-                from datetime import datetime
-                
-                # Get passenger name
-                passenger_name = "N/A"
-                if booking.passenger_id:
-                    passenger = self.passenger_ctrl.get_passenger_by_id(booking.passenger_id)
-                    if passenger:
-                        passenger_name = passenger.name or "N/A"
-                
-                # Get driver name
-                driver_name = "Not Assigned"
-                if booking.driver_id:
-                    driver = self.driver_ctrl.get_driver_by_id(booking.driver_id)
-                    if driver:
-                        driver_name = driver.name or "N/A"
-                
-                # Format date
-                booking_date = ""
-                if booking.booking_date:
-                    if isinstance(booking.booking_date, datetime):
-                        booking_date = booking.booking_date.strftime("%d-%m-%Y %H:%M")
-                    else:
-                        booking_date = str(booking.booking_date)[:16]
-                
-                # Format fare
-                fare_str = "N/A"
-                if booking.fare:
-                    fare_str = f"{CURRENCY_SYMBOL} {booking.fare:.2f}"
-                
-                tree.insert('', 'end', values=(
-                    booking.booking_id,
-                    passenger_name,
-                    driver_name,
-                    booking.pickup_location or "N/A",
-                    booking.destination or "N/A",
-                    booking.status or "N/A",
-                    fare_str,
-                    booking_date
-                ))
+                tree.insert('', 'end', iid=str(booking.booking_id), values=booking_values(booking))
+        
+        def booking_values(booking):
+            """Build the table row for one booking"""
+            from datetime import datetime
+            
+            # Get passenger name
+            passenger_name = "N/A"
+            if booking.passenger_id:
+                passenger = self.passenger_ctrl.get_passenger_by_id(booking.passenger_id)
+                if passenger:
+                    passenger_name = passenger.name or "N/A"
+            
+            # Get driver name
+            driver_name = "Not Assigned"
+            if booking.driver_id:
+                driver = self.driver_ctrl.get_driver_by_id(booking.driver_id)
+                if driver:
+                    driver_name = driver.name or "N/A"
+            
+            # Format date
+            booking_date = ""
+            if booking.booking_date:
+                if isinstance(booking.booking_date, datetime):
+                    booking_date = booking.booking_date.strftime("%d-%m-%Y %H:%M")
+                else:
+                    booking_date = str(booking.booking_date)[:16]
+            
+            # Format fare
+            fare_str = "N/A"
+            if booking.fare:
+                fare_str = f"{CURRENCY_SYMBOL} {booking.fare:.2f}"
+            
+            return (
+                booking.booking_id,
+                passenger_name,
+                driver_name,
+                booking.pickup_location or "N/A",
+                booking.destination or "N/A",
+                booking.status or "N/A",
+                fare_str,
+                booking_date
+            )
+        
+        def patch_row(booking_id, booking):
+            """Update, add or drop just one booking's row"""
+            if not tree.winfo_exists():
+                return
+            iid = str(booking_id)
+            status_filter = status_var.get()
+            if booking is None or status_filter not in ("All", booking.status):
+                if tree.exists(iid):
+                    tree.delete(iid)
+            elif tree.exists(iid):
+                tree.item(iid, values=booking_values(booking))
+            else:
+                tree.insert('', 0, iid=iid, values=booking_values(booking))
+        
+        def patch_booking(event):
+            """Patch the booking an event is about"""
+            if tree.winfo_exists():
+                patch_row(event.booking_id, self.booking_ctrl.get_booking_by_id(event.booking_id))
+        
+        # Changes made here arrive as events, changes by other sessions via polling
+        self.subscribe(BookingEvent, patch_booking)
+        self.poll_changes('booking', 'get_bookings_changed_since',
+                          lambda booking: patch_row(booking.booking_id, booking))
         
         refresh_btn = tk.Button(
             filter_frame,
@@ -1435,6 +1543,7 @@ class AdminDashboard:
         action_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
         action_frame.pack(fill='x', padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
         
+        @profiled
         def view_booking():
             """View booking details"""
             selected = tree.selection()
@@ -1500,6 +1609,7 @@ class AdminDashboard:
                 )
                 messagebox.showinfo("Booking Details", details)
         
+        @profiled
         def assign_driver():
             """Assign driver to booking"""
             selected = tree.selection()
@@ -1588,6 +1698,7 @@ class AdminDashboard:
             
             driver_combo.pack(pady=5)
             
+            @profiled
             def save_assignment():
                 if not driver_var.get():
                     messagebox.showerror("Error", "Please select a driver!")
@@ -1599,9 +1710,9 @@ class AdminDashboard:
                 success, message = self.booking_ctrl.assign_driver(booking_id, driver_id)
                 
                 if success:
+                    # The row is patched by the BookingAssigned event
                     messagebox.showinfo("Success", message)
                     dialog.destroy()
-                    refresh_bookings()
                 else:
                     messagebox.showerror("Error", f"Failed to assign driver: {message}")
             
@@ -1634,6 +1745,7 @@ class AdminDashboard:
                 pady=8
             ).pack(side='right', padx=5)
         
+        @profiled
         def update_status():
             """Update booking status"""
             selected = tree.selection()
@@ -1697,14 +1809,15 @@ class AdminDashboard:
             )
             status_combo_dialog.pack(pady=5)
             
+            @profiled
             def save_status():
                 new_status = status_var_dialog.get()
                 success, message = self.booking_ctrl.update_booking_status(booking_id, new_status)
                 
                 if success:
+                    # The row is patched by the BookingStatusChanged event
                     messagebox.showinfo("Success", message)
                     dialog.destroy()
-                    refresh_bookings()
                 else:
                     messagebox.showerror("Error", f"Failed to update status: {message}")
             
@@ -1860,8 +1973,10 @@ class AdminDashboard:
 
         tree.pack(side='left', fill='both', expand=True)
 
+        @profiled
         def refresh_payments():
             """Load and display payments based on selected status."""
+            self.services.begin_unit_of_work()
             for item in tree.get_children():
                 tree.delete(item)
 
@@ -1870,43 +1985,66 @@ class AdminDashboard:
             # Load all payments, then filter in memory to avoid changing controller API
             payments = self.payment_ctrl.get_all_payments()
 
-            from datetime import datetime
-
             for payment in payments:
                 # Filter by status if needed
                 if selected_status != "All" and payment.payment_status != selected_status:
                     continue
 
-                booking = self.booking_ctrl.get_booking_by_id(payment.booking_id)
-                passenger_name = "N/A"
+                tree.insert('', 'end', iid=str(payment.payment_id), values=payment_values(payment))
 
-                if booking and booking.passenger_id:
-                    passenger = self.passenger_ctrl.get_passenger_by_id(booking.passenger_id)
-                    if passenger and passenger.name:
-                        passenger_name = passenger.name
+        def payment_values(payment):
+            """Build the table row for one payment"""
+            from datetime import datetime
 
-                date_text = ""
-                if payment.payment_date:
-                    if isinstance(payment.payment_date, datetime):
-                        date_text = payment.payment_date.strftime("%d-%m-%Y %H:%M")
-                    else:
-                        date_text = str(payment.payment_date)[:16]
-
-                amount_text = payment.get_formatted_amount() if hasattr(payment, "get_formatted_amount") else f"{CURRENCY_SYMBOL} {payment.amount:.2f}"
-
-                tree.insert(
-                    '',
-                    'end',
-                    values=(
-                        payment.payment_id,
-                        payment.booking_id,
-                        passenger_name,
-                        amount_text,
-                        payment.payment_method,
-                        payment.payment_status,
-                        date_text,
-                    ),
-                )
+            booking = self.booking_ctrl.get_booking_by_id(payment.booking_id)
+            passenger_name = "N/A"
+
+            if booking and booking.passenger_id:
+                passenger = self.passenger_ctrl.get_passenger_by_id(booking.passenger_id)
+                if passenger and passenger.name:
+                    passenger_name = passenger.name
+
+            date_text = ""
+            if payment.payment_date:
+                if isinstance(payment.payment_date, datetime):
+                    date_text = payment.payment_date.strftime("%d-%m-%Y %H:%M")
+                else:
+                    date_text = str(payment.payment_date)[:16]
+
+            amount_text = payment.get_formatted_amount() if hasattr(payment, "get_formatted_amount") else f"{CURRENCY_SYMBOL} {payment.amount:.2f}"
+
+            return (
+                payment.payment_id,
+                payment.booking_id,
+                passenger_name,
+                amount_text,
+                payment.payment_method,
+                payment.payment_status,
+                date_text,
+            )
+
+        def patch_row(payment_id, payment):
+            """Update, add or drop just one payment's row"""
+            if not tree.winfo_exists():
+                return
+            iid = str(payment_id)
+            if payment is None or status_var.get() not in ("All", payment.payment_status):
+                if tree.exists(iid):
+                    tree.delete(iid)
+            elif tree.exists(iid):
+                tree.item(iid, values=payment_values(payment))
+            else:
+                tree.insert('', 0, iid=iid, values=payment_values(payment))
+
+        def patch_payment(event):
+            """Show a newly completed payment without reloading the table"""
+            if tree.winfo_exists():
+                patch_row(event.payment_id, self.payment_ctrl.get_payment_by_id(event.payment_id))
+
+        # Changes made here arrive as events, changes by other sessions via polling
+        self.subscribe(PaymentCompleted, patch_payment)
+        self.poll_changes('payment', 'get_payments_changed_since',
+                          lambda payment: patch_row(payment.payment_id, payment))
 
         # Controls on filter frame
         refresh_btn = tk.Button(
@@ -1931,12 +2069,90 @@ class AdminDashboard:
     def show_settings(self):
         """Show settings interface"""
         self.clear_content()
+        
+        # Header
         tk.Label(
             self.content_frame,
-            text="🚧 Settings - Coming Soon",
+            text="⚙️ Settings",
             font=FONT_LARGE_HEADING,
-            bg=BG_COLOR
-        ).pack(expand=True)
+            bg=BG_COLOR,
+            fg=TEXT_PRIMARY
+        ).pack(pady=PADDING_LARGE, padx=PADDING_LARGE, anchor='w')
+        
+        from Db.query_stats import query_stats
+        from profiling import profiler
+        
+        # Diagnostics (apply immediately, for this session only)
+        section = tk.Frame(self.content_frame, bg=BG_LIGHT, relief='solid', borderwidth=1)
+        section.pack(fill='x', padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
+        
+        tk.Label(
+            section,
+            text="Diagnostics",
+            font=FONT_MEDIUM_BOLD,
+            bg=BG_LIGHT,
+            fg=TEXT_PRIMARY
+        ).pack(anchor='w', padx=PADDING_LARGE, pady=(PADDING_LARGE, PADDING_MEDIUM))
+        
+        profile_var = tk.BooleanVar(value=profiler.enabled)
+        memory_var = tk.BooleanVar(value=profiler.trace_memory)
+        query_stats_var = tk.BooleanVar(value=query_stats.enabled)
+        
+        status_label = tk.Label(
+            section,
+            font=FONT_MEDIUM,
+            bg=BG_LIGHT,
+            fg=TEXT_SECONDARY,
+            justify='left'
+        )
+        
+        @profiled
+        def refresh_status():
+            last = profiler.last_profile or "none yet"
+            status_label.config(
+                text=f"Profiles are written to {os.path.abspath(profiler.output_dir)}\n"
+                     f"Written this session: {profiler.profiles_written} (last: {last})"
+            )
+        
+        def apply_profiling():
+            profiler.configure(profile_var.get(), memory_var.get())
+            refresh_status()
+        
+        def apply_query_stats():
+            query_stats.enabled = query_stats_var.get()
+        
+        options = [
+            ("Profile actions with cProfile (one file per slow action)", profile_var, apply_profiling),
+            ("Trace memory allocations with tracemalloc while profiling", memory_var, apply_profiling),
+            ("Record query statistics (Reports → Query Statistics)", query_stats_var, apply_query_stats),
+        ]
+        for text, variable, command in options:
+            tk.Checkbutton(
+                section,
+                text=text,
+                variable=variable,
+                command=command,
+                font=FONT_MEDIUM,
+                bg=BG_LIGHT,
+                fg=TEXT_PRIMARY,
+                selectcolor=BG_LIGHT,
+                activebackground=BG_LIGHT
+            ).pack(anchor='w', padx=PADDING_LARGE)
+        
+        status_label.pack(anchor='w', padx=PADDING_LARGE, pady=PADDING_MEDIUM)
+        
+        tk.Button(
+            section,
+            text="🔄 Refresh",
+            font=FONT_MEDIUM,
+            bg=BTN_SUCCESS,
+            fg=TEXT_LIGHT,
+            relief='flat',
+            cursor='hand2',
+            command=refresh_status
+        ).pack(anchor='w', padx=PADDING_LARGE, pady=(0, PADDING_LARGE))
+        
+        refresh_status()
     
     def show_reports(self):
         """Show reports (progress and detailed) with export option."""
@@ -1970,12 +2186,34 @@ class AdminDashboard:
         report_combo = ttk.Combobox(
             controls_frame,
             textvariable=self.report_type_var,
-            values=["Progress", "Detailed Bookings", "Detailed Payments"],
+            values=["Progress", "Trends", "Driver Summary", "Detailed Bookings", "Detailed Payments",
+                    "Query Statistics", "Slow Queries"],
             state='readonly',
             width=20,
         )
         report_combo.pack(side='left', padx=(10, PADDING_MEDIUM))
 
+        # Bucket selector (only shown for the Trends report)
+        self.report_bucket_frame = tk.Frame(controls_frame, bg=BG_COLOR)
+        tk.Label(
+            self.report_bucket_frame,
+            text="Group by:",
+            font=FONT_MEDIUM,
+            bg=BG_COLOR,
+            fg=TEXT_PRIMARY,
+        ).pack(side='left')
+
+        self.report_bucket_var = tk.StringVar(value="Day")
+        bucket_combo = ttk.Combobox(
+            self.report_bucket_frame,
+            textvariable=self.report_bucket_var,
+            values=REPORT_BUCKETS,
+            state='readonly',
+            width=10,
+        )
+        bucket_combo.pack(side='left', padx=(10, 0))
+        bucket_combo.bind('<<ComboboxSelected>>', lambda e: self.load_current_report())
+
         export_btn = tk.Button(
             controls_frame,
             text="⬇ Export CSV",
@@ -2031,6 +2269,7 @@ class AdminDashboard:
         """Load data into the report table based on selected report type."""
         if not hasattr(self, "report_type_var"):
             return
+        self.services.begin_unit_of_work()
         report_type = self.report_type_var.get()
 
         # Clear existing
@@ -2038,10 +2277,23 @@ class AdminDashboard:
             self.report_tree.delete(item)
         self.report_tree["columns"] = ()
 
+        if report_type == "Trends":
+            self.report_bucket_frame.pack(side='left', padx=(0, PADDING_MEDIUM))
+        else:
+            self.report_bucket_frame.pack_forget()
+
         if report_type == "Progress":
             self._load_progress_report()
+        elif report_type == "Trends":
+            self._load_trends_report()
+        elif report_type == "Driver Summary":
+            self._load_driver_summary_report()
         elif report_type == "Detailed Bookings":
             self._load_detailed_bookings_report()
+        elif report_type == "Query Statistics":
+            self._load_query_stats_report()
+        elif report_type == "Slow Queries":
+            self._load_slow_queries_report()
         else:
             self._load_detailed_payments_report()
 
@@ -2064,13 +2316,22 @@ class AdminDashboard:
         total_drivers = self.driver_ctrl.get_total_drivers_count()
         available_drivers = self.driver_ctrl.get_available_drivers_count()
         total_vehicles = self.vehicle_ctrl.get_total_vehicles_count()
-        total_bookings = self.booking_ctrl.get_total_bookings_count()
-        completed_bookings = len(self.booking_ctrl.get_completed_bookings())
-        pending_bookings = len(self.booking_ctrl.get_pending_bookings())
-        active_bookings = len(self.booking_ctrl.get_active_bookings())
-        booking_revenue = self.booking_ctrl.get_total_revenue()
+
+        # Status counts and revenue come from the daily facts plus the live tail,
+        # so opening the report does not read every booking
+        summary = self.booking_ctrl.get_booking_status_summary()
+
+        def status_count(*statuses):
+            return sum(summary.get(status, {}).get('count', 0) for status in statuses)
+
+        total_bookings = sum(totals['count'] for totals in summary.values())
+        completed_bookings = status_count(BOOKING_STATUS_COMPLETED)
+        pending_bookings = status_count(BOOKING_STATUS_PENDING)
+        active_bookings = status_count(BOOKING_STATUS_CONFIRMED, BOOKING_STATUS_IN_PROGRESS)
+        booking_revenue = summary.get(BOOKING_STATUS_COMPLETED, {}).get('fare', 0.0)
         payment_count = self.payment_ctrl.get_total_payments_count()
-        payment_revenue = self.payment_ctrl.get_total_revenue()
+        revenue_by_method = self.payment_ctrl.get_revenue_by_method()
+        payment_revenue = sum(revenue_by_method.values())
 
         rows = [
             ("Total Passengers", total_passengers),
@@ -2085,10 +2346,94 @@ class AdminDashboard:
             ("Total Payments", payment_count),
             (f"Payment Revenue ({CURRENCY_SYMBOL})", f"{payment_revenue:.2f}"),
         ]
+        rows.extend(
+            (f"  {method} Revenue ({CURRENCY_SYMBOL})", f"{total:.2f}")
+            for method, total in sorted(revenue_by_method.items())
+        )
 
         for metric, value in rows:
             self.report_tree.insert("", "end", values=(metric, value))
 
+    def _load_trends_report(self):
+        """Show trips, revenue and cancellations per hour/day/week/month."""
+        bucket = self.report_bucket_var.get()
+        columns = [
+            ("period", bucket, 140, "center"),
+            ("trips", "Trips", 80, "center"),
+            ("completed", "Completed", 90, "center"),
+            ("cancelled", "Cancelled", 90, "center"),
+            ("revenue", f"Revenue ({CURRENCY_SYMBOL})", 120, "e"),
+            ("avg_fare", f"Avg Fare ({CURRENCY_SYMBOL})", 120, "e"),
+            ("cancel_rate", "Cancellation Rate", 130, "e"),
+        ]
+        self._setup_report_columns(columns)
+
+        from datetime import datetime, timedelta
+
+        # Bounded look-back keeps fine-grained buckets to a readable number of rows
+        window_days = REPORT_BUCKET_WINDOWS.get(bucket)
+        start = datetime.now() - timedelta(days=window_days) if window_days else None
+
+        for point in self.booking_ctrl.get_booking_timeseries(bucket, start=start):
+            self.report_tree.insert(
+                "",
+                "end",
+                values=(
+                    point['bucket'],
+                    point['trips'],
+                    point['completed'],
+                    point['cancelled'],
+                    f"{point['revenue']:.2f}",
+                    f"{point['avg_fare']:.2f}",
+                    f"{point['cancellation_rate'] * 100:.1f}%",
+                ),
+            )
+
+    def _load_driver_summary_report(self):
+        """Show trips, completion and revenue per driver."""
+        columns = [
+            ("driver", "Driver", 180, "w"),
+            ("trips", "Trips", 80, "center"),
+            ("completed", "Completed", 90, "center"),
+            ("cancelled", "Cancelled", 90, "center"),
+            ("revenue", f"Revenue ({CURRENCY_SYMBOL})", 120, "e"),
+            ("distance", "Distance (km)", 120, "e"),
+            ("avg_fare", f"Avg Fare ({CURRENCY_SYMBOL})", 120, "e"),
+        ]
+        self._setup_report_columns(columns)
+
+        frame = self.booking_ctrl.get_booking_frame()
+        if frame is None:
+            self.report_tree.insert("", "end", values=("Driver summary requires numpy",))
+            return
+
+        frame = frame.filter(frame.driver_mask(assigned=True))
+        trips = frame.count_by('driver')
+        completed = frame.filter(frame.status_mask(BOOKING_STATUS_COMPLETED))
+        completed_trips = completed.group_by('driver')
+        cancelled = frame.filter(frame.status_mask(BOOKING_STATUS_CANCELLED)).count_by('driver')
+
+        for driver_id, trip_count in sorted(trips.items(), key=lambda item: item[1], reverse=True):
+            d = self.driver_ctrl.get_driver_by_id(driver_id)
+            driver_name = d.name if d and d.name else f"Driver #{driver_id}"
+
+            done = completed_trips.get(driver_id, {'count': 0, 'fare': 0.0, 'distance_km': 0.0})
+            avg_fare = done['fare'] / done['count'] if done['count'] else 0.0
+
+            self.report_tree.insert(
+                "",
+                "end",
+                values=(
+                    driver_name,
+                    trip_count,
+                    done['count'],
+                    cancelled.get(driver_id, 0),
+                    f"{done['fare']:.2f}",
+                    f"{done['distance_km']:.2f}",
+                    f"{avg_fare:.2f}",
+                ),
+            )
+
     def _load_detailed_bookings_report(self):
         """Show detailed bookings report."""
         columns = [
@@ -2103,21 +2448,13 @@ class AdminDashboard:
         ]
         self._setup_report_columns(columns)
 
-        bookings = self.booking_ctrl.get_all_bookings()
         from datetime import datetime
 
-        for b in bookings:
-            passenger_name = "N/A"
-            if b.passenger_id:
-                p = self.passenger_ctrl.get_passenger_by_id(b.passenger_id)
-                if p and p.name:
-                    passenger_name = p.name
-
-            driver_name = "Not Assigned"
-            if b.driver_id:
-                d = self.driver_ctrl.get_driver_by_id(b.driver_id)
-                if d and d.name:
-                    driver_name = d.name
+        # Streamed with the names joined in, so neither the Bookings table nor
+        # the passengers and drivers it references are held in memory at once
+        for b, passenger, driver in self.booking_ctrl.iter_bookings_with_names():
+            passenger_name = passenger or "N/A"
+            driver_name = driver or "Not Assigned"
 
             if b.booking_date and isinstance(b.booking_date, datetime):
                 date_text = b.booking_date.strftime("%d-%m-%Y %H:%M")
@@ -2156,16 +2493,10 @@ class AdminDashboard:
         ]
         self._setup_report_columns(columns)
 
-        payments = self.payment_ctrl.get_all_payments()
         from datetime import datetime
 
-        for p in payments:
-            booking = self.booking_ctrl.get_booking_by_id(p.booking_id)
-            passenger_name = "N/A"
-            if booking and booking.passenger_id:
-                passenger = self.passenger_ctrl.get_passenger_by_id(booking.passenger_id)
-                if passenger and passenger.name:
-                    passenger_name = passenger.name
+        for p, passenger in self.payment_ctrl.iter_payments_with_passengers():
+            passenger_name = passenger or "N/A"
 
             if p.payment_date and isinstance(p.payment_date, datetime):
                 date_text = p.payment_date.strftime("%d-%m-%Y %H:%M")
@@ -2192,6 +2523,71 @@ class AdminDashboard:
                 ),
             )
 
+    def _load_query_stats_report(self):
+        """Show the statements with the most total database time."""
+        columns = [
+            ("sql", "Statement", 420, "w"),
+            ("calls", "Calls", 70, "e"),
+            ("errors", "Errors", 60, "e"),
+            ("total_ms", "Total (ms)", 100, "e"),
+            ("avg_ms", "Avg (ms)", 80, "e"),
+            ("p95_ms", "p95 (ms)", 80, "e"),
+            ("max_ms", "Max (ms)", 80, "e"),
+            ("rows", "Rows", 80, "e"),
+            ("caller", "Top Caller", 220, "w"),
+        ]
+        self._setup_report_columns(columns)
+
+        from Db.query_stats import query_stats
+
+        for stats in query_stats.top(limit=QUERY_STATS_REPORT_LIMIT):
+            top_caller = next(iter(stats['callers']), "")
+            self.report_tree.insert(
+                "",
+                "end",
+                values=(
+                    stats['sql'],
+                    stats['calls'],
+                    stats['errors'],
+                    f"{stats['total_ms']:.1f}",
+                    f"{stats['avg_ms']:.2f}",
+                    f"<= {stats['p95_ms']:g}",
+                    f"{stats['max_ms']:.1f}",
+                    stats['rows'],
+                    top_caller,
+                ),
+            )
+
+    def _load_slow_queries_report(self):
+        """Show the slow-query log, newest first."""
+        columns = [
+            ("at", "Time", 80, "center"),
+            ("elapsed_ms", "Time (ms)", 90, "e"),
+            ("rows", "Rows", 70, "e"),
+            ("caller", "Caller", 220, "w"),
+            ("sql", "Statement", 420, "w"),
+            ("detail", "Plan / Error", 420, "w"),
+        ]
+        self._setup_report_columns(columns)
+
+        from datetime import datetime
+        from Db.query_stats import query_stats
+
+        for entry in query_stats.slow_queries():
+            detail = entry['error'] or " | ".join(entry['plan'] or [])
+            self.report_tree.insert(
+                "",
+                "end",
+                values=(
+                    datetime.fromtimestamp(entry['at']).strftime("%H:%M:%S"),
+                    f"{entry['elapsed_ms']:.1f}",
+                    entry['rows'],
+                    entry['caller'],
+                    entry['sql'],
+                    detail,
+                ),
+            )
+
     def export_current_report_to_csv(self):
         """Export the current report to CSV."""
         if not hasattr(self, "report_tree"):
@@ -2226,12 +2622,16 @@ class AdminDashboard:
     def logout(self):
         """Logout and return to login"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.deiconify()
     
     def on_closing(self):
         """Handle window close event"""
         if messagebox.askyesno("Quit", "Do you want to quit?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.destroy()
 
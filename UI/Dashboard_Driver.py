@@ -1,12 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from Controllers.DriverController import DriverController
-from Controllers.BookingController import BookingController
-from Controllers.VehicleController import VehicleController
+from Controllers.ServiceRegistry import ServiceRegistry
+from Controllers.EventBus import BookingEvent
+from UI.screen_timing import time_screens, bind_diagnostics
+from UI.live_updates import LiveUpdatesMixin
+from profiling import profile_methods, profiled
 from config import *
 
 
-class DriverDashboard:
+@profile_methods
+@time_screens
+class DriverDashboard(LiveUpdatesMixin):
     """
     Driver Dashboard - Trip and availability management
     """
@@ -20,14 +24,13 @@ class DriverDashboard:
             user: Logged in user object
             login_root: Login window reference
         """
+        super().__init__()
         self.root = root
         self.user = user
         self.login_root = login_root
         
-        # Initialize controllers
-        self.driver_ctrl = DriverController()
-        self.booking_ctrl = BookingController()
-        self.vehicle_ctrl = VehicleController()
+        # Controllers are created on first use and share one connection
+        self.services = ServiceRegistry()
         
         # Get driver details
         self.driver = self.driver_ctrl.get_driver_by_user_id(user.user_id)
@@ -36,6 +39,18 @@ class DriverDashboard:
         self.create_layout()
         self.show_dashboard_home()
     
+    @property
+    def driver_ctrl(self):
+        return self.services.get('driver')
+    
+    @property
+    def booking_ctrl(self):
+        return self.services.get('booking')
+    
+    @property
+    def vehicle_ctrl(self):
+        return self.services.get('vehicle')
+    
     def setup_window(self):
         """Configure the dashboard window"""
         self.root.title("Taxi Booking System - Driver Dashboard")
@@ -48,6 +63,9 @@ class DriverDashboard:
         self.root.geometry(f"{DASHBOARD_WIDTH}x{DASHBOARD_HEIGHT}+{x}+{y}")
         self.root.configure(bg=BG_COLOR)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Hidden screen-timing panel
+        bind_diagnostics(self.root)
     
     def create_layout(self):
         """Create main dashboard layout"""
@@ -133,8 +151,10 @@ class DriverDashboard:
     
     def clear_content(self):
         """Clear the content area"""
+        self.unsubscribe_all()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.services.begin_unit_of_work()
     
     def show_dashboard_home(self):
         """Show dashboard home"""
@@ -154,7 +174,7 @@ class DriverDashboard:
             stats_frame.pack(fill='both', expand=True, padx=PADDING_LARGE)
             
             # Get statistics
-            bookings = self.booking_ctrl.get_bookings_by_driver(self.driver.driver_id)
+            bookings = self.booking_ctrl.get_bookings_by_driver(self.driver.driver_id, include_history=True)
             completed = [b for b in bookings if b.is_completed()]
             total_earnings = sum([b.fare for b in completed if b.fare])
             
@@ -283,10 +303,11 @@ class DriverDashboard:
 
         tree.pack(side="left", fill="both", expand=True)
 
+        @profiled
         def load_trips():
             """Refresh trip list based on status filter"""
             status_filter = status_var.get()
-            bookings = self.booking_ctrl.get_bookings_by_driver(self.driver.driver_id)
+            bookings = self.booking_ctrl.get_bookings_by_driver(self.driver.driver_id, include_history=True)
 
             if status_filter != "All":
                 bookings = [b for b in bookings if b.status == status_filter]
@@ -294,32 +315,63 @@ class DriverDashboard:
             for item in tree.get_children():
                 tree.delete(item)
 
+            for b in bookings:
+                tree.insert("", "end", iid=str(b.booking_id), values=trip_values(b))
+
+        def trip_values(b):
+            """Build the table row for one trip"""
             from datetime import datetime
 
-            for b in bookings:
-                date_text = ""
-                if b.booking_date:
-                    if isinstance(b.booking_date, datetime):
-                        date_text = b.booking_date.strftime("%d-%m-%Y %H:%M")
-                    else:
-                        date_text = str(b.booking_date)[:16]
-
-                fare_text = b.get_formatted_fare() if hasattr(b, "get_formatted_fare") else (
-                    f"{CURRENCY_SYMBOL} {b.fare:.2f}" if b.fare else "N/A"
-                )
-
-                tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        b.booking_id,
-                        b.pickup_location or "N/A",
-                        b.destination or "N/A",
-                        b.status or "N/A",
-                        fare_text,
-                        date_text,
-                    ),
-                )
+            date_text = ""
+            if b.booking_date:
+                if isinstance(b.booking_date, datetime):
+                    date_text = b.booking_date.strftime("%d-%m-%Y %H:%M")
+                else:
+                    date_text = str(b.booking_date)[:16]
+
+            fare_text = b.get_formatted_fare() if hasattr(b, "get_formatted_fare") else (
+                f"{CURRENCY_SYMBOL} {b.fare:.2f}" if b.fare else "N/A"
+            )
+
+            return (
+                b.booking_id,
+                b.pickup_location or "N/A",
+                b.destination or "N/A",
+                b.status or "N/A",
+                fare_text,
+                date_text,
+            )
+
+        def patch_row(booking_id, b):
+            """Update, add or drop just one trip's row"""
+            if not tree.winfo_exists():
+                return
+            iid = str(booking_id)
+            status_filter = status_var.get()
+            if b is None or b.driver_id != self.driver.driver_id or status_filter not in ("All", b.status):
+                if tree.exists(iid):
+                    tree.delete(iid)
+            elif tree.exists(iid):
+                tree.item(iid, values=trip_values(b))
+            else:
+                tree.insert("", 0, iid=iid, values=trip_values(b))
+
+        def patch_trip(event):
+            """Patch the trip an event is about (if it is, or was, this driver's)"""
+            if not tree.winfo_exists():
+                return
+            if not tree.exists(str(event.booking_id)) and getattr(event, "driver_id", None) != self.driver.driver_id:
+                return
+            patch_row(event.booking_id, self.booking_ctrl.get_booking_by_id(event.booking_id))
+
+        def patch_changed(b):
+            """Patch a booking another session changed (if it is, or was, this driver's)"""
+            if b.driver_id == self.driver.driver_id or tree.exists(str(b.booking_id)):
+                patch_row(b.booking_id, b)
+
+        # Changes made here arrive as events, changes by other sessions via polling
+        self.subscribe(BookingEvent, patch_trip)
+        self.poll_changes('booking', 'get_bookings_changed_since', patch_changed)
 
         status_combo.bind("<<ComboboxSelected>>", lambda e: load_trips())
 
@@ -335,6 +387,7 @@ class DriverDashboard:
             item = tree.item(selected[0])
             return item["values"][0]
 
+        @profiled
         def view_trip():
             booking_id = get_selected_booking_id()
             if not booking_id:
@@ -362,14 +415,15 @@ class DriverDashboard:
             )
             messagebox.showinfo("Trip Details", details)
 
+        @profiled
         def update_status(new_status):
             booking_id = get_selected_booking_id()
             if not booking_id:
                 return
             success, msg = self.booking_ctrl.update_booking_status(booking_id, new_status)
             if success:
+                # The row is patched by the BookingStatusChanged event
                 messagebox.showinfo("Success", msg)
-                load_trips()
             else:
                 messagebox.showerror("Error", msg)
 
@@ -498,6 +552,7 @@ class DriverDashboard:
 
         status_var = tk.StringVar(value=self.driver.availability)
 
+        @profiled
         def set_status(new_status):
             if self.driver_ctrl.update_driver_availability(self.driver.driver_id, new_status):
                 self.driver.availability = new_status
@@ -598,6 +653,7 @@ class DriverDashboard:
         phone_entry = add_field(2, "Phone:", self.driver.phone)
         add_field(3, "License Number:", self.driver.license_number, editable=False)
 
+        @profiled
         def save_profile():
             name = name_entry.get().strip()
             email = email_entry.get().strip()
@@ -634,11 +690,15 @@ class DriverDashboard:
     def logout(self):
         """Logout and return to login"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.deiconify()
     
     def on_closing(self):
         """Handle window close event"""
         if messagebox.askyesno("Quit", "Do you want to quit?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.destroy()
\ No newline at end of file
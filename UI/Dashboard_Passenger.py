@@ -5,13 +5,17 @@ Passenger Dashboard - Main interface for passengers
 
 import tkinter as tk
 from tkinter import messagebox
-from Controllers.PassengerController import PassengerController
-from Controllers.BookingController import BookingController
-from Controllers.PaymentController import PaymentController
+from Controllers.ServiceRegistry import ServiceRegistry
+from Controllers.EventBus import BookingEvent
+from UI.screen_timing import time_screens, bind_diagnostics
+from UI.live_updates import LiveUpdatesMixin
+from profiling import profile_methods, profiled
 from config import *
 
 
-class PassengerDashboard:
+@profile_methods
+@time_screens
+class PassengerDashboard(LiveUpdatesMixin):
     """
     Passenger Dashboard - Booking and trip management
     """
@@ -21,14 +25,13 @@ class PassengerDashboard:
         Initialize Passenger Dashboard
             login_root: Login window reference
         """
+        super().__init__()
         self.root = root
         self.user = user
         self.login_root = login_root
         
-        # Initialize controllers
-        self.passenger_ctrl = PassengerController()
-        self.booking_ctrl = BookingController()
-        self.payment_ctrl = PaymentController()
+        # Controllers are created on first use and share one connection
+        self.services = ServiceRegistry()
         
         # Get passenger details
         self.passenger = self.passenger_ctrl.get_passenger_by_user_id(user.user_id)
@@ -37,6 +40,18 @@ class PassengerDashboard:
         self.create_layout()
         self.show_dashboard_home()
     
+    @property
+    def passenger_ctrl(self):
+        return self.services.get('passenger')
+    
+    @property
+    def booking_ctrl(self):
+        return self.services.get('booking')
+    
+    @property
+    def payment_ctrl(self):
+        return self.services.get('payment')
+    
     def setup_window(self):
         """Configure the dashboard window"""
         self.root.title("Taxi Booking System - Passenger Dashboard")
@@ -49,6 +64,9 @@ class PassengerDashboard:
         self.root.geometry(f"{DASHBOARD_WIDTH}x{DASHBOARD_HEIGHT}+{x}+{y}")
         self.root.configure(bg=BG_COLOR)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Hidden screen-timing panel
+        bind_diagnostics(self.root)
     
     def create_layout(self):
         """Create main dashboard layout"""
@@ -133,8 +151,10 @@ class PassengerDashboard:
     
     def clear_content(self):
         """Clear the content area"""
+        self.unsubscribe_all()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.services.begin_unit_of_work()
     
     def show_dashboard_home(self):
         """Show dashboard home"""
@@ -153,7 +173,7 @@ class PassengerDashboard:
             stats_frame = tk.Frame(self.content_frame, bg=BG_COLOR)
             stats_frame.pack(fill='both', expand=True, padx=PADDING_LARGE)
             
-            bookings = self.booking_ctrl.get_bookings_by_passenger(self.passenger.passenger_id)
+            bookings = self.booking_ctrl.get_bookings_by_passenger(self.passenger.passenger_id, include_history=True)
             pending = [b for b in bookings if b.is_pending()]
             completed = [b for b in bookings if b.is_completed()]
             
@@ -316,6 +336,7 @@ class PassengerDashboard:
         fare_label.grid(row=10, column=0, sticky='w', pady=(0, 15))
     
         # Calculate fare on distance change
+        @profiled
         def calculate_fare_estimate(*args):
             distance_text = distance_entry.get().strip()
             if distance_text:
@@ -340,6 +361,7 @@ class PassengerDashboard:
         button_frame = tk.Frame(form_frame, bg='white')
         button_frame.pack(fill='x', padx=40, pady=(0, 30))
         
+        @profiled
         def submit_booking():
             """Handle booking submission"""
             pickup = pickup_entry.get().strip()
@@ -419,6 +441,7 @@ class PassengerDashboard:
             pady=10
         ).pack(side='left', padx=10)
         
+        @profiled
         def clear_form():
             """Clear all form fields"""
             pickup_entry.delete(0, tk.END)
@@ -483,7 +506,7 @@ class PassengerDashboard:
             return
         
         # Get bookings
-        bookings = self.booking_ctrl.get_bookings_by_passenger(self.passenger.passenger_id)
+        bookings = self.booking_ctrl.get_bookings_by_passenger(self.passenger.passenger_id, include_history=True)
         
         if not bookings:
             # Empty state
@@ -532,9 +555,38 @@ class PassengerDashboard:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Display bookings
+        # Display bookings (cards by booking id, so events can rebuild just one)
+        cards = {}
         for booking in bookings:
-            self.create_booking_card(scrollable_frame, booking)
+            cards[booking.booking_id] = self.create_booking_card(scrollable_frame, booking)
+        
+        def patch_booking(event):
+            """Rebuild or add just the card an event is about"""
+            if not scrollable_frame.winfo_exists():
+                return
+            if event.booking_id not in cards and getattr(event, 'passenger_id', None) != self.passenger.passenger_id:
+                return
+            patch_card(self.booking_ctrl.get_booking_by_id(event.booking_id))
+        
+        def patch_card(booking):
+            """Rebuild one booking's card, or add it at the top"""
+            if booking is None or booking.passenger_id != self.passenger.passenger_id:
+                return
+            if not scrollable_frame.winfo_exists():
+                return
+            old_card = cards.get(booking.booking_id)
+            if old_card is not None:
+                cards[booking.booking_id] = self.create_booking_card(scrollable_frame, booking, before=old_card)
+                old_card.destroy()
+            else:
+                first = scrollable_frame.winfo_children()
+                cards[booking.booking_id] = self.create_booking_card(
+                    scrollable_frame, booking, before=first[0] if first else None
+                )
+        
+        # Changes made here arrive as events, changes by other sessions via polling
+        self.subscribe(BookingEvent, patch_booking)
+        self.poll_changes('booking', 'get_bookings_changed_since', patch_card)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -542,11 +594,14 @@ class PassengerDashboard:
         # Mousewheel
         canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
 
-    def create_booking_card(self, parent, booking):
-        """Create a booking card"""
+    def create_booking_card(self, parent, booking, before=None):
+        """Create a booking card (packed ahead of `before` if given) and return it"""
         # Card
         card = tk.Frame(parent, bg='white', relief='solid', borderwidth=1)
-        card.pack(fill='x', pady=10, padx=5)
+        if before is not None:
+            card.pack(fill='x', pady=10, padx=5, before=before)
+        else:
+            card.pack(fill='x', pady=10, padx=5)
         
         # Status bar
         status_color = booking.get_status_color()
@@ -697,14 +752,16 @@ class PassengerDashboard:
                 command=lambda b=booking: self.cancel_booking(b)
             ).pack(side='right')
 
+        return card
+
     def cancel_booking(self, booking):
         """Cancel a booking"""
         if messagebox.askyesno("Confirm", f"Cancel Booking #{booking.booking_id}?"):
             success, message = self.booking_ctrl.cancel_booking(booking.booking_id)
             
             if success:
+                # The card is rebuilt by the BookingStatusChanged event
                 messagebox.showinfo("Success", "Booking cancelled!")
-                self.show_my_bookings()
             else:
                 messagebox.showerror("Error", f"Failed to cancel: {message}")
 
@@ -751,6 +808,7 @@ class PassengerDashboard:
         btn_frame = tk.Frame(dialog, bg=BG_COLOR)
         btn_frame.pack(padx=20, pady=(10, 20), fill='x')
 
+        @profiled
         def confirm_payment():
             method = method_var.get()
             success, msg, payment_id = self.payment_ctrl.create_payment(
@@ -765,7 +823,7 @@ class PassengerDashboard:
                     f"Payment completed.\nPayment ID: {payment_id}\nAmount: {booking.get_formatted_fare()}\nMethod: {method}"
                 )
                 dialog.destroy()
-                self.show_my_bookings()
+                # The card is rebuilt by the PaymentCompleted event
             else:
                 messagebox.showerror("Payment Failed", msg or "Unable to process payment.")
 
@@ -961,6 +1019,7 @@ class PassengerDashboard:
         button_frame = tk.Frame(profile_frame, bg='white')
         button_frame.pack(fill='x', padx=40, pady=(0, 30))
         
+        @profiled
         def update_profile():
             """Handle profile update"""
             name = name_entry.get().strip()
@@ -1016,11 +1075,15 @@ class PassengerDashboard:
     def logout(self):
         """Logout and return to login"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.deiconify()
     
     def on_closing(self):
         """Handle window close event"""
         if messagebox.askyesno("Quit", "Do you want to quit?"):
+            self.stop_live_updates()
+            self.services.close()
             self.root.destroy()
             self.login_root.destroy()
\ No newline at end of file
@@ -2,28 +2,36 @@
 """
 Login Page - User authentication interface
 """
+import threading
 import tkinter as tk
 from tkinter import messagebox
-from Controllers.UserController import UserController
+from UI.tk_dispatch import TkDispatcher
 from config import (LOGIN_WINDOW_WIDTH,LOGIN_WINDOW_HEIGHT,PRIMARY_COLOR,SECONDARY_COLOR,BG_COLOR,TEXT_PRIMARY,TEXT_LIGHT,FONT_LARGE_HEADING
                     ,FONT_LARGE,FONT_MEDIUM,FONT_NORMAL_REGULAR,BTN_PRIMARY,BTN_PRIMARY_HOVER,INPUT_BG,INPUT_BORDER,PADDING_LARGE,PADDING_MEDIUM
-                    ,ERROR_INVALID_CREDENTIALS,USER_TYPE_ADMIN,USER_TYPE_PASSENGER,USER_TYPE_DRIVER
+                    ,ERROR_INVALID_CREDENTIALS,ERROR_DB_CONNECTION,USER_TYPE_ADMIN,USER_TYPE_PASSENGER,USER_TYPE_DRIVER
 )
 
 class LoginPage:
     """
     Login interface for user authentication
     """
-    def __init__(self, root):
+    def __init__(self, root, db_ready=None):
         """
         Initialize Login Page
         
         Args:
             root: Tkinter root window
+            db_ready: threading.Event set once background database setup finishes (optional)
         """
         self.root = root
-        self.user_controller = UserController()
+        self.db_ready = db_ready
+        # Connected on first login so the window does not wait on the database
+        self.user_controller = None
         self.current_user = None
+        # Set while a login is being verified on the worker thread
+        self.login_in_progress = False
+        # Carries the worker's result back to the Tk thread
+        self.dispatcher = TkDispatcher(root)
         
         self.setup_window()
         self.create_widgets()
@@ -224,8 +232,48 @@ class LoginPage:
             messagebox.showerror("Error", "Please enter both username and password")
             return
         
-        # Authenticate
+        if self.db_ready is not None and not self.db_ready.is_set():
+            messagebox.showinfo("Please wait", "Still connecting to the database. Please try again in a moment.")
+            return
+        
+        if self.login_in_progress:
+            return
+        self.login_in_progress = True
+        self.login_button.config(text="SIGNING IN...", state='disabled')
+        
+        # Password verification is deliberately slow; keep it off the Tk thread
+        self.dispatcher.start()
+        thread = threading.Thread(
+            target=self.authenticate_in_background,
+            args=(username, password),
+            name="login",
+            daemon=True
+        )
+        thread.start()
+    
+    def authenticate_in_background(self, username, password):
+        """Worker thread: connect if needed and verify, then queue the result for the Tk loop"""
+        try:
+            if self.user_controller is None:
+                # Imported here so opening the login window does not load the database driver
+                from Controllers.UserController import UserController
+                self.user_controller = UserController()
+        except Exception:
+            self.dispatcher.post(self.finish_login, username, None, ERROR_DB_CONNECTION)
+            return
+        
         user = self.user_controller.authenticate_user(username, password)
+        self.dispatcher.post(self.finish_login, username, user, None)
+    
+    def finish_login(self, username, user, error):
+        """Tk thread: act on the result of authenticate_in_background"""
+        self.dispatcher.stop()
+        self.login_in_progress = False
+        self.login_button.config(text="LOGIN", state='normal')
+        
+        if error:
+            messagebox.showerror("Error", error)
+            return
         
         if user:
             self.current_user = user
@@ -2,18 +2,28 @@
 """
 UI Package
 Contains all user interface components for the Taxi Booking System
+
+Screens are imported on first access (PEP 562) so the login window does not
+load the dashboards and their controllers.
 """
 
-from UI.LoginPage import LoginPage
-from UI.RegistrationPage import RegistrationPage
-from UI.Dashboard_Admin import AdminDashboard
-from UI.Dashboard_Passenger import PassengerDashboard
-from UI.Dashboard_Driver import DriverDashboard
+import importlib
+
+_UI_MODULES = {
+    'LoginPage': 'UI.LoginPage',
+    'RegistrationPage': 'UI.RegistrationPage',
+    'AdminDashboard': 'UI.Dashboard_Admin',
+    'PassengerDashboard': 'UI.Dashboard_Passenger',
+    'DriverDashboard': 'UI.Dashboard_Driver'
+}
+
+__all__ = list(_UI_MODULES)
+
 
-__all__ = [
-    'LoginPage',
-    'RegistrationPage',
-    'AdminDashboard',
-    'PassengerDashboard',
-    'DriverDashboard'
-]
\ No newline at end of file
+def __getattr__(name):
+    """Import a UI class the first time it is accessed"""
+    if name not in _UI_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_UI_MODULES[name]), name)
+    globals()[name] = value
+    return value
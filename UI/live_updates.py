@@ -0,0 +1,128 @@
+"""
+Live Updates - Event subscriptions and delta polling for dashboard screens
+
+Dashboards inherit LiveUpdatesMixin and call super().__init__() before
+building any screen. A screen subscribes to controller events and polls for
+rows other sessions changed; clear_content calls unsubscribe_all, so both
+stop when the user moves to another screen.
+
+Polls query on a background thread over their own connection, the same way
+the database is initialized at startup, so a slow poll never freezes the
+window. Events and poll results reach the Tk loop through a TkDispatcher
+queue; worker threads never call into Tk themselves.
+"""
+import threading
+from Controllers.EventBus import event_bus
+from Controllers.ServiceRegistry import ServiceRegistry
+from UI.tk_dispatch import TkDispatcher
+from config import DELTA_POLL_SECONDS
+
+
+class LiveUpdatesMixin:
+    """
+    subscribe / poll_changes / unsubscribe_all for a dashboard with .root and .services
+    """
+
+    def __init__(self):
+        # (event type, deliver, state) for the current screen's subscriptions
+        self._subscriptions = []
+        # Delta polls the current screen runs (see poll_changes)
+        self._polls = []
+        # Controllers the polls query through; only poll threads use them,
+        # one at a time
+        self._poll_services = None
+        self._poll_lock = threading.Lock()
+        # Created on the Tk thread by the first subscribe / poll_changes
+        self._dispatcher = None
+
+    def _start_dispatcher(self):
+        """Tk thread: get the dispatcher, draining"""
+        if self._dispatcher is None:
+            self._dispatcher = TkDispatcher(self.root)
+        self._dispatcher.start()
+        return self._dispatcher
+
+    def subscribe(self, event_type, handler):
+        """Run handler(event) on the Tk loop for controller events, until the screen is cleared"""
+        dispatcher = self._start_dispatcher()
+        state = {'active': True}
+
+        def run(event):
+            if state['active']:
+                handler(event)
+
+        def deliver(event):
+            # Publisher's thread
+            dispatcher.post(run, event)
+        event_bus.subscribe(event_type, deliver)
+        self._subscriptions.append((event_type, deliver, state))
+
+    def unsubscribe_all(self):
+        """Drop the current screen's event subscriptions and delta polls"""
+        for event_type, deliver, state in self._subscriptions:
+            state['active'] = False
+            event_bus.unsubscribe(event_type, deliver)
+        self._subscriptions.clear()
+        for poll in self._polls:
+            poll['active'] = False
+            if poll['after_id'] is not None:
+                self.root.after_cancel(poll['after_id'])
+        self._polls.clear()
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+
+    def stop_live_updates(self):
+        """unsubscribe_all, and close the polling connection (logout / quit)"""
+        self.unsubscribe_all()
+        with self._poll_lock:
+            if self._poll_services is not None:
+                self._poll_services.close()
+                self._poll_services = None
+
+    def poll_changes(self, controller, method, apply):
+        """
+        Every DELTA_POLL_SECONDS, call apply(model) for each row another
+        session changed, until the screen is cleared
+
+        Args:
+            controller (str): Controller name, e.g. 'booking'
+            method (str): Its get_*_changed_since method
+            apply: Called on the Tk loop with each changed model
+        """
+        dispatcher = self._start_dispatcher()
+        poll = {'watermark': None, 'after_id': None, 'active': True}
+
+        def fetch():
+            """Poll thread: query, then queue the result for the Tk loop"""
+            models, watermark = [], poll['watermark']
+            with self._poll_lock:
+                if not poll['active']:
+                    return
+                try:
+                    if self._poll_services is None:
+                        self._poll_services = ServiceRegistry()
+                    self._poll_services.begin_unit_of_work()
+                    changed_since = getattr(self._poll_services.get(controller), method)
+                    models, watermark = changed_since(poll['watermark'])
+                except Exception as e:
+                    print(f"Delta poll error: {e}")
+            dispatcher.post(deliver, models, watermark)
+
+        def deliver(models, watermark):
+            if not poll['active']:
+                return
+            poll['watermark'] = watermark
+            if models:
+                # Changed elsewhere, so instances this screen mapped are stale
+                self.services.begin_unit_of_work()
+            for model in models:
+                apply(model)
+            poll['after_id'] = self.root.after(DELTA_POLL_SECONDS * 1000, start)
+
+        def start():
+            poll['after_id'] = None
+            threading.Thread(target=fetch, daemon=True).start()
+
+        # The first call only reads the starting watermark
+        start()
+        self._polls.append(poll)
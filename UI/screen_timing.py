@@ -0,0 +1,273 @@
+"""
+Screen Timing - How long each dashboard screen takes to appear
+
+Dashboard classes decorated with @time_screens have every show_* method
+timed from the click to the last widget drawn. Each measurement splits into:
+
+    db       - time in BaseDB statements (from Db.query_stats, so only
+               while query statistics are enabled)
+    widgets  - the rest of the method: building and destroying widgets
+    draw     - geometry and redraw of the new widgets (update_idletasks)
+
+Screens slower than SLOW_SCREEN_MS (every screen in DEBUG_MODE) are
+printed. Everything is kept in screen_timings and shown in a diagnostics
+panel opened with DIAGNOSTICS_SHORTCUT (Ctrl+Shift+D) on any dashboard.
+"""
+import functools
+import time
+import tkinter as tk
+from collections import deque
+from tkinter import ttk
+from Db.query_stats import query_stats
+from config import (DEBUG_MODE, SLOW_SCREEN_MS, SCREEN_TIMING_LOG_SIZE, DIAGNOSTICS_SHORTCUT,
+                    BG_COLOR, TEXT_PRIMARY, TEXT_LIGHT, FONT_MEDIUM, FONT_MEDIUM_BOLD,
+                    PADDING_MEDIUM, BTN_PRIMARY, BTN_SECONDARY)
+
+
+class ScreenTimings:
+    """
+    Recent screen timings and per-screen totals
+    """
+
+    def __init__(self, log_size=SCREEN_TIMING_LOG_SIZE):
+        """
+        Initialize ScreenTimings
+
+        Args:
+            log_size (int): Recent measurements kept (oldest dropped first)
+        """
+        self.recent = deque(maxlen=log_size)
+        self._screens = {}
+        # Screens only run on the Tk thread, so a plain counter tracks nesting
+        self._depth = 0
+
+    def record(self, screen, total_ms, db_ms, db_calls, widget_ms, draw_ms):
+        """Add one measurement and print it if it was slow"""
+        entry = {
+            'at': time.time(),
+            'screen': screen,
+            'total_ms': total_ms,
+            'db_ms': db_ms,
+            'db_calls': db_calls,
+            'widget_ms': widget_ms,
+            'draw_ms': draw_ms,
+        }
+        self.recent.append(entry)
+
+        totals = self._screens.get(screen)
+        if totals is None:
+            totals = self._screens[screen] = {
+                'screen': screen, 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'db_ms': 0.0, 'db_calls': 0, 'widget_ms': 0.0, 'draw_ms': 0.0,
+            }
+        totals['calls'] += 1
+        totals['max_ms'] = max(totals['max_ms'], total_ms)
+        totals['last_ms'] = total_ms
+        for key in ('total_ms', 'db_ms', 'db_calls', 'widget_ms', 'draw_ms'):
+            totals[key] += entry[key]
+
+        if DEBUG_MODE or total_ms >= SLOW_SCREEN_MS:
+            print(f"Screen {screen}: {total_ms:.0f} ms (db {db_ms:.0f} ms in {db_calls} queries, "
+                  f"widgets {widget_ms:.0f} ms, draw {draw_ms:.0f} ms)")
+
+    def summary(self):
+        """
+        Per-screen averages, slowest first
+
+        Returns:
+            list: dicts with screen, calls, avg/max/last total and avg db/widget/draw ms
+        """
+        rows = []
+        for totals in self._screens.values():
+            calls = totals['calls']
+            rows.append({
+                'screen': totals['screen'],
+                'calls': calls,
+                'avg_ms': totals['total_ms'] / calls,
+                'max_ms': totals['max_ms'],
+                'last_ms': totals['last_ms'],
+                'db_ms': totals['db_ms'] / calls,
+                'db_calls': totals['db_calls'] / calls,
+                'widget_ms': totals['widget_ms'] / calls,
+                'draw_ms': totals['draw_ms'] / calls,
+            })
+        rows.sort(key=lambda row: row['avg_ms'], reverse=True)
+        return rows
+
+    def reset(self):
+        """Forget every measurement"""
+        self.recent.clear()
+        self._screens.clear()
+
+
+screen_timings = ScreenTimings()
+
+
+def timed_screen(method):
+    """
+    Time a dashboard show_* method (the instance must have a .root window)
+
+    A screen opened from inside another (e.g. a list re-shown after an
+    edit) counts towards the outer one only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if screen_timings._depth:
+            return method(self, *args, **kwargs)
+
+        screen_timings._depth += 1
+        try:
+            started = time.perf_counter()
+            db_before, calls_before = query_stats.thread_totals()
+            result = method(self, *args, **kwargs)
+            built = time.perf_counter()
+            db_after, calls_after = query_stats.thread_totals()
+            # Lay out and draw now, so the measurement ends with the screen on display
+            self.root.update_idletasks()
+            finished = time.perf_counter()
+        finally:
+            screen_timings._depth -= 1
+
+        db_ms = db_after - db_before
+        build_ms = (built - started) * 1000
+        screen_timings.record(
+            f"{type(self).__name__}.{method.__name__}",
+            total_ms=(finished - started) * 1000,
+            db_ms=db_ms,
+            db_calls=calls_after - calls_before,
+            widget_ms=max(0.0, build_ms - db_ms),
+            draw_ms=(finished - built) * 1000,
+        )
+        return result
+    return wrapper
+
+
+def time_screens(cls):
+    """Class decorator: time every show_* method of a dashboard"""
+    for name, value in list(vars(cls).items()):
+        if name.startswith('show_') and callable(value):
+            setattr(cls, name, timed_screen(value))
+    return cls
+
+
+class DiagnosticsPanel:
+    """
+    Hidden window listing screen timings, opened by bind_diagnostics
+    """
+
+    def __init__(self, parent):
+        """
+        Initialize DiagnosticsPanel
+
+        Args:
+            parent: Dashboard window the panel belongs to
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title("Diagnostics - Screen Timings")
+        self.window.geometry("980x560")
+        self.window.configure(bg=BG_COLOR)
+
+        controls = tk.Frame(self.window, bg=BG_COLOR)
+        controls.pack(fill='x', padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+        tk.Label(
+            controls,
+            text="Average time per screen (ms)",
+            font=FONT_MEDIUM_BOLD,
+            bg=BG_COLOR,
+            fg=TEXT_PRIMARY
+        ).pack(side='left')
+        for text, color, command in (("Reset", BTN_SECONDARY, self.reset), ("🔄 Refresh", BTN_PRIMARY, self.refresh)):
+            tk.Button(
+                controls,
+                text=text,
+                font=FONT_MEDIUM,
+                bg=color,
+                fg=TEXT_LIGHT,
+                relief='flat',
+                cursor='hand2',
+                command=command
+            ).pack(side='right', padx=(PADDING_MEDIUM, 0))
+
+        self.summary_tree = self._create_tree([
+            ("screen", "Screen", 260, "w"),
+            ("calls", "Opened", 70, "e"),
+            ("avg_ms", "Avg", 80, "e"),
+            ("max_ms", "Max", 80, "e"),
+            ("last_ms", "Last", 80, "e"),
+            ("db_ms", "DB", 80, "e"),
+            ("db_calls", "Queries", 80, "e"),
+            ("widget_ms", "Widgets", 80, "e"),
+            ("draw_ms", "Draw", 80, "e"),
+        ], height=10)
+
+        tk.Label(
+            self.window,
+            text="Recent (newest first)",
+            font=FONT_MEDIUM_BOLD,
+            bg=BG_COLOR,
+            fg=TEXT_PRIMARY
+        ).pack(anchor='w', padx=PADDING_MEDIUM)
+        self.recent_tree = self._create_tree([
+            ("at", "Time", 90, "center"),
+            ("screen", "Screen", 260, "w"),
+            ("total_ms", "Total", 80, "e"),
+            ("db_ms", "DB", 80, "e"),
+            ("db_calls", "Queries", 80, "e"),
+            ("widget_ms", "Widgets", 80, "e"),
+            ("draw_ms", "Draw", 80, "e"),
+        ], height=10)
+
+        self.refresh()
+
+    def _create_tree(self, columns, height):
+        frame = tk.Frame(self.window, bg=BG_COLOR)
+        frame.pack(fill='both', expand=True, padx=PADDING_MEDIUM, pady=(0, PADDING_MEDIUM))
+        scroll = ttk.Scrollbar(frame, orient='vertical')
+        scroll.pack(side='right', fill='y')
+        tree = ttk.Treeview(frame, columns=[c[0] for c in columns], show='headings',
+                            height=height, yscrollcommand=scroll.set)
+        for key, title, width, anchor in columns:
+            tree.heading(key, text=title)
+            tree.column(key, width=width, anchor=anchor)
+        tree.pack(side='left', fill='both', expand=True)
+        scroll.config(command=tree.yview)
+        return tree
+
+    def refresh(self):
+        """Reload both tables from screen_timings"""
+        for tree in (self.summary_tree, self.recent_tree):
+            tree.delete(*tree.get_children())
+
+        for row in screen_timings.summary():
+            self.summary_tree.insert("", "end", values=(
+                row['screen'], row['calls'], f"{row['avg_ms']:.1f}", f"{row['max_ms']:.1f}",
+                f"{row['last_ms']:.1f}", f"{row['db_ms']:.1f}", f"{row['db_calls']:.1f}",
+                f"{row['widget_ms']:.1f}", f"{row['draw_ms']:.1f}",
+            ))
+
+        for entry in reversed(screen_timings.recent):
+            self.recent_tree.insert("", "end", values=(
+                time.strftime("%H:%M:%S", time.localtime(entry['at'])), entry['screen'],
+                f"{entry['total_ms']:.1f}", f"{entry['db_ms']:.1f}", entry['db_calls'],
+                f"{entry['widget_ms']:.1f}", f"{entry['draw_ms']:.1f}",
+            ))
+
+    def reset(self):
+        screen_timings.reset()
+        self.refresh()
+
+
+def bind_diagnostics(root):
+    """Open (or raise and refresh) the diagnostics panel on DIAGNOSTICS_SHORTCUT"""
+    panel = {'current': None}
+
+    def open_panel(event=None):
+        current = panel['current']
+        if current is not None and current.window.winfo_exists():
+            current.refresh()
+            current.window.lift()
+        else:
+            panel['current'] = DiagnosticsPanel(root)
+        return "break"
+
+    root.bind(DIAGNOSTICS_SHORTCUT, open_panel)
@@ -0,0 +1,62 @@
+"""
+Tk Dispatcher - Hands results from worker threads to the Tk loop
+
+Tk is not thread-safe: widgets, and root.after itself, may only be touched
+from the thread running mainloop. Worker threads post callbacks to a
+queue.Queue instead, and the Tk thread drains it every UI_QUEUE_POLL_MS
+with a repeating root.after.
+"""
+import queue
+import tkinter as tk
+from config import UI_QUEUE_POLL_MS
+
+
+class TkDispatcher:
+    """Thread-safe post(), drained on the Tk loop between start() and stop()"""
+
+    def __init__(self, root):
+        """
+        Initialize TkDispatcher
+
+        Args:
+            root: Tk window whose loop runs the posted callbacks
+        """
+        self.root = root
+        self._queue = queue.Queue()
+        self._after_id = None
+
+    def post(self, callback, *args):
+        """Any thread: run callback(*args) on the Tk loop at the next drain"""
+        self._queue.put((callback, args))
+
+    def start(self):
+        """Tk thread: start draining (does nothing if already started)"""
+        if self._after_id is None:
+            self._after_id = self.root.after(UI_QUEUE_POLL_MS, self._drain)
+
+    def stop(self):
+        """Tk thread: stop draining and drop callbacks not yet run"""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                # Window already destroyed
+                pass
+            self._after_id = None
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _drain(self):
+        """Tk thread: run every posted callback"""
+        # Scheduled first, so a callback that raises (reported by Tk) or
+        # calls stop() leaves the loop in the right state
+        self._after_id = self.root.after(UI_QUEUE_POLL_MS, self._drain)
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+"""
+Benchmarks Package
+Standalone performance checks, run from the project root with
+python -m benchmarks.<name>
+"""
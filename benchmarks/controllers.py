@@ -0,0 +1,319 @@
+# benchmarks/controllers.py
+"""
+Controller Benchmark - Latency and throughput of the hot controller paths
+
+Seeds an embedded SQLite database per dataset size with Db.seed, then calls
+each hot path (booking creation and assignment, booking lists, the admin
+reports, login) repeatedly and records p50/p95/p99 latency and calls/sec.
+Seeded datasets are kept in --data-dir and reused; every run works on a
+fresh copy so writes from one run never skew the next.
+
+Results are compared with the committed JSON baseline and the run fails
+(exit code 1) when a case's p95 latency or throughput regresses past
+--threshold, or when the baseline has no entry for a size and case that
+ran. Record a new baseline on the reference machine with --record.
+
+Usage:
+    python -m benchmarks.controllers [--sizes 1000,10000,100000] [--threshold 0.25]
+    python -m benchmarks.controllers --record
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from config import SEED_WORKERS, USER_TYPE_PASSENGER
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE_PATH = os.path.join(PROJECT_ROOT, 'benchmarks', 'controllers_baseline.json')
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'taxi_booking_bench')
+
+# Dataset sizes, in bookings; passengers and drivers scale with them
+DEFAULT_SIZES = [1000, 10000, 100000]
+SEED_DAYS = 365
+
+# Latency differences below this are timer noise, never a regression
+NOISE_FLOOR_MS = 0.2
+
+LOCATIONS = ['Thamel', 'Baneshwor', 'Koteshwor', 'Kalanki', 'Chabahil', 'Boudha']
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def seeded_database(data_dir, size, workers):
+    """
+    Path of a seeded database with the given number of bookings
+
+    Seeds it on first use; later runs reuse the file.
+    """
+    from Db.DatabaseCRUD import DatabaseCRUD
+    from Db.backends import SQLiteBackend
+    from Db.rollup import RollupJob
+    from Db.seed import Seeder
+
+    path = os.path.join(data_dir, f'bookings_{size}.db')
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(data_dir, exist_ok=True)
+    print(f"Seeding {size} bookings into {path}")
+    partial = path + '.partial'
+    db = DatabaseCRUD(SQLiteBackend(partial))
+    try:
+        seeded = Seeder(db, workers=workers).run(
+            passengers=max(100, size // 20),
+            drivers=max(20, size // 200),
+            bookings=size,
+            days=SEED_DAYS
+        )
+        if not seeded:
+            raise RuntimeError(f"Seeding {size} bookings failed")
+        RollupJob(db).run(full=True)
+        # Fold the write-ahead log into the file so copying it copies everything
+        db.cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        db.disconnect()
+    os.replace(partial, path)
+    return path
+
+
+class Workload:
+    """Controllers over one working copy of a seeded database, plus the ids the cases draw from"""
+
+    def __init__(self, path):
+        from Db.base_db import BaseDB
+        from Db.backends import SQLiteBackend
+        from Controllers.BookingController import BookingController
+        from Controllers.DriverController import DriverController
+        from Controllers.PassengerController import PassengerController
+        from Controllers.PaymentController import PaymentController
+        from Controllers.UserController import UserController
+        from Controllers.VehicleController import VehicleController
+
+        self.db = BaseDB(SQLiteBackend(path))
+        self.booking_ctrl = BookingController(self.db)
+        self.driver_ctrl = DriverController(self.db)
+        self.passenger_ctrl = PassengerController(self.db)
+        self.payment_ctrl = PaymentController(self.db)
+        self.user_ctrl = UserController(self.db)
+        self.vehicle_ctrl = VehicleController(self.db)
+
+        self.rng = random.Random(7)
+        self.passenger_ids = [row['Passenger_ID'] for row in self.db.fetch_all("SELECT Passenger_ID FROM Passengers")]
+        self.driver_ids = [row['Driver_ID'] for row in self.db.fetch_all("SELECT Driver_ID FROM Drivers")]
+        self.usernames = [row['Username'] for row in self.db.fetch_all(
+            "SELECT Username FROM Login WHERE User_Type = %s", (USER_TYPE_PASSENGER,)
+        )]
+        self.pending = []
+
+    def prepare_pending(self, count):
+        """Untimed setup for assign_driver: fresh pending bookings to assign"""
+        for _ in range(count):
+            success, _, booking_id = self.booking_ctrl.create_booking(
+                self.rng.choice(self.passenger_ids), 'Thamel', 'Boudha'
+            )
+            if success:
+                self.pending.append(booking_id)
+
+    def close(self):
+        self.db.disconnect()
+
+
+def case_create_booking(w):
+    pickup, destination = w.rng.sample(LOCATIONS, 2)
+    w.booking_ctrl.create_booking(w.rng.choice(w.passenger_ids), pickup, destination,
+                                  distance_km=round(w.rng.uniform(1, 25), 2))
+
+
+def case_assign_driver(w):
+    w.booking_ctrl.assign_driver(w.pending.pop(), w.rng.choice(w.driver_ids))
+
+
+def case_bookings_by_passenger(w):
+    w.booking_ctrl.get_bookings_by_passenger(w.rng.choice(w.passenger_ids))
+
+
+def case_all_bookings(w):
+    w.booking_ctrl.get_all_bookings()
+
+
+def case_report_progress(w):
+    """The admin Progress Report reads"""
+    w.passenger_ctrl.get_total_passengers_count()
+    w.driver_ctrl.get_total_drivers_count()
+    w.driver_ctrl.get_available_drivers_count()
+    w.vehicle_ctrl.get_total_vehicles_count()
+    w.booking_ctrl.get_booking_status_summary()
+    w.payment_ctrl.get_total_payments_count()
+    w.payment_ctrl.get_revenue_by_method()
+
+
+def case_report_daily(w):
+    w.booking_ctrl.get_booking_timeseries('Day', start=datetime.now() - timedelta(days=90))
+
+
+def case_report_monthly(w):
+    w.booking_ctrl.get_booking_timeseries('Month')
+
+
+def case_authenticate_user(w):
+    from Db.seed import SEED_PASSWORD
+    w.user_ctrl.authenticate_user(w.rng.choice(w.usernames), SEED_PASSWORD)
+
+
+# Case name -> (function, timed iterations); full-table reads and the password hash run fewer times
+CASES = {
+    'create_booking': (case_create_booking, 500),
+    'assign_driver': (case_assign_driver, 500),
+    'get_bookings_by_passenger': (case_bookings_by_passenger, 500),
+    'get_all_bookings': (case_all_bookings, 10),
+    'report_progress': (case_report_progress, 10),
+    'report_daily': (case_report_daily, 20),
+    'report_monthly': (case_report_monthly, 20),
+    'authenticate_user': (case_authenticate_user, 20),
+}
+WARMUP_FRACTION = 0.1
+
+
+def measure(function, workload, iterations):
+    """Time each call and summarise latency (ms) and throughput"""
+    for _ in range(max(1, int(iterations * WARMUP_FRACTION))):
+        function(workload)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        function(workload)
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'ops_per_sec': round(iterations / elapsed, 1),
+    }
+
+
+def run_size(template_path, iteration_scale, selected):
+    """Run every selected case against a fresh copy of one seeded database"""
+    work_dir = tempfile.mkdtemp(prefix='taxi_bench_')
+    working_path = os.path.join(work_dir, 'bench.db')
+    shutil.copy(template_path, working_path)
+
+    workload = Workload(working_path)
+    results = {}
+    try:
+        for name in selected:
+            function, iterations = CASES[name]
+            iterations = max(1, int(iterations * iteration_scale))
+            if name == 'assign_driver':
+                workload.prepare_pending(iterations + max(1, int(iterations * WARMUP_FRACTION)))
+            results[name] = measure(function, workload, iterations)
+            result = results[name]
+            print(f"  {name:<28} p50 {result['p50_ms']:9.3f} ms  p95 {result['p95_ms']:9.3f} ms  "
+                  f"p99 {result['p99_ms']:9.3f} ms  {result['ops_per_sec']:10.1f} ops/s")
+    finally:
+        workload.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return failure messages for cases that regressed past the threshold"""
+    failures = []
+    for size, cases in results.items():
+        for name, result in cases.items():
+            reference = baseline.get(size, {}).get(name)
+            if not reference:
+                failures.append(f"{name} @ {size}: not in the baseline (run with --record)")
+                continue
+            p95_limit = reference['p95_ms'] * (1 + threshold)
+            if result['p95_ms'] > p95_limit and result['p95_ms'] - reference['p95_ms'] > NOISE_FLOOR_MS:
+                failures.append(f"{name} @ {size}: p95 {result['p95_ms']:.3f} ms, "
+                                f"baseline {reference['p95_ms']:.3f} ms")
+            ops_limit = reference['ops_per_sec'] * (1 - threshold)
+            if result['ops_per_sec'] < ops_limit:
+                failures.append(f"{name} @ {size}: {result['ops_per_sec']:.1f} ops/s, "
+                                f"baseline {reference['ops_per_sec']:.1f} ops/s")
+    return failures
+
+
+def run(sizes=None, cases=None, data_dir=DEFAULT_DATA_DIR, baseline_path=BASELINE_PATH,
+        threshold=0.25, iteration_scale=1.0, workers=SEED_WORKERS, record=False):
+    """Benchmark every size and return a list of failure messages"""
+    selected = cases or list(CASES)
+    results = {}
+    for size in sizes or DEFAULT_SIZES:
+        template_path = seeded_database(data_dir, size, workers)
+        print(f"\n{size} bookings:")
+        results[str(size)] = run_size(template_path, iteration_scale, selected)
+
+    if record:
+        baseline = {}
+        if os.path.exists(baseline_path):
+            with open(baseline_path) as f:
+                baseline = json.load(f)
+        for size, size_results in results.items():
+            baseline.setdefault(size, {}).update(size_results)
+        with open(baseline_path, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {baseline_path}")
+        return []
+
+    if not os.path.exists(baseline_path):
+        return [f"no baseline at {baseline_path} (run with --record to record one)"]
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    return compare(results, baseline, threshold)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the hot controller paths")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated dataset sizes, in bookings")
+    parser.add_argument('--cases', default=None, help=f"comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="where seeded datasets are kept")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed regression, e.g. 0.25 = 25%%")
+    parser.add_argument('--iterations-scale', type=float, default=1.0, help="multiply every case's iterations")
+    parser.add_argument('--workers', type=int, default=SEED_WORKERS, help="processes used when seeding")
+    parser.add_argument('--record', '--save-baseline', dest='record', action='store_true',
+                        help="record these results as the baseline")
+    args = parser.parse_args()
+
+    unknown = [name for name in (args.cases or '').split(',') if name and name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    failures = run(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        cases=args.cases.split(',') if args.cases else None,
+        data_dir=args.data_dir,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+        iteration_scale=args.iterations_scale,
+        workers=args.workers,
+        record=args.record
+    )
+    if failures:
+        print("\nController benchmark regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nController benchmarks OK")
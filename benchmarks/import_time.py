@@ -0,0 +1,106 @@
+# benchmarks/import_time.py
+"""
+Import Time Benchmark - Guards the startup import path against regressions
+
+Runs a fresh interpreter with -X importtime for each entry point, reports the
+slowest imports and fails (exit code 1) when an entry point exceeds its time
+budget or pulls in a module it should only load on first use.
+
+Usage:
+    python -m benchmarks.import_time [--repeat 5] [--budget-scale 1.0]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the login path must not import; each loads on first use instead
+LAZY_MODULES = [
+    'mysql.connector',
+    'Db.base_db',
+    'UI.RegistrationPage',
+    'UI.Dashboard_Admin',
+    'UI.Dashboard_Passenger',
+    'UI.Dashboard_Driver',
+    'Controllers.UserController',
+    'Controllers.PassengerController',
+    'Controllers.DriverController',
+    'Controllers.VehicleController',
+    'Controllers.BookingController',
+    'Controllers.PaymentController',
+    'Models.BookingFrame',
+    'numpy',
+]
+
+# Entry point -> cumulative import budget in milliseconds (median of runs)
+ENTRY_POINTS = {
+    'main': 150,
+    'UI.LoginPage': 150,
+}
+
+
+def measure(module_name):
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        dict: imported module name -> (self_us, cumulative_us)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module_name} failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def run(repeat=5, budget_scale=1.0, top=10):
+    """Measure every entry point and return a list of failure messages"""
+    failures = []
+
+    for module_name, budget_ms in ENTRY_POINTS.items():
+        runs = [measure(module_name) for _ in range(repeat)]
+        totals = sorted(r[module_name][1] / 1000 for r in runs)
+        median_ms = totals[len(totals) // 2]
+        limit_ms = budget_ms * budget_scale
+
+        print(f"\n{module_name}: {median_ms:.1f} ms cumulative (budget {limit_ms:.0f} ms)")
+        slowest = sorted(runs[0].items(), key=lambda item: item[1][0], reverse=True)[:top]
+        for name, (self_us, cumulative_us) in slowest:
+            print(f"  {self_us / 1000:8.2f} ms self  {cumulative_us / 1000:8.2f} ms cumulative  {name}")
+
+        if median_ms > limit_ms:
+            failures.append(f"{module_name} imports in {median_ms:.1f} ms, over the {limit_ms:.0f} ms budget")
+
+        eager = [name for name in LAZY_MODULES if name in runs[0]]
+        if eager:
+            failures.append(f"{module_name} eagerly imports: {', '.join(eager)}")
+
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check startup import time")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per entry point (median is used)")
+    parser.add_argument('--budget-scale', type=float, default=1.0, help="multiply every budget, e.g. for slow machines")
+    args = parser.parse_args()
+
+    failures = run(repeat=args.repeat, budget_scale=args.budget_scale)
+    if failures:
+        print("\nImport time regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nImport time OK")
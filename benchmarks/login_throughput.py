@@ -0,0 +1,123 @@
+# benchmarks/login_throughput.py
+"""
+Login Throughput Benchmark - Data for choosing PASSWORD_HASH_ITERATIONS
+
+Verifies a password against PBKDF2 hashes of several iteration counts and
+reports the per-login latency and how many logins per second one process
+sustains with 1..N threads verifying at once (hashlib releases the GIL
+while hashing, so threads scale with cores). The database lookup is
+negligible next to the hash; benchmarks.controllers times it end to end.
+
+Recommends the highest tested cost whose median verification stays within
+--target-ms, and fails (exit code 1) when the configured cost does not.
+
+Usage:
+    python -m benchmarks.login_throughput [--iterations 100000,310000,600000]
+                                          [--threads 1,4] [--duration 2] [--target-ms 500]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from config import PASSWORD_HASH_ITERATIONS
+from passwords import hash_password, verify_password
+
+DEFAULT_COSTS = [100000, 210000, 310000, 600000, 1000000]
+PASSWORD = "benchmark-password"
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure_latency(stored, duration):
+    """Verify repeatedly on one thread; return sorted latencies in ms"""
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline or len(latencies) < 3:
+        start = time.perf_counter()
+        verify_password(PASSWORD, stored)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def measure_throughput(stored, threads, duration):
+    """Verify from several threads at once; return logins per second"""
+    counts = [0] * threads
+    deadline = time.perf_counter() + duration
+
+    def worker(index):
+        while time.perf_counter() < deadline:
+            verify_password(PASSWORD, stored)
+            counts[index] += 1
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - started)
+
+
+def run(costs=None, thread_counts=None, duration=2.0, target_ms=500):
+    """Measure every cost and return a list of failure messages"""
+    costs = sorted(set((costs or DEFAULT_COSTS) + [PASSWORD_HASH_ITERATIONS]))
+    thread_counts = thread_counts or sorted({1, os.cpu_count() or 1})
+
+    header = f"{'Iterations':>12}  {'p50 ms':>8}  {'p95 ms':>8}"
+    header += ''.join(f"  {f'logins/s x{n}':>14}" for n in thread_counts)
+    print(header)
+
+    medians = {}
+    for cost in costs:
+        stored = hash_password(PASSWORD, iterations=cost)
+        latencies = measure_latency(stored, duration)
+        medians[cost] = percentile(latencies, 0.50)
+
+        line = f"{cost:>12,}  {medians[cost]:8.1f}  {percentile(latencies, 0.95):8.1f}"
+        for threads in thread_counts:
+            line += f"  {measure_throughput(stored, threads, duration):14.1f}"
+        if cost == PASSWORD_HASH_ITERATIONS:
+            line += "  <- configured"
+        print(line)
+
+    within_target = [cost for cost in costs if medians[cost] <= target_ms]
+    if within_target:
+        print(f"\nHighest tested cost within {target_ms:.0f} ms: {max(within_target):,} iterations")
+    else:
+        print(f"\nNo tested cost verifies within {target_ms:.0f} ms")
+
+    failures = []
+    if medians[PASSWORD_HASH_ITERATIONS] > target_ms:
+        failures.append(f"PASSWORD_HASH_ITERATIONS={PASSWORD_HASH_ITERATIONS:,} verifies in "
+                        f"{medians[PASSWORD_HASH_ITERATIONS]:.0f} ms, over the {target_ms:.0f} ms target")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure login verification cost per PBKDF2 iteration count")
+    parser.add_argument('--iterations', default=','.join(str(cost) for cost in DEFAULT_COSTS),
+                        help="comma-separated iteration counts to try")
+    parser.add_argument('--threads', default=None, help="comma-separated thread counts (default: 1 and CPU count)")
+    parser.add_argument('--duration', type=float, default=2.0, help="seconds per measurement")
+    parser.add_argument('--target-ms', type=float, default=500, help="acceptable median login verification time")
+    args = parser.parse_args()
+
+    failures = run(
+        costs=[int(cost) for cost in args.iterations.split(',')],
+        thread_counts=[int(n) for n in args.threads.split(',')] if args.threads else None,
+        duration=args.duration,
+        target_ms=args.target_ms
+    )
+    if failures:
+        print("\nLogin cost regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nLogin cost OK")
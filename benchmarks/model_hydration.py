@@ -0,0 +1,98 @@
+# benchmarks/model_hydration.py
+"""
+Model Hydration Benchmark - Time and memory to build models from rows
+
+Compares the dictionary-row path (from_db_row, as returned by a dictionary
+cursor) with the positional tuple-row path (column_getter + from_tuple) and
+reports time and retained memory per 100k rows, plus the memory the same
+models would take without __slots__. No database is needed.
+
+Usage:
+    python -m benchmarks.model_hydration [--rows 100000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from Models.BookingModel import BookingModel
+from Models.DriverModel import DriverModel
+from Models.PaymentModel import PaymentModel
+
+
+def booking_row(i, start):
+    return (i, i % 5000 + 1, i % 800 + 1, f"Pickup {i % 300}", f"Destination {i % 300}",
+            "Completed", Decimal("215.50"), Decimal("11.03"),
+            start + timedelta(minutes=i), start + timedelta(minutes=i + 25))
+
+
+def payment_row(i, start):
+    return (i, i, Decimal("215.50"), "Cash", "Completed", start + timedelta(minutes=i))
+
+
+def driver_row(i, start):
+    return (i, f"Driver {i}", f"LIC{i:08d}", f"98{i:08d}"[:10], f"driver{i}@example.com",
+            "Available", i, start)
+
+
+class DictBacked:
+    """Stand-in for the previous models, which kept attributes in a __dict__"""
+
+    def __init__(self, attributes):
+        self.__dict__.update(attributes)
+
+
+def measure(build):
+    """Run build() and return (seconds, bytes retained by its result)"""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+
+    # Memory is measured on a second run; tracing would distort the timing
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def run(rows):
+    start = datetime(2024, 1, 1)
+    cases = [
+        (BookingModel, booking_row),
+        (PaymentModel, payment_row),
+        (DriverModel, driver_row),
+    ]
+
+    scale = 100000 / rows
+    print(f"{'model':<14}{'path':<10}{'ms / 100k':>12}{'MB / 100k':>12}")
+    for model_class, make_row in cases:
+        tuples = [make_row(i, start) for i in range(1, rows + 1)]
+        getter = model_class.column_getter(model_class.COLUMNS)
+
+        # Time includes the per-row dict a dictionary cursor would have allocated
+        dict_time, dict_memory = measure(
+            lambda: [model_class.from_db_row(dict(zip(model_class.COLUMNS, row))) for row in tuples]
+        )
+        tuple_time, tuple_memory = measure(
+            lambda: [model_class.from_tuple(row, getter) for row in tuples]
+        )
+        models = [model_class.from_tuple(row, getter) for row in tuples]
+        _, unslotted_memory = measure(lambda: [DictBacked(model.to_dict()) for model in models])
+
+        name = model_class.__name__
+        print(f"{name:<14}{'dict':<10}{dict_time * 1000 * scale:>12.1f}{dict_memory * scale / 1e6:>12.1f}")
+        print(f"{name:<14}{'tuple':<10}{tuple_time * 1000 * scale:>12.1f}{tuple_memory * scale / 1e6:>12.1f}")
+        print(f"{name:<14}{'no slots':<10}{'':>12}{unslotted_memory * scale / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark model hydration")
+    parser.add_argument('--rows', type=int, default=100000, help="rows per model")
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,99 @@
+# benchmarks/service_load.py
+"""
+Service Load Benchmark - Requests/sec against a running booking service
+
+Opens --concurrency keep-alive connections to service.py and sends requests
+back to back for --duration seconds, then reports throughput, latency
+percentiles and the status codes seen. Start the service first:
+
+    python service.py
+    python -m benchmarks.service_load [--path /drivers/available] [--concurrency 32] [--duration 10]
+
+Use --method POST --body '{"booking_id": 1, ...}' to load a write endpoint.
+"""
+import argparse
+import asyncio
+import time
+from config import SERVICE_HOST, SERVICE_PORT
+
+
+async def worker(host, port, request, deadline, latencies, statuses):
+    """Send requests on one connection until the deadline"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line:
+                break
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+
+            latencies.append(time.perf_counter() - start)
+            status = int(status_line.split()[1])
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run(args):
+    body = args.body.encode('utf-8') if args.body else b''
+    request = (
+        f"{args.method} {args.path} HTTP/1.1\r\n"
+        f"Host: {args.host}:{args.port}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"\r\n"
+    ).encode('latin-1') + body
+
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        worker(args.host, args.port, request, deadline, latencies, statuses)
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{args.method} {args.path}  concurrency={args.concurrency}  duration={elapsed:.1f}s")
+    print(f"  requests      {len(latencies)}")
+    print(f"  requests/sec  {len(latencies) / elapsed:.1f}")
+    for label, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+        print(f"  {label:<13} {percentile(latencies, fraction) * 1000:.2f} ms")
+    print(f"  status codes  {dict(sorted(statuses.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure booking service throughput")
+    parser.add_argument('--host', default=SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=SERVICE_PORT)
+    parser.add_argument('--method', default='GET')
+    parser.add_argument('--path', default='/drivers/available')
+    parser.add_argument('--body', default='', help="JSON request body")
+    parser.add_argument('--concurrency', type=int, default=32, help="parallel keep-alive connections")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds to run")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
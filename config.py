@@ -8,6 +8,11 @@ Contains all application-wide settings for UI, colors, fonts, and database
 # DATABASE CONFIGURATION
 # =============================================================================
 
+# "mysql" connects to the server in DB_CONFIG; "sqlite" uses the embedded
+# database file at SQLITE_PATH (no server; ":memory:" keeps it in-process)
+DB_BACKEND = "mysql"
+SQLITE_PATH = "taxi_booking.db"
+
 DB_CONFIG = {
     'host': 'localhost',
     'port': 3306,
@@ -16,6 +21,35 @@ DB_CONFIG = {
     'database': 'taxi_booking_db'
 }
 
+# Server-side prepared statements kept open per connection (LRU, keyed by SQL text).
+# Set to 0 to send every statement as plain text.
+PREPARED_STATEMENT_CACHE_SIZE = 64
+
+# Worker threads (each with its own connection) behind Controllers.AsyncServices
+ASYNC_WORKERS = 16
+
+# Read-through cache for driver/passenger lookups by ID
+ENTITY_CACHE_SIZE = 1024        # Max rows kept per entity type
+ENTITY_CACHE_TTL = 60           # Seconds before a cached row is re-read
+
+# Booking archiver (Db/archiver.py): finished bookings older than this move
+# to Bookings_Archive; list queries only read the archive when asked to
+ARCHIVE_AFTER_DAYS = 180
+ARCHIVE_BATCH_SIZE = 1000
+
+# Data seeder (Db/seed.py): rows per multi-row INSERT and worker processes
+SEED_BATCH_SIZE = 2000
+SEED_WORKERS = 4
+
+# Query statistics (Db/query_stats.py): per-statement timings for every
+# BaseDB; statements at least SLOW_QUERY_MS slow go to the slow-query log,
+# with their query plan when SLOW_QUERY_EXPLAIN is on (SELECTs only)
+QUERY_STATS_ENABLED = True
+SLOW_QUERY_MS = 200
+SLOW_QUERY_LOG_SIZE = 200
+SLOW_QUERY_EXPLAIN = True
+QUERY_STATS_REPORT_LIMIT = 50     # Statements listed in the admin Query Statistics report
+
 # Default Admin Credentials
 DEFAULT_ADMIN = {
     'username': 'admin',
@@ -23,6 +57,11 @@ DEFAULT_ADMIN = {
     'user_type': 'Admin'
 }
 
+# Password hashing (passwords.py): PBKDF2-HMAC-SHA256 iterations for new
+# hashes. Measure with python -m benchmarks.login_throughput; stored hashes
+# with another count are upgraded on the user's next login.
+PASSWORD_HASH_ITERATIONS = 600000
+
 
 # =============================================================================
 # APPLICATION WINDOW SETTINGS
@@ -285,7 +324,7 @@ def validate_license_plate(plate):
 # APPLICATION SETTINGS
 # =============================================================================
 
-# Debug Mode
+# Debug Mode (also starts with action profiling on, see profiling.py)
 DEBUG_MODE = False
 
 # Date Format
@@ -308,6 +347,44 @@ def calculate_fare(distance_km):
     """Calculate fare based on distance"""
     return BASE_FARE + (distance_km * FARE_PER_KM)
 
+# Trend Report (bucket -> default look-back in days, None = all history)
+REPORT_BUCKET_WINDOWS = {
+    "Hour": 2,
+    "Day": 90,
+    "Week": 365,
+    "Month": None,
+}
+REPORT_BUCKETS = list(REPORT_BUCKET_WINDOWS)
+
+# Dashboards poll for rows other sessions changed (Updated_At delta sync)
+DELTA_POLL_SECONDS = 5
+# How often the Tk loop picks up results posted by worker threads (UI/tk_dispatch.py)
+UI_QUEUE_POLL_MS = 50
+
+# Screen timing (UI/screen_timing.py): dashboard screens slower than this are
+# logged to the console; the shortcut opens the diagnostics panel
+SLOW_SCREEN_MS = 500
+SCREEN_TIMING_LOG_SIZE = 200
+DIAGNOSTICS_SHORTCUT = "<Control-Shift-D>"
+
+# Action profiling (profiling.py): switched on by DEBUG_MODE or from the
+# admin Settings screen; actions faster than PROFILE_MIN_MS are not written
+PROFILE_DIR = "profiles"
+PROFILE_SAMPLE_RATE = 1.0       # Fraction of actions profiled
+PROFILE_MIN_MS = 50
+PROFILE_MEMORY = True           # Also trace allocations with tracemalloc
+PROFILE_TOP_FUNCTIONS = 30      # Functions listed in each profile summary
+
+
+# =============================================================================
+# BOOKING SERVICE (service.py)
+# =============================================================================
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8080
+SERVICE_MAX_BODY = 64 * 1024        # Largest accepted request body in bytes
+SERVICE_SESSION_SECONDS = 3600      # Lifetime of a token issued by POST /sessions
+
 
 # =============================================================================
 # ERROR MESSAGES
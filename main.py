@@ -1,11 +1,15 @@
 
 import sys
+import time
+import threading
 import traceback
-from Db.DatabaseCRUD import DatabaseCRUD
 from config import DEFAULT_ADMIN, WINDOW_TITLE
 
+LAUNCH_TIME = time.perf_counter()
+
 def initialize_database():    
     try:
+        from Db.DatabaseCRUD import DatabaseCRUD
         db = DatabaseCRUD()
         
         success = db.setup_database()
@@ -14,9 +18,28 @@ def initialize_database():
     except Exception as e:
         traceback.print_exc()
         return None
+
+def initialize_database_in_background(db_ready):
+    """Run database setup on a worker thread and set db_ready when it finishes"""
+    def worker():
+        start = time.perf_counter()
+        db = initialize_database()
+        if db:
+            db.disconnect()
+        print(f"Database initialized in {(time.perf_counter() - start) * 1000:.0f} ms")
+        db_ready.set()
+    
+    thread = threading.Thread(target=worker, name="db-init", daemon=True)
+    thread.start()
+    return thread
+
+def report_login_ready():
+    print(f"Login window ready in {(time.perf_counter() - LAUNCH_TIME) * 1000:.0f} ms")
+
 def launch_application():
-    # Step 1: Initialize Database
-    db = initialize_database()
+    # Step 1: Initialize Database in the background so the login window shows immediately
+    db_ready = threading.Event()
+    initialize_database_in_background(db_ready)
     try:
         import tkinter as tk
         from UI.LoginPage import LoginPage
@@ -25,7 +48,8 @@ def launch_application():
         root = tk.Tk()
         
         # Create and run login page
-        login_app = LoginPage(root)
+        login_app = LoginPage(root, db_ready=db_ready)
+        root.after_idle(report_login_ready)
         login_app.run()
         
     except ImportError as e:
@@ -0,0 +1,98 @@
+# passwords.py
+"""
+Password Hashing - Salted PBKDF2-HMAC-SHA256 for Login.Password
+
+Hashes are stored as
+
+    pbkdf2_sha256$<iterations>$<salt>$<hash>
+
+with a random 16-byte salt per password (salt and hash base64-encoded).
+The cost is PASSWORD_HASH_ITERATIONS; choose it with
+
+    python -m benchmarks.login_throughput
+
+Rows written before hashing was introduced hold the plain password.
+verify_password still accepts them and reports that they need rehashing,
+as it does for hashes made with a different iteration count, so
+UserController.authenticate_user upgrades each row on its next login.
+"""
+import base64
+import hashlib
+import hmac
+import os
+from config import PASSWORD_HASH_ITERATIONS
+
+ALGORITHM = 'pbkdf2_sha256'
+SALT_BYTES = 16
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode('ascii')
+
+
+def _derive(password, salt, iterations):
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+
+
+def hash_password(password, iterations=PASSWORD_HASH_ITERATIONS):
+    """
+    Hash a password with a new random salt
+
+    Returns:
+        str: "pbkdf2_sha256$<iterations>$<salt>$<hash>"
+    """
+    salt = os.urandom(SALT_BYTES)
+    return f"{ALGORITHM}${iterations}${_b64(salt)}${_b64(_derive(password, salt, iterations))}"
+
+
+def is_hashed(stored):
+    """True if a stored password is a hash rather than a legacy plain password"""
+    return bool(stored) and stored.startswith(ALGORITHM + '$')
+
+
+def verify_password(password, stored):
+    """
+    Check a password against its stored form
+
+    Args:
+        password (str): Password as typed
+        stored (str): Login.Password - a hash, or a legacy plain password
+
+    Returns:
+        tuple: (matches, needs_rehash) - needs_rehash is True when the
+               password matched but is stored in plain text or with an
+               iteration count other than PASSWORD_HASH_ITERATIONS
+    """
+    if not stored:
+        return False, False
+
+    if not is_hashed(stored):
+        matches = hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+        return matches, matches
+
+    try:
+        _, iterations, salt, expected = stored.split('$')
+        iterations = int(iterations)
+        salt = base64.b64decode(salt)
+        expected = base64.b64decode(expected)
+    except ValueError:
+        return False, False
+
+    matches = hmac.compare_digest(_derive(password, salt, iterations), expected)
+    return matches, matches and iterations != PASSWORD_HASH_ITERATIONS
+
+
+_dummy_hash = None
+
+
+def burn_verification(password):
+    """
+    Spend the time of one verification without a stored hash
+
+    Called for unknown usernames so a failed login takes as long whether
+    or not the account exists.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = hash_password('')
+    verify_password(password, _dummy_hash)
@@ -0,0 +1,191 @@
+# profiling.py
+"""
+Profiling - On-demand cProfile / tracemalloc capture of user actions
+
+Controller classes and dashboards are decorated with @profile_methods, so
+each public method call is an "action". While the profiler is enabled
+(DEBUG_MODE at startup, or the switch in the admin Settings screen) a
+sample of actions (PROFILE_SAMPLE_RATE) runs under cProfile, and with
+PROFILE_MEMORY also under tracemalloc. Actions taking at least
+PROFILE_MIN_MS are written to PROFILE_DIR as:
+
+    <time>_<Class.method>.prof   - pstats data (python -m pstats, snakeviz, ...)
+    <time>_<Class.method>.txt    - top functions by cumulative time, and
+                                   the largest allocations when tracing memory
+
+Handlers a screen defines as closures (button commands, key bindings)
+are wrapped with profiled() where the screen registers them.
+
+One action is profiled at a time per process; calls made inside it (a
+dashboard handler's controller calls) are part of its profile, and actions
+started on other threads meanwhile run unprofiled. While disabled the
+decorators cost one attribute check per call.
+"""
+import functools
+import inspect
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from config import (DEBUG_MODE, PROFILE_DIR, PROFILE_SAMPLE_RATE, PROFILE_MIN_MS, PROFILE_MEMORY,
+                    PROFILE_TOP_FUNCTIONS)
+
+# Stack depth tracemalloc records per allocation
+MEMORY_TRACE_FRAMES = 10
+# Allocation sites listed in each .txt summary
+MEMORY_TOP_LINES = 15
+
+
+def _memory_snapshot():
+    """tracemalloc snapshot without tracemalloc's own allocations"""
+    import tracemalloc
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+class Profiler:
+    """
+    Runs sampled actions under cProfile / tracemalloc and writes the results
+    """
+
+    def __init__(self, enabled=DEBUG_MODE, trace_memory=PROFILE_MEMORY, output_dir=PROFILE_DIR,
+                 sample_rate=PROFILE_SAMPLE_RATE, min_ms=PROFILE_MIN_MS):
+        """
+        Initialize Profiler
+
+        Args:
+            enabled (bool): Profile actions
+            trace_memory (bool): Also record allocations with tracemalloc
+            output_dir (str): Directory profile files are written to
+            sample_rate (float): Fraction of actions profiled (0-1)
+            min_ms (float): Faster actions are discarded instead of written
+        """
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.min_ms = min_ms
+        self.enabled = False
+        self.trace_memory = False
+        self.profiles_written = 0
+        self.last_profile = None
+        self._tracing = False
+        self._active = threading.Lock()
+        self.configure(enabled, trace_memory)
+
+    def configure(self, enabled, trace_memory=None):
+        """
+        Switch profiling (and optionally memory tracing) on or off at runtime
+
+        tracemalloc slows every allocation, so it only runs while both are on.
+        """
+        import tracemalloc
+
+        if trace_memory is not None:
+            self.trace_memory = trace_memory
+        self.enabled = enabled
+
+        want_tracing = self.enabled and self.trace_memory
+        if want_tracing and not self._tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(MEMORY_TRACE_FRAMES)
+            self._tracing = True
+        elif not want_tracing and self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def run(self, action, function, *args, **kwargs):
+        """Call function, profiling it as the named action if it is sampled"""
+        if not self.enabled or random.random() >= self.sample_rate:
+            return function(*args, **kwargs)
+        # Another action (possibly the caller) is already being profiled
+        if not self._active.acquire(blocking=False):
+            return function(*args, **kwargs)
+
+        try:
+            import cProfile
+            import tracemalloc
+
+            tracing = self._tracing and tracemalloc.is_tracing()
+            memory_before = None
+            if tracing:
+                tracemalloc.reset_peak()
+                memory_before = _memory_snapshot()
+
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (e.g. an outer cProfile run) owns the hook
+                return function(*args, **kwargs)
+
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profile.disable()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if elapsed_ms >= self.min_ms:
+                    memory = None
+                    if tracing:
+                        memory = (_memory_snapshot(), memory_before, tracemalloc.get_traced_memory()[1])
+                    self._write(action, profile, elapsed_ms, memory)
+        finally:
+            self._active.release()
+
+    def _write(self, action, profile, elapsed_ms, memory):
+        """Dump one action's profile and a readable summary next to it"""
+        import pstats
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:-3]
+            safe_action = re.sub(r'[^\w.-]+', '_', action)
+            base_path = os.path.join(self.output_dir, f"{stamp}_{safe_action}")
+
+            profile.dump_stats(base_path + '.prof')
+            with open(base_path + '.txt', 'w', encoding='utf-8') as f:
+                f.write(f"{action}: {elapsed_ms:.1f} ms\n")
+                if memory:
+                    after, before, peak = memory
+                    f.write(f"\nPeak traced memory: {peak / 1024:.1f} KiB\n")
+                    f.write("Largest allocation changes:\n")
+                    for stat in after.compare_to(before, 'lineno')[:MEMORY_TOP_LINES]:
+                        f.write(f"  {stat}\n")
+                f.write("\n")
+                stats = pstats.Stats(profile, stream=f)
+                stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+
+            self.profiles_written += 1
+            self.last_profile = base_path + '.prof'
+        except OSError as e:
+            print(f"Writing profile for {action} failed: {e}")
+
+
+profiler = Profiler()
+
+
+def profiled(function):
+    """Profile calls to function as an action named by its qualified name"""
+    action = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return function(*args, **kwargs)
+        return profiler.run(action, function, *args, **kwargs)
+    return wrapper
+
+
+def profile_methods(cls):
+    """
+    Class decorator: profile every public method of a controller or dashboard
+
+    Generator methods (iter_*) are left alone: calling one only creates the
+    generator, and the work happens later in whoever consumes it, which is
+    profiled as part of that action.
+    """
+    for name, value in list(vars(cls).items()):
+        if (not name.startswith('_') and inspect.isfunction(value)
+                and not inspect.isgeneratorfunction(value)):
+            setattr(cls, name, profiled(value))
+    return cls
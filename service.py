@@ -0,0 +1,373 @@
+"""
+Booking Service - Headless HTTP/JSON API for bookings, drivers and payments
+
+Lets driver apps and kiosks use the booking controllers without a Tk
+dashboard. Requests are parsed on one asyncio event loop and controller
+calls run on the AsyncServices worker pool (one database connection per
+worker). Keep-alive connections are supported.
+
+Usage:
+    python service.py [--host 127.0.0.1] [--port 8080] [--workers 16]
+
+Endpoints:
+    POST /sessions                  {username, password} -> {token, expires_in} (no token needed)
+    POST /bookings                  {passenger_id, pickup_location, destination, distance_km}
+    GET  /bookings/<id>
+    POST /bookings/<id>/assign      {driver_id}
+    POST /bookings/<id>/status      {status}
+    GET  /drivers/available
+    POST /payments                  {booking_id, amount, payment_method}
+    POST /payments/<id>/complete
+    GET  /stats                     request counts, requests/sec and latency (admin)
+    GET  /stats/queries             heaviest SQL statements and the slow-query log (admin)
+
+Every other endpoint needs a token from POST /sessions, which checks the
+same Login accounts as the dashboards, sent as "Authorization: Bearer
+<token>"; the /stats endpoints also need an admin account. The password is
+verified once per session, as hashing is slow by design. Without a valid
+token the answer is 401, and 403 for a non-admin on /stats.
+"""
+import asyncio
+import json
+import re
+import secrets
+import time
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from http import HTTPStatus
+from Controllers.AsyncServices import AsyncServices
+from Db.query_stats import query_stats
+from config import (SERVICE_HOST, SERVICE_PORT, SERVICE_MAX_BODY, SERVICE_SESSION_SECONDS,
+                    ASYNC_WORKERS, BOOKING_STATUSES)
+
+# Window for the "current" requests/sec figure in /stats
+RATE_WINDOW_SECONDS = 10
+
+
+class BadRequest(Exception):
+    """Invalid request body or parameters (answered with 400)"""
+
+
+def to_json(value):
+    """Encode a response payload (dates as ISO strings, DECIMAL as float)"""
+    def default(obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, Decimal):
+            return float(obj)
+        raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+    return json.dumps(value, default=default).encode('utf-8')
+
+
+def result_response(result, id_name=None, created=False):
+    """Turn a controller (success, message[, id]) tuple into (status, payload)"""
+    success, message = result[0], result[1]
+    payload = {'success': success, 'message': message}
+    if id_name and len(result) > 2:
+        payload[id_name] = result[2]
+    if success:
+        return (HTTPStatus.CREATED if created else HTTPStatus.OK), payload
+    if 'not found' in str(message).lower():
+        return HTTPStatus.NOT_FOUND, payload
+    return HTTPStatus.BAD_REQUEST, payload
+
+
+def require(body, *fields):
+    """Get required fields from a JSON body, raising BadRequest if any is missing"""
+    missing = [field for field in fields if body.get(field) in (None, '')]
+    if missing:
+        raise BadRequest(f"Missing field(s): {', '.join(missing)}")
+    return [body[field] for field in fields]
+
+
+class ServiceStats:
+    """Request counters for /stats"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.total = 0
+        self.by_route = {}
+        self.by_status = {}
+        self.latency_total = 0.0
+        self.recent = deque()
+
+    def record(self, route, status, elapsed):
+        now = time.monotonic()
+        self.total += 1
+        self.by_route[route] = self.by_route.get(route, 0) + 1
+        self.by_status[int(status)] = self.by_status.get(int(status), 0) + 1
+        self.latency_total += elapsed
+        self.recent.append(now)
+        while self.recent and self.recent[0] < now - RATE_WINDOW_SECONDS:
+            self.recent.popleft()
+
+    def snapshot(self, workers):
+        now = time.monotonic()
+        while self.recent and self.recent[0] < now - RATE_WINDOW_SECONDS:
+            self.recent.popleft()
+        uptime = now - self.started
+        return {
+            'uptime_seconds': round(uptime, 1),
+            'workers': workers,
+            'requests': self.total,
+            'requests_per_second': round(self.total / uptime, 1) if uptime else 0.0,
+            'recent_requests_per_second': round(len(self.recent) / min(uptime, RATE_WINDOW_SECONDS), 1) if uptime else 0.0,
+            'avg_latency_ms': round(self.latency_total / self.total * 1000, 2) if self.total else 0.0,
+            'by_route': self.by_route,
+            'by_status': self.by_status
+        }
+
+
+class SessionStore:
+    """
+    Tokens issued by POST /sessions
+
+    Only used from the event loop thread, so no locking.
+    """
+
+    def __init__(self, lifetime=SERVICE_SESSION_SECONDS):
+        self.lifetime = lifetime
+        self._sessions = {}
+
+    def issue(self, user):
+        """Start a session for an authenticated UserModel and return its token"""
+        now = time.monotonic()
+        for token in [token for token, session in self._sessions.items() if session['expires'] <= now]:
+            del self._sessions[token]
+        token = secrets.token_urlsafe(32)
+        self._sessions[token] = {
+            'user_id': user.user_id,
+            'admin': user.is_admin(),
+            'expires': now + self.lifetime
+        }
+        return token
+
+    def get(self, token):
+        """Get a live session by token, or None"""
+        session = self._sessions.get(token)
+        if session is None:
+            return None
+        if session['expires'] <= time.monotonic():
+            del self._sessions[token]
+            return None
+        return session
+
+
+class BookingService:
+    """Routes HTTP requests to the async controller pool"""
+
+    def __init__(self, workers=ASYNC_WORKERS):
+        self.services = AsyncServices(workers=workers)
+        self.stats = ServiceStats()
+        self.sessions = SessionStore()
+        # (method, path pattern, handler, access: None = anyone, 'user' or 'admin')
+        self.routes = [
+            ('POST', re.compile(r'^/sessions$'), self.create_session, None),
+            ('POST', re.compile(r'^/bookings$'), self.create_booking, 'user'),
+            ('GET', re.compile(r'^/bookings/(\d+)$'), self.get_booking, 'user'),
+            ('POST', re.compile(r'^/bookings/(\d+)/assign$'), self.assign_driver, 'user'),
+            ('POST', re.compile(r'^/bookings/(\d+)/status$'), self.update_status, 'user'),
+            ('GET', re.compile(r'^/drivers/available$'), self.available_drivers, 'user'),
+            ('POST', re.compile(r'^/payments$'), self.create_payment, 'user'),
+            ('POST', re.compile(r'^/payments/(\d+)/complete$'), self.complete_payment, 'user'),
+            ('GET', re.compile(r'^/stats$'), self.get_stats, 'admin'),
+            ('GET', re.compile(r'^/stats/queries$'), self.get_query_stats, 'admin'),
+        ]
+
+    # -------------------- ENDPOINTS -------------------- #
+
+    async def create_session(self, body):
+        """
+        Verify a username and password once and issue a token
+
+        Verification runs on the worker pool, as password hashing is slow
+        by design.
+        """
+        username, password = require(body, 'username', 'password')
+        user = await self.services.user.authenticate_user(str(username), str(password))
+        if user is None:
+            return HTTPStatus.UNAUTHORIZED, {'success': False, 'message': "Invalid username or password"}
+        return HTTPStatus.CREATED, {
+            'success': True,
+            'token': self.sessions.issue(user),
+            'expires_in': self.sessions.lifetime
+        }
+
+    async def create_booking(self, body):
+        passenger_id, pickup, destination = require(body, 'passenger_id', 'pickup_location', 'destination')
+        distance_km = body.get('distance_km')
+        result = await self.services.booking.create_booking(
+            int(passenger_id), pickup, destination,
+            distance_km=float(distance_km) if distance_km is not None else None
+        )
+        return result_response(result, 'booking_id', created=True)
+
+    async def get_booking(self, body, booking_id):
+        booking = await self.services.booking.get_booking_by_id(int(booking_id))
+        if booking is None:
+            return HTTPStatus.NOT_FOUND, {'success': False, 'message': "Booking not found"}
+        return HTTPStatus.OK, booking.to_dict()
+
+    async def assign_driver(self, body, booking_id):
+        driver_id, = require(body, 'driver_id')
+        result = await self.services.booking.assign_driver(int(booking_id), int(driver_id))
+        return result_response(result)
+
+    async def update_status(self, body, booking_id):
+        status, = require(body, 'status')
+        if status not in BOOKING_STATUSES:
+            raise BadRequest(f"Invalid status. Must be one of: {', '.join(BOOKING_STATUSES)}")
+        result = await self.services.booking.update_booking_status(int(booking_id), status)
+        return result_response(result)
+
+    async def available_drivers(self, body):
+        drivers = await self.services.driver.get_available_drivers()
+        return HTTPStatus.OK, [driver.to_dict() for driver in drivers]
+
+    async def create_payment(self, body):
+        booking_id, amount, payment_method = require(body, 'booking_id', 'amount', 'payment_method')
+        result = await self.services.payment.create_payment(int(booking_id), float(amount), payment_method)
+        return result_response(result, 'payment_id', created=True)
+
+    async def complete_payment(self, body, payment_id):
+        result = await self.services.payment.mark_as_completed(int(payment_id))
+        return result_response(result)
+
+    async def get_stats(self, body):
+        return HTTPStatus.OK, self.stats.snapshot(self.services.workers)
+
+    async def get_query_stats(self, body):
+        return HTTPStatus.OK, query_stats.snapshot()
+
+    # -------------------- HTTP -------------------- #
+
+    def bearer_token(self, authorization):
+        """Get the token from an "Authorization: Bearer <token>" header, or None"""
+        scheme, _, token = (authorization or '').partition(' ')
+        if scheme.lower() != 'bearer' or not token.strip():
+            return None
+        return token.strip()
+
+    async def dispatch(self, method, path, raw_body, headers=None):
+        """
+        Route one request
+
+        Returns:
+            tuple: (route label, HTTPStatus, payload)
+        """
+        path = path.split('?', 1)[0]
+        allowed = False
+        for route_method, pattern, handler, access in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+
+            label = f"{method} {pattern.pattern.strip('^$')}"
+            if access:
+                token = self.bearer_token((headers or {}).get('authorization'))
+                session = self.sessions.get(token) if token else None
+                if session is None:
+                    return label, HTTPStatus.UNAUTHORIZED, {'success': False, 'message': "Login required"}
+                if access == 'admin' and not session['admin']:
+                    return label, HTTPStatus.FORBIDDEN, {'success': False, 'message': "Admin login required"}
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+                if not isinstance(body, dict):
+                    raise BadRequest("Request body must be a JSON object")
+                status, payload = await handler(body, *match.groups())
+            except (BadRequest, ValueError, TypeError) as e:
+                status, payload = HTTPStatus.BAD_REQUEST, {'success': False, 'message': str(e)}
+            except Exception as e:
+                print(f"Service error on {label}: {e}")
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'success': False, 'message': "Internal error"}
+            return label, status, payload
+
+        if allowed:
+            return 'other', HTTPStatus.METHOD_NOT_ALLOWED, {'success': False, 'message': "Method not allowed"}
+        return 'other', HTTPStatus.NOT_FOUND, {'success': False, 'message': "Unknown endpoint"}
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one (keep-alive) connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    self._write(writer, HTTPStatus.BAD_REQUEST, {'success': False, 'message': "Bad request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length') or 0)
+                if length > SERVICE_MAX_BODY:
+                    self._write(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'success': False, 'message': "Body too large"}, False)
+                    break
+                raw_body = await reader.readexactly(length) if length else b''
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+                start = time.perf_counter()
+                label, status, payload = await self.dispatch(method.upper(), target, raw_body, headers)
+                self.stats.record(label, status, time.perf_counter() - start)
+
+                self._write(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _write(self, writer, status, payload, keep_alive):
+        """Write a JSON response"""
+        body = to_json(payload)
+        challenge = 'WWW-Authenticate: Bearer realm="booking service"\r\n' if status == HTTPStatus.UNAUTHORIZED else ''
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{challenge}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"\r\n".encode('latin-1') + body
+        )
+
+    async def serve(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        """Run the server until cancelled"""
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Booking service listening on http://{host}:{port} ({self.services.workers} workers)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.services.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the headless booking service")
+    parser.add_argument('--host', default=SERVICE_HOST, help=f"bind address (default {SERVICE_HOST})")
+    parser.add_argument('--port', type=int, default=SERVICE_PORT, help=f"port (default {SERVICE_PORT})")
+    parser.add_argument('--workers', type=int, default=ASYNC_WORKERS,
+                        help=f"worker threads / database connections (default {ASYNC_WORKERS})")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(BookingService(workers=args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Booking service stopped")
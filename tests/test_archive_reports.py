@@ -0,0 +1,76 @@
+"""
+Report totals must agree whether bookings are in the hot or archive tables,
+with and without the daily rollup.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from Db.backends import SQLiteBackend
+from Db.DatabaseCRUD import DatabaseCRUD
+from Db.archiver import BookingArchiver
+from Db.rollup import RollupJob
+from Db.seed import Seeder
+from Controllers.BookingController import BookingController
+from Controllers.PaymentController import PaymentController
+from Models.BookingFrame import HAS_NUMPY
+from config import BOOKING_STATUS_COMPLETED, PAYMENT_COMPLETED
+
+BOOKINGS = 2000
+
+
+class ArchivedReportTotalsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.db = DatabaseCRUD(backend=SQLiteBackend(os.path.join(cls.directory, 'reports.db')))
+        if not Seeder(cls.db, workers=1).run(passengers=50, drivers=10, bookings=BOOKINGS, days=120):
+            raise RuntimeError("Seeding the test database failed")
+        cls.archived = BookingArchiver(cls.db).run(older_than_days=30)
+        cls.bookings = BookingController(db=cls.db)
+        cls.payments = PaymentController(db=cls.db)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.disconnect()
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def assert_totals_agree(self):
+        summary = self.bookings.get_booking_status_summary()
+        completed_fare = summary[BOOKING_STATUS_COMPLETED]['fare']
+        self.assertEqual(sum(totals['count'] for totals in summary.values()), BOOKINGS)
+
+        self.assertAlmostEqual(self.bookings.get_total_revenue(), completed_fare, places=2)
+        # Not every completed booking has a completed payment, so count those directly
+        paid = self.db.fetch_one("""
+            SELECT (SELECT COALESCE(SUM(Amount), 0) FROM Payments WHERE Payment_Status = %s)
+                 + (SELECT COALESCE(SUM(Amount), 0) FROM Payments_Archive WHERE Payment_Status = %s) as total
+        """, (PAYMENT_COMPLETED, PAYMENT_COMPLETED))['total']
+        self.assertAlmostEqual(sum(self.payments.get_revenue_by_method().values()), float(paid), places=2)
+
+        for bucket in ('Day', 'Month'):
+            series = self.bookings.get_booking_timeseries(bucket)
+            self.assertEqual(sum(point['trips'] for point in series), BOOKINGS, bucket)
+            self.assertAlmostEqual(sum(point['revenue'] for point in series), completed_fare, places=2)
+
+        if HAS_NUMPY:
+            frame = self.bookings.get_booking_frame()
+            self.assertEqual(len(frame), BOOKINGS)
+            self.assertAlmostEqual(frame.sum_by('status', 'fare')[BOOKING_STATUS_COMPLETED],
+                                   completed_fare, places=2)
+
+    def test_totals_agree_without_rollup(self):
+        self.assertGreater(self.archived, 0)
+        self.assert_totals_agree()
+
+    def test_totals_agree_with_rollup(self):
+        self.assertTrue(RollupJob(self.db).run(full=True))
+        try:
+            self.assert_totals_agree()
+        finally:
+            self.db.execute_query("DELETE FROM Rollup_Watermark")
+
+
+if __name__ == "__main__":
+    unittest.main()
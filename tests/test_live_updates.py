@@ -0,0 +1,76 @@
+"""
+Events published on worker threads reach dashboard handlers on the Tk
+thread, through the dispatcher queue rather than root.after.
+"""
+import threading
+import unittest
+from Controllers.EventBus import BookingCreated, event_bus
+from UI.live_updates import LiveUpdatesMixin
+
+
+class FakeRoot:
+    """Stands in for the Tk window; after() only records, run_pending() fires"""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+        self.callers = []
+
+    def after(self, delay, callback, *args):
+        self.callers.append(threading.current_thread())
+        self.next_id += 1
+        self.pending[self.next_id] = (callback, args)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+
+
+class Screen(LiveUpdatesMixin):
+
+    def __init__(self):
+        super().__init__()
+        self.root = FakeRoot()
+        self.received = []
+
+    def on_created(self, event):
+        self.received.append((event.booking_id, threading.current_thread()))
+
+
+class LiveUpdatesThreadingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = Screen()
+        self.screen.subscribe(BookingCreated, self.screen.on_created)
+
+    def tearDown(self):
+        self.screen.stop_live_updates()
+
+    def publish_on_worker(self, booking_id):
+        worker = threading.Thread(target=event_bus.publish, args=(BookingCreated(booking_id, 1),))
+        worker.start()
+        worker.join()
+
+    def test_worker_events_run_on_tk_thread(self):
+        self.publish_on_worker(7)
+        self.assertEqual(self.screen.received, [])
+
+        self.screen.root.run_pending()
+        self.assertEqual(self.screen.received, [(7, threading.main_thread())])
+        self.assertTrue(all(caller is threading.main_thread() for caller in self.screen.root.callers))
+
+    def test_cleared_screen_drops_queued_events(self):
+        self.publish_on_worker(8)
+        self.screen.unsubscribe_all()
+        self.screen.root.run_pending()
+        self.assertEqual(self.screen.received, [])
+        self.assertEqual(self.screen.root.pending, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
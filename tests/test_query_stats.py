@@ -0,0 +1,52 @@
+"""
+Streamed queries (BaseDB.iter_query) are recorded in query_stats like any
+other statement.
+"""
+import unittest
+from Db.backends import SQLiteBackend
+from Db.base_db import BaseDB
+from Db.query_stats import query_stats
+
+
+class StreamedQueryStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = BaseDB(backend=SQLiteBackend(':memory:'))
+        self.db.execute_query("CREATE TABLE Streamed (Value INT)")
+        self.db.execute_many("INSERT INTO Streamed (Value) VALUES (%s)", [(i,) for i in range(250)])
+        self.was_enabled = query_stats.enabled
+        query_stats.enabled = True
+        query_stats.reset()
+
+    def tearDown(self):
+        query_stats.enabled = self.was_enabled
+        query_stats.reset()
+        self.db.execute_query("DROP TABLE Streamed")
+        self.db.disconnect()
+
+    def streamed(self):
+        return [stats for stats in query_stats.top(limit=50) if 'FROM Streamed' in stats['sql']]
+
+    def test_exhausted_stream_is_recorded_once(self):
+        rows = 0
+        for _, batch in self.db.iter_query("SELECT Value FROM Streamed", batch_size=100):
+            rows += len(batch)
+        self.assertEqual(rows, 250)
+
+        stats, = self.streamed()
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['rows'], 250)
+        self.assertIn('test_query_stats.test_exhausted_stream_is_recorded_once', stats['callers'])
+
+    def test_closed_stream_is_recorded(self):
+        stream = self.db.iter_query("SELECT Value FROM Streamed", batch_size=100)
+        next(stream)
+        stream.close()
+
+        stats, = self.streamed()
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['rows'], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
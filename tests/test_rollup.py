@@ -0,0 +1,67 @@
+"""
+An incremental rollup must pick up bookings changed on days before the
+watermark, however old those days are.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, timedelta
+from Db.backends import SQLiteBackend
+from Db.DatabaseCRUD import DatabaseCRUD
+from Db.rollup import RollupJob
+from Db.seed import Seeder
+from config import BOOKING_STATUS_CANCELLED, BOOKING_STATUS_COMPLETED
+
+FACTS_BY_STATUS = """
+    SELECT Status, SUM(Trips) as trips FROM Daily_Booking_Facts
+    WHERE Day = %s GROUP BY Status
+"""
+
+BOOKINGS_BY_STATUS = """
+    SELECT Status, COUNT(*) as trips FROM Bookings
+    WHERE DATE(Booking_Date) = %s GROUP BY Status
+"""
+
+
+class IncrementalRollupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = DatabaseCRUD(backend=SQLiteBackend(os.path.join(self.directory, 'rollup.db')))
+        if not Seeder(self.db, workers=1).run(passengers=20, drivers=5, bookings=500, days=60):
+            raise RuntimeError("Seeding the test database failed")
+
+    def tearDown(self):
+        self.db.disconnect()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def counts(self, query, day):
+        return {row['Status']: int(row['trips']) for row in self.db.fetch_all(query, (day,))}
+
+    def test_old_status_change_is_rerolled(self):
+        self.assertTrue(RollupJob(self.db).run(full=True))
+        booking = self.db.fetch_one("""
+            SELECT Booking_ID, DATE(Booking_Date) as Day FROM Bookings
+            WHERE Status = %s AND Booking_Date < %s ORDER BY Booking_Date LIMIT 1
+        """, (BOOKING_STATUS_COMPLETED, date.today() - timedelta(days=30)))
+        self.assertIsNotNone(booking)
+        day = date.fromisoformat(str(booking['Day']))
+
+        self.db.execute_query("UPDATE Bookings SET Status = %s WHERE Booking_ID = %s",
+                              (BOOKING_STATUS_CANCELLED, booking['Booking_ID']))
+        self.assertNotEqual(self.counts(FACTS_BY_STATUS, day), self.counts(BOOKINGS_BY_STATUS, day))
+
+        self.assertTrue(RollupJob(self.db).run())
+        self.assertEqual(self.counts(FACTS_BY_STATUS, day), self.counts(BOOKINGS_BY_STATUS, day))
+
+    def test_unchanged_run_keeps_facts(self):
+        self.assertTrue(RollupJob(self.db).run(full=True))
+        before = self.db.fetch_one("SELECT COUNT(*) as facts, SUM(Trips) as trips FROM Daily_Booking_Facts")
+        self.assertTrue(RollupJob(self.db).run())
+        after = self.db.fetch_one("SELECT COUNT(*) as facts, SUM(Trips) as trips FROM Daily_Booking_Facts")
+        self.assertEqual(before, after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Screen timings charge streamed queries to the database, not to widgets.
+"""
+import time
+import unittest
+from Db.backends import SQLiteBackend
+from Db.base_db import BaseDB
+from Db.query_stats import query_stats
+from UI.screen_timing import screen_timings, timed_screen
+
+
+class FakeRoot:
+    """Stands in for the Tk window; timed_screen only asks it to redraw"""
+
+    def update_idletasks(self):
+        pass
+
+
+class StreamingScreen:
+
+    def __init__(self, db):
+        self.root = FakeRoot()
+        self.db = db
+
+    @timed_screen
+    def show_streamed_report(self):
+        for _, rows in self.db.iter_query("SELECT Value FROM Report", batch_size=50):
+            for _ in rows:
+                pass
+            # Stand-in for building the rows' widgets
+            time.sleep(0.005)
+
+
+class StreamedScreenTimingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = BaseDB(backend=SQLiteBackend(':memory:'))
+        self.db.execute_query("CREATE TABLE Report (Value INT)")
+        self.db.execute_many("INSERT INTO Report (Value) VALUES (%s)", [(i,) for i in range(200)])
+        self.was_enabled = query_stats.enabled
+        query_stats.enabled = True
+        screen_timings.reset()
+
+    def tearDown(self):
+        query_stats.enabled = self.was_enabled
+        screen_timings.reset()
+        self.db.execute_query("DROP TABLE Report")
+        self.db.disconnect()
+
+    def test_streamed_screen_reports_database_time(self):
+        StreamingScreen(self.db).show_streamed_report()
+
+        entry = screen_timings.recent[-1]
+        self.assertEqual(entry['screen'], 'StreamingScreen.show_streamed_report')
+        self.assertEqual(entry['db_calls'], 1)
+        self.assertGreater(entry['db_ms'], 0.0)
+        # The sleeps between batches are widget work, not database time
+        self.assertLess(entry['db_ms'], entry['widget_ms'])
+
+
+if __name__ == "__main__":
+    unittest.main()
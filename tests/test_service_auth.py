@@ -0,0 +1,91 @@
+"""
+Every service endpoint except POST /sessions needs a session token, and
+/stats an admin one.
+"""
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from http import HTTPStatus
+from unittest import mock
+import Db.backends
+from Db.backends import SQLiteBackend
+from Db.DatabaseCRUD import DatabaseCRUD
+from Db.seed import SEED_PASSWORD, Seeder
+from service import BookingService
+from config import DEFAULT_ADMIN
+
+
+class ServiceAuthTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'service.db')
+        db = DatabaseCRUD(backend=SQLiteBackend(cls.path))
+        db.setup_database()
+        if not Seeder(db, workers=1).run(passengers=2, drivers=1, bookings=5, days=5):
+            raise RuntimeError("Seeding the test database failed")
+        cls.passenger = db.fetch_one("SELECT Passenger_ID, Username FROM Passengers p "
+                                     "JOIN Login l ON l.User_ID = p.User_ID LIMIT 1")
+        db.disconnect()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def setUp(self):
+        # Service workers open their own connections to the test database
+        patcher = mock.patch.multiple(Db.backends, DB_BACKEND='sqlite', SQLITE_PATH=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = BookingService(workers=2)
+        self.addCleanup(lambda: asyncio.run(self.service.services.close()))
+
+    def request(self, method, path, body=None, token=None):
+        headers = {'authorization': f"Bearer {token}"} if token else {}
+        raw_body = json.dumps(body).encode('utf-8') if body is not None else b''
+        _, status, payload = asyncio.run(self.service.dispatch(method, path, raw_body, headers))
+        return status, payload
+
+    def login(self, username, password):
+        status, payload = self.request('POST', '/sessions', {'username': username, 'password': password})
+        self.assertEqual(status, HTTPStatus.CREATED, payload)
+        return payload['token']
+
+    def test_endpoints_need_a_token(self):
+        status, _ = self.request('POST', '/bookings', {'passenger_id': 1, 'pickup_location': 'A',
+                                                       'destination': 'B'})
+        self.assertEqual(status, HTTPStatus.UNAUTHORIZED)
+        self.assertEqual(self.request('POST', '/payments/1/complete')[0], HTTPStatus.UNAUTHORIZED)
+        self.assertEqual(self.request('GET', '/stats', token='not-a-token')[0], HTTPStatus.UNAUTHORIZED)
+
+    def test_wrong_password_gets_no_token(self):
+        status, payload = self.request('POST', '/sessions', {'username': DEFAULT_ADMIN['username'],
+                                                             'password': 'wrong'})
+        self.assertEqual(status, HTTPStatus.UNAUTHORIZED)
+        self.assertNotIn('token', payload)
+
+    def test_token_is_reused_without_reverifying(self):
+        token = self.login(self.passenger['Username'], SEED_PASSWORD)
+        with mock.patch('Controllers.UserController.passwords.verify_password') as verify:
+            for _ in range(3):
+                status, payload = self.request('POST', '/bookings', {
+                    'passenger_id': self.passenger['Passenger_ID'],
+                    'pickup_location': 'Station', 'destination': 'Airport'
+                }, token=token)
+                self.assertEqual(status, HTTPStatus.CREATED, payload)
+        verify.assert_not_called()
+
+    def test_stats_need_an_admin(self):
+        passenger_token = self.login(self.passenger['Username'], SEED_PASSWORD)
+        self.assertEqual(self.request('GET', '/stats', token=passenger_token)[0], HTTPStatus.FORBIDDEN)
+
+        admin_token = self.login(DEFAULT_ADMIN['username'], DEFAULT_ADMIN['password'])
+        self.assertEqual(self.request('GET', '/stats', token=admin_token)[0], HTTPStatus.OK)
+
+
+if __name__ == "__main__":
+    unittest.main()